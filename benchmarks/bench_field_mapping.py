@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""소스별 필드 매핑 마이크로 벤치마크: 행마다 키를 찾는 기존 방식 vs FieldMap + 날짜 캐시.
+
+실행: python benchmarks/bench_field_mapping.py [행 수]
+공공데이터 API, LH JSON API(UPPER_SNAKE 표기), HTML 행을 각각 행 수만큼 만들어 정규화 시간을 잰다.
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lh_monitor import LHCrawler, RENTAL_TYPES, normalize_date  # noqa: E402
+
+DETAIL_URL = LHCrawler.DETAIL_URL
+
+
+def old_normalize_date(s: str) -> str:
+    """변경 전 normalize_date: 호출마다 re 모듈 캐시에서 패턴을 찾는다."""
+    if not s:
+        return ""
+    cleaned = re.sub(r"[^0-9-]", "", s)
+    if re.fullmatch(r"\d{8}", cleaned):
+        return f"{cleaned[:4]}-{cleaned[4:6]}-{cleaned[6:8]}"
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", cleaned):
+        return cleaned
+    return cleaned
+
+
+def old_api(item_list):
+    results = []
+    for it in item_list:
+        dtl_url = it.get("dtlUrl", "")
+        pan_id = str(it.get("sn", ""))
+        if not dtl_url and pan_id:
+            dtl_url = DETAIL_URL.format(ccr="03", pan_id=pan_id, ais="", upp="")
+        results.append({
+            "id": pan_id,
+            "title": it.get("sj", ""),
+            "rental_type": it.get("typeCdNm", ""),
+            "status": "",
+            "reg_date": old_normalize_date(it.get("crtDt", "")),
+            "rcpt_begin": old_normalize_date(it.get("rceptBgnDt", "")),
+            "rcpt_end": old_normalize_date(it.get("rceptEndDt", "")),
+            "url": dtl_url,
+        })
+    return results
+
+
+def old_json(items):
+    results = []
+    for it in items:
+        pan_id = it.get("panId") or it.get("PAN_ID", "")
+        type_cd = it.get("aisTpCd") or it.get("AIS_TP_CD", "")
+        ccr = it.get("ccrCnntSysDsCd") or it.get("CCR_CNNT_SYS_DS_CD", "03")
+        upp = it.get("uppAisTpCd") or it.get("UPP_AIS_TP_CD", "")
+        results.append({
+            "id": str(pan_id),
+            "title": it.get("panNm") or it.get("PAN_NM", ""),
+            "rental_type": RENTAL_TYPES.get(type_cd, type_cd),
+            "status": it.get("panSttNm") or it.get("PAN_STT_NM", ""),
+            "reg_date": old_normalize_date(it.get("dttmRgst") or it.get("DTTM_RGST", "")),
+            "rcpt_begin": old_normalize_date(it.get("clsgBgnDt") or it.get("CLSG_BGN_DT", "")),
+            "rcpt_end": old_normalize_date(it.get("clsgEndDt") or it.get("CLSG_END_DT", "")),
+            "url": DETAIL_URL.format(ccr=ccr, pan_id=pan_id, ais=type_cd, upp=upp),
+        })
+    return results
+
+
+def old_html(rows):
+    results = []
+    for cells, link, title in rows:
+        ann_id = LHCrawler._extract_id(link, title)
+        ccr = link.get("data-id2", "03")
+        upp = link.get("data-id3", "")
+        ais = link.get("data-id4", "")
+
+        def col_text(idx):
+            return cells[idx] if idx < len(cells) else ""
+
+        results.append({
+            "id": ann_id,
+            "title": title,
+            "rental_type": col_text(1),
+            "reg_date": old_normalize_date(col_text(5)),
+            "rcpt_begin": old_normalize_date(col_text(5)),
+            "rcpt_end": old_normalize_date(col_text(6)),
+            "status": col_text(7),
+            "url": DETAIL_URL.format(ccr=ccr, pan_id=ann_id, ais=ais, upp=upp),
+        })
+    return results
+
+
+def make_rows(n: int):
+    # 실제 목록처럼 날짜는 몇십 가지 값이 반복된다
+    day = [f"202602{d:02d}" for d in range(1, 29)]
+    api = [{"sn": 10000 + i, "sj": f"부산 {i}단지 국민임대", "typeCdNm": "국민임대", "crtDt": day[i % 28],
+            "rceptBgnDt": day[(i + 3) % 28], "rceptEndDt": day[(i + 9) % 28], "dtlUrl": ""} for i in range(n)]
+    upper = [{"PAN_ID": str(20000 + i), "AIS_TP_CD": "01", "CCR_CNNT_SYS_DS_CD": "03", "UPP_AIS_TP_CD": "05",
+              "PAN_NM": f"부산 {i}단지 행복주택", "PAN_STT_NM": "접수중", "DTTM_RGST": f"{day[i % 28][:4]}.02.19",
+              "CLSG_BGN_DT": f"2026/03/{i % 28 + 1:02d}", "CLSG_END_DT": "2026-03-31"} for i in range(n)]
+    html = [(["1", "국민임대", "제목", "부산", "", f"2026.02.{i % 28 + 1:02d}", "2026.03.15", "접수중", "100"],
+             {"data-id1": str(30000 + i), "data-id2": "03", "data-id3": "13", "data-id4": "06"},
+             f"부산 {i}단지") for i in range(n)]
+    return api, upper, html
+
+
+def bench(fn, rows, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        normalize_date.cache_clear()
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    api, upper, html = make_rows(n)
+    crawler = LHCrawler()
+
+    def new_html(rows):
+        return [crawler._html_row(cells, link, title) for cells, link, title in rows]
+
+    assert old_api(api) == crawler._parse_api_items(api)
+    assert old_json(upper) == crawler._parse_json_items(upper)
+    assert old_html(html) == new_html(html)
+
+    print(f"행 수: {n:,} (소스별, 5회 중 최솟값)")
+    for name, old, new, rows in (
+        ("공공데이터 API", old_api, crawler._parse_api_items, api),
+        ("LH JSON API", old_json, crawler._parse_json_items, upper),
+        ("HTML 행", old_html, new_html, html),
+    ):
+        before, after = bench(old, rows), bench(new, rows)
+        print(f"{name:<12} before {before:8.2f} ms  after {after:8.2f} ms  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
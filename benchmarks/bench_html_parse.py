@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""HTML 목록 파싱 벤치마크: 전체 문서 파싱 vs <tbody> 한정 파싱.
+
+실행: python benchmarks/bench_html_parse.py [반복 횟수]
+LH 목록 페이지와 비슷한 크기(헤더·메뉴·스크립트 + 30행 표)의 합성 문서로 페이지당 파싱 시간을 잰다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import lh_monitor  # noqa: E402
+from lh_monitor import LHCrawler  # noqa: E402
+
+ROW = """
+<tr>
+  <td>{n}</td><td>국민임대</td>
+  <td class="bbs_tit"><a href="#" class="wrtancInfoBtn" data-id1="2026{n:04d}" data-id2="03"
+      data-id3="13" data-id4="06">부산 테스트 {n}단지 국민임대주택 예비입주자 모집</a></td>
+  <td>부산광역시</td><td><a href="#">첨부</a></td>
+  <td>2026.02.19</td><td>2026.03.15</td><td>접수중</td><td>1,234</td>
+</tr>"""
+
+
+def build_page(rows: int = 30) -> str:
+    """LH 목록 페이지를 흉내 낸 문서. 본문 표 바깥의 마크업이 대부분을 차지한다."""
+    menu = "".join(
+        f'<li><a href="/menu/{i}">메뉴 {i}</a><ul>'
+        + "".join(f'<li><a href="/menu/{i}/{j}">하위 메뉴 {j}</a></li>' for j in range(12))
+        + "</ul></li>"
+        for i in range(40)
+    )
+    script = "<script>" + "var cfg = {a: 1, b: [1, 2, 3]};\n" * 400 + "</script>"
+    footer = "<footer>" + "<p>한국토지주택공사 고객센터 1600-1004</p>" * 100 + "</footer>"
+    table = (
+        '<table class="tbl_list"><thead><tr><th>번호</th><th>유형</th><th>공고명</th></tr></thead><tbody>'
+        + "".join(ROW.format(n=n) for n in range(rows))
+        + "</tbody></table>"
+    )
+    return f"<html><head>{script}</head><body><nav><ul>{menu}</ul></nav>{table}{footer}</body></html>"
+
+
+def full_parse(html: str) -> list:
+    """변경 전 방식: html.parser로 문서 전체를 파싱한 뒤 셀렉터를 차례로 시도한다."""
+    soup = BeautifulSoup(html, "html.parser")
+    return (
+        soup.select("table tbody tr")
+        or soup.select(".board-list tbody tr")
+        or soup.select(".tbl_list tbody tr")
+    )
+
+
+def bench(fn, html: str, repeat: int) -> float:
+    fn(html)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rows = fn(html)
+    elapsed = time.perf_counter() - started
+    assert len(rows) == 30, len(rows)
+    return elapsed / repeat * 1000
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    html = build_page()
+    crawler = LHCrawler()
+    before = bench(full_parse, html, repeat)
+    after = bench(crawler._listing_rows, html, repeat)
+    print(f"문서 크기: {len(html.encode('utf-8')) / 1024:.0f} KiB, 반복 {repeat}회, 파서: {lh_monitor.HTML_PARSER}")
+    print(f"전체 파싱 (before): {before:8.2f} ms/page")
+    print(f"tbody 파싱 (after): {after:8.2f} ms/page  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
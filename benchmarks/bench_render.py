@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""메시지 렌더링 벤치마크: 수신처마다 메시지·본문을 새로 만드는 방식 vs MessageRenderer 캐시.
+
+실행: python benchmarks/bench_render.py [수신처 수]
+공고 20건을 텔레그램·디스코드 수신처 각각에 보낼 때 요청 본문을 만드는 데 드는 시간만 잰다 (발송 제외).
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lh_monitor import Announcement, DiscordNotifier, MessageRenderer, json_bytes  # noqa: E402
+
+
+def old_telegram(ann: Announcement) -> str:
+    """변경 전 TelegramNotifier._format."""
+    return (
+        f"🏠 <b>LH 임대주택 새 공고</b>\n\n"
+        f"📋 <b>{ann.title}</b>\n"
+        f"🏷 유형: {ann.rental_type}\n"
+        f"🟢 상태: {ann.status}\n"
+        f"📅 공고일: {ann.reg_date}\n"
+        f"📆 접수: {ann.rcpt_begin} ~ {ann.rcpt_end}\n\n"
+        f"🔗 <a href=\"{ann.url}\">공고 상세보기</a>"
+    )
+
+
+def old_embed(ann: Announcement) -> dict:
+    """변경 전 DiscordNotifier._build_embed."""
+    return {
+        "title": f"🏠 {ann.title}",
+        "url": ann.url,
+        "color": DiscordNotifier._get_color(ann.status),
+        "fields": [
+            {"name": "🏷 임대유형", "value": ann.rental_type or "-", "inline": True},
+            {"name": "🟢 상태", "value": ann.status or "-", "inline": True},
+            {"name": "📅 공고일", "value": ann.reg_date or "-", "inline": True},
+            {"name": "📆 접수기간", "value": f"{ann.rcpt_begin} ~ {ann.rcpt_end}", "inline": False},
+        ],
+        "footer": {"text": "LH 임대주택 공고 모니터링"},
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def before(anns, destinations: int) -> int:
+    size = 0
+    for d in range(destinations):
+        for ann in anns:
+            size += len(json.dumps({"chat_id": str(d), "text": old_telegram(ann), "parse_mode": "HTML"}))
+        for i in range(0, len(anns), 10):
+            size += len(json.dumps({"embeds": [old_embed(a) for a in anns[i:i + 10]]}))
+    return size
+
+
+def after(anns, destinations: int, renderer: MessageRenderer) -> int:
+    size = 0
+    for d in range(destinations):
+        chat_id = json_bytes(str(d))
+        for ann in anns:
+            size += len(b'{"chat_id":%s,"text":%s,"parse_mode":"HTML"}' % (chat_id, renderer.telegram_json(ann)))
+        for i in range(0, len(anns), 10):
+            size += len(b'{"embeds":[' + b",".join(renderer.embed_json(a) for a in anns[i:i + 10]) + b"]}")
+    return size
+
+
+def main():
+    destinations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    anns = [
+        Announcement(id=str(i), title=f"부산 {i}단지 행복주택 입주자 모집공고", rental_type="행복주택", status="접수중",
+                     reg_date="2026-02-19", rcpt_begin="2026-03-01", rcpt_end="2026-03-15",
+                     url=f"https://apply.lh.or.kr/detail/{i}")
+        for i in range(20)
+    ]
+    started = time.perf_counter()
+    before_bytes = before(anns, destinations)
+    before_ms = (time.perf_counter() - started) * 1000
+    renderer = MessageRenderer()
+    started = time.perf_counter()
+    after_bytes = after(anns, destinations, renderer)
+    after_ms = (time.perf_counter() - started) * 1000
+
+    print(f"수신처 {destinations}곳 x 2채널, 공고 {len(anns)}건 ({renderer.stats()})")
+    print(f"매번 렌더링 (before): {before_ms:8.2f} ms, 본문 {before_bytes / 1024:,.0f} KiB (\\u 이스케이프)")
+    print(f"렌더러 캐시 (after):  {after_ms:8.2f} ms, 본문 {after_bytes / 1024:,.0f} KiB  ({before_ms / after_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
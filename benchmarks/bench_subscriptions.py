@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""구독 매칭 벤치마크: 구독마다 조건을 검사하는 방식 vs SubscriptionMatcher.
+
+실행: python benchmarks/bench_subscriptions.py [구독 수]
+지역·키워드·유형·상태 조건을 섞은 구독자들에게 공고 200건을 나눠 주는 시간을 잰다.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lh_monitor import Announcement, RENTAL_TYPES, Subscription, SubscriptionMatcher  # noqa: E402
+
+REGIONS = ["부산", "서울", "경기", "인천", "대구", "대전", "광주", "울산", "세종", "강원", "충북", "충남",
+           "전북", "전남", "경북", "경남", "제주", "김해", "양산", "창원", "수원", "성남", "고양", "용인"]
+KEYWORDS = ["행복주택", "국민임대", "영구임대", "매입임대", "전세임대", "신혼", "청년", "고령자", "예비입주자"]
+TYPES = list(RENTAL_TYPES.values())
+STATUSES = ["공고중", "접수중", "접수마감"]
+
+
+def naive(subscriptions, announcements):
+    """구독마다 조건을 차례로 검사한다."""
+    routed = {}
+    for ann in announcements:
+        title = ann.title.casefold()
+        for sub in subscriptions:
+            if sub.keywords and not any(k.casefold() in title for k in sub.keywords):
+                continue
+            if sub.regions and not any(r.casefold() in title for r in sub.regions):
+                continue
+            if sub.rental_types and ann.rental_type not in sub.rental_types:
+                continue
+            if sub.statuses and ann.status not in sub.statuses:
+                continue
+            routed.setdefault(sub.name, []).append(ann)
+    return routed
+
+
+def make(n: int, rng: random.Random):
+    subs = [
+        Subscription(
+            f"user{i}",
+            keywords=rng.sample(KEYWORDS, rng.choice((0, 0, 1, 2))),
+            regions=rng.sample(REGIONS, rng.randint(1, 3)),
+            rental_types=rng.sample(TYPES, rng.choice((0, 0, 1))),
+            statuses=rng.sample(STATUSES, rng.choice((0, 1))),
+        )
+        for i in range(n)
+    ]
+    anns = [
+        Announcement(id=str(i), title=f"{rng.choice(REGIONS)} {rng.choice(KEYWORDS)} {i}단지 입주자 모집공고",
+                     rental_type=rng.choice(TYPES), status=rng.choice(STATUSES))
+        for i in range(200)
+    ]
+    return subs, anns
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    subs, anns = make(n, random.Random(0))
+    started = time.perf_counter()
+    matcher = SubscriptionMatcher(subs)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    expected = naive(subs, anns)
+    before = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    routed = matcher.fan_out(anns)
+    after = (time.perf_counter() - started) * 1000
+    assert routed == expected
+
+    print(f"구독 {n:,}개, 공고 {len(anns)}건, 전달 {sum(map(len, routed.values())):,}건 (컴파일 {compile_ms:.1f} ms)")
+    print(f"구독별 검사 (before): {before:8.2f} ms")
+    print(f"매처 (after):        {after:8.2f} ms  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
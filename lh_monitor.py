@@ -3,15 +3,37 @@
 
 import os
 import sys
+import asyncio
+import codecs
 import json
+import tempfile
 import time
 import logging
 import hashlib
+import heapq
+import itertools
+import math
+import mmap
+import random
 import re
-from datetime import datetime, date
+import signal
+import sqlite3
+import string
+import struct
+import threading
+from collections import deque
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from html.parser import HTMLParser
+from operator import attrgetter, itemgetter
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -45,68 +67,848 @@ RENTAL_TYPES = {
     "09": "매입임대",
     "10": "기타",
 }
+RENTAL_TYPES = {code: sys.intern(name) for code, name in RENTAL_TYPES.items()}
+
+# lxml이 설치되어 있으면 목록 표를 더 빠른 lxml 파서로 읽는다
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # ── 유틸리티 ────────────────────────────────────────────────
 
 
+_DATE_JUNK = re.compile(r"[^0-9-]")
+_DATE_DIGITS = re.compile(r"\d{8}")
+_DATE_ISO = re.compile(r"\d{4}-\d{2}-\d{2}")
+_HREF_PAN_ID = re.compile(r"panId=([^&]+)")
+_HREF_QUOTED_NUM = re.compile(r"['\"](\d+)['\"]")
+
+
+@lru_cache(maxsize=4096)
 def normalize_date(s: str) -> str:
-    """날짜 문자열을 YYYY-MM-DD 형식으로 정규화한다."""
+    """날짜 문자열을 YYYY-MM-DD 형식으로 정규화한다.
+
+    한 응답 안에서 같은 날짜가 반복되므로 결과를 캐시한다.
+    """
     if not s:
         return ""
     # 숫자와 하이픈만 남긴다 (슬래시, 점 등 제거)
-    cleaned = re.sub(r"[^0-9-]", "", s)
+    cleaned = _DATE_JUNK.sub("", s)
     # 8자리 숫자 → YYYY-MM-DD
-    if re.fullmatch(r"\d{8}", cleaned):
+    if _DATE_DIGITS.fullmatch(cleaned):
         return f"{cleaned[:4]}-{cleaned[4:6]}-{cleaned[6:8]}"
     # 이미 YYYY-MM-DD 형식
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", cleaned):
+    if _DATE_ISO.fullmatch(cleaned):
         return cleaned
     return cleaned
 
 
+class FieldMap:
+    """소스 원본 행에서 필드 값을 꺼내는 선언적 매핑.
+
+    variants는 같은 필드들의 키 표기법 후보(camelCase, UPPER_SNAKE 등)다. 응답마다
+    resolve()로 표기법을 한 번 고르면, 행마다 후보 키를 번갈아 찾지 않고 미리 만든
+    (키, 기본값) 튜플로 값을 꺼낸다. 값이 비어 있으면 기본값을 쓴다.
+    """
+
+    def __init__(self, fields: tuple[str, ...], *variants: tuple[str, ...], defaults: dict | None = None):
+        defaults = defaults or {}
+        self.fields = fields
+        self.variants = variants
+        self.defaults = tuple(defaults.get(f, "") for f in fields)
+
+    def resolve(self, sample: dict):
+        """sample 행의 키와 가장 많이 겹치는 표기법으로 getter(row) → 값 리스트를 만든다."""
+        keys = max(self.variants, key=lambda v: sum(k in sample for k in v))
+        pairs = tuple(zip(keys, self.defaults))
+
+        def get(row: dict) -> list:
+            return [row.get(k) or d for k, d in pairs]
+        return get
+
+
+def _now_iso() -> str:
+    """초 단위까지의 현재 시각 ISO 문자열 (문자열 비교로 시간 순서를 비교할 수 있다)."""
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _json_default(obj):
+    """json.dumps가 직접 다루지 못하는 값(Announcement)을 dict로 바꾼다."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+# ── Announcement ────────────────────────────────────────────
+
+
+class Announcement(Mapping):
+    """공고 한 건. 8개 문자열 필드를 __slots__에 담는다.
+
+    유형·상태·날짜처럼 여러 공고에 반복되는 값은 intern하여 같은 문자열 객체를 공유한다.
+    기존 dict 기반 코드와 호환되도록 읽기 전용 매핑(ann["id"], ann.get, keys, dict와의 ==)으로도 쓸 수 있다.
+    """
+
+    FIELDS = ("id", "title", "rental_type", "status", "reg_date", "rcpt_begin", "rcpt_end", "url")
+    __slots__ = FIELDS
+    _values = attrgetter(*FIELDS)
+
+    def __init__(self, id="", title="", rental_type="", status="", reg_date="",
+                 rcpt_begin="", rcpt_end="", url=""):
+        intern = sys.intern
+        self.id = id
+        self.title = title
+        self.rental_type = intern(str(rental_type))
+        self.status = intern(str(status))
+        self.reg_date = intern(reg_date)
+        self.rcpt_begin = intern(rcpt_begin)
+        self.rcpt_end = intern(rcpt_end)
+        self.url = url
+
+    @classmethod
+    def of(cls, ann) -> "Announcement":
+        """dict(저장 파일, 테스트 등)나 Announcement를 Announcement로 맞춘다."""
+        if isinstance(ann, cls):
+            return ann
+        return cls(*(str(ann.get(f) or "") for f in cls.FIELDS))
+
+    def to_dict(self) -> dict:
+        return dict(zip(self.FIELDS, self._values(self)))
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __repr__(self):
+        return f"Announcement({self.id!r}, {self.title!r})"
+
+
+# ── 구독 필터 ───────────────────────────────────────────────
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 검색기. 제목을 한 번 훑어 포함된 패턴 번호를 모두 찾는다.
+
+    패턴 수와 상관없이 제목 길이에 비례하는 시간이 든다. 대소문자는 구분하지 않는다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(dict.fromkeys(p.casefold() for p in patterns if p))
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[int, ...]] = [()]
+        for i, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = goto[node][ch] = len(goto)
+                    goto.append({})
+                    out.append(())
+                node = nxt
+            out[node] += (i,)
+
+        # 너비 우선으로 실패 링크를 잇고, 실패 링크 쪽 출력(접미사로 끝나는 패턴)을 합친다
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] += out[fail[nxt]]
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def search(self, text: str) -> set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        node = 0
+        for ch in text.casefold():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class Subscription:
+    """구독자 한 명의 필터 규칙.
+
+    keywords와 regions는 제목에 포함되어야 하는 단어 목록으로, 각 목록에서 하나 이상 맞아야 한다.
+    rental_types와 statuses는 정확히 일치해야 하는 값 목록이다. 비어 있는 규칙은 검사하지 않는다.
+    """
+
+    __slots__ = ("name", "keywords", "regions", "rental_types", "statuses")
+
+    def __init__(self, name: str, keywords: Iterable[str] = (), regions: Iterable[str] = (),
+                 rental_types: Iterable[str] = (), statuses: Iterable[str] = ()):
+        self.name = name
+        self.keywords = tuple(k for k in keywords if k)
+        self.regions = tuple(r for r in regions if r)
+        self.rental_types = frozenset(rental_types)
+        self.statuses = frozenset(statuses)
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Subscription":
+        return cls(d["name"], d.get("keywords", ()), d.get("regions", ()),
+                   d.get("rental_types", ()), d.get("statuses", ()))
+
+    def __repr__(self):
+        return f"Subscription({self.name!r})"
+
+
+def load_subscriptions(path: str) -> list[Subscription]:
+    """구독 설정 파일(JSON 배열)을 읽는다. 항목: name, keywords, regions, rental_types, statuses."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [Subscription.from_dict(d) for d in json.load(f)]
+
+
+class SubscriptionMatcher:
+    """모든 구독을 하나의 매처로 컴파일하여 공고마다 한 번의 검사로 맞는 구독자를 찾는다.
+
+    제목 규칙(keywords, regions)의 단어는 전부 KeywordAutomaton 하나에 넣고, 단어마다 그 단어를 쓰는
+    (구독 번호, 규칙 비트) 목록을 둔다. 제목을 한 번 훑어 모은 비트가 구독의 필수 비트와 같으면 제목 조건을
+    만족한 것이다. 유형·상태는 값별 색인으로 확인한다.
+    """
+
+    _KEYWORDS, _REGIONS = 1, 2
+
+    def __init__(self, subscriptions: Iterable[Subscription]):
+        self.subscriptions = list(subscriptions)
+        owners: dict[str, list[tuple[int, int]]] = {}
+        self._required: list[int] = []
+        self._title_free: list[int] = []
+        self._by_type: dict[str, set[int]] = {}
+        self._any_type: set[int] = set()
+        self._by_status: dict[str, set[int]] = {}
+        self._any_status: set[int] = set()
+        for i, sub in enumerate(self.subscriptions):
+            required = 0
+            for bit, words in ((self._KEYWORDS, sub.keywords), (self._REGIONS, sub.regions)):
+                if words:
+                    required |= bit
+                    for word in dict.fromkeys(w.casefold() for w in words):
+                        owners.setdefault(word, []).append((i, bit))
+            self._required.append(required)
+            if not required:
+                self._title_free.append(i)
+            self._index(i, sub.rental_types, self._by_type, self._any_type)
+            self._index(i, sub.statuses, self._by_status, self._any_status)
+        self._automaton = KeywordAutomaton(owners)
+        self._owners = [tuple(owners[p]) for p in self._automaton.patterns]
+
+    @staticmethod
+    def _index(i: int, values, index: dict, wildcard: set):
+        if not values:
+            wildcard.add(i)
+        for value in values:
+            index.setdefault(value, set()).add(i)
+
+    def match(self, ann: Announcement) -> list[Subscription]:
+        """공고에 맞는 구독을 구독 순서대로 반환한다."""
+        bits: dict[int, int] = {}
+        for p in self._automaton.search(ann.title):
+            for i, bit in self._owners[p]:
+                bits[i] = bits.get(i, 0) | bit
+        required = self._required
+        candidates = [i for i, b in bits.items() if b == required[i]]
+        candidates.extend(self._title_free)
+        types = self._by_type.get(ann.rental_type, ())
+        statuses = self._by_status.get(ann.status, ())
+        any_type, any_status = self._any_type, self._any_status
+        return [
+            self.subscriptions[i] for i in sorted(candidates)
+            if (i in any_type or i in types) and (i in any_status or i in statuses)
+        ]
+
+    def select(self, announcements: Iterable[Announcement]) -> list[Announcement]:
+        """구독 하나 이상에 맞는 공고만 남긴다."""
+        return [a for a in announcements if self.match(a)]
+
+    def fan_out(self, announcements: Iterable[Announcement]) -> dict[str, list[Announcement]]:
+        """구독 이름별로 맞는 공고 목록을 만든다. 맞는 공고가 없는 구독은 빠진다."""
+        routed: dict[str, list[Announcement]] = {}
+        for ann in announcements:
+            for sub in self.match(ann):
+                routed.setdefault(sub.name, []).append(ann)
+        return routed
+
+
+# ── 상태 파일 저장 ──────────────────────────────────────────
+
+
+def atomic_write_json(path: str, data, indent: int | None = 2):
+    """임시 파일에 쓰고 fsync한 뒤 rename하여 파일을 원자적으로 교체한다.
+
+    쓰는 도중 프로세스가 죽어도 원래 파일이나 새 파일 중 하나가 온전히 남는다.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent, default=_json_default)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    # rename 자체도 디스크에 남도록 디렉터리를 fsync (지원하지 않는 플랫폼은 무시)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class JsonStateFile:
+    """JSON 상태 파일의 write-behind 저장기.
+
+    내용이 마지막 기록과 같으면 쓰지 않고, urgent가 아닌 변경은 flush_interval 동안 모았다가
+    한 번에 쓴다. volatile에 든 최상위 키(체크 시각 등)만 바뀐 내용은 변경으로 치지 않고
+    flush(volatile=True)나 다른 변경과 함께 쓴다. 실제 쓰기는 atomic_write_json으로 한다.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 0.0, indent: int | None = 2,
+                 volatile: tuple[str, ...] = ()):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.indent = indent
+        self.volatile = volatile
+        self.pending = None
+        self._pending_volatile = False
+        self._last_payload = None
+        self._last_key = None
+        self._last_write = None
+
+    def _key(self, data) -> str:
+        """volatile 키를 뺀 비교용 직렬화."""
+        if self.volatile and isinstance(data, dict):
+            data = {k: v for k, v in data.items() if k not in self.volatile}
+        return json.dumps(data, ensure_ascii=False, sort_keys=True, default=_json_default)
+
+    def write(self, data, urgent: bool = True) -> bool:
+        """data를 저장한다. 실제로 파일을 썼으면 True.
+
+        urgent가 아니고 마지막 기록 후 flush_interval이 지나지 않았으면 보류했다가
+        다음 write()나 flush()에서 쓴다. volatile 키만 바뀌었으면 flush(volatile=True)까지 보류한다.
+        """
+        now = time.monotonic()
+        if self._key(data) == self._last_key:
+            self.pending, self._pending_volatile = data, True
+            return False
+        if (not urgent and self._last_write is not None
+                and now - self._last_write < self.flush_interval):
+            self.pending, self._pending_volatile = data, False
+            return False
+        return self._write(data, now)
+
+    def _write(self, data, now: float) -> bool:
+        self.pending = None
+        self._pending_volatile = False
+        payload = json.dumps(data, ensure_ascii=False, indent=self.indent, default=_json_default)
+        if payload == self._last_payload:
+            return False
+        atomic_write_json(self.path, data, self.indent)
+        self._last_payload = payload
+        self._last_key = self._key(data)
+        self._last_write = now
+        return True
+
+    def flush(self, volatile: bool = True) -> bool:
+        """보류 중인 내용이 있으면 바로 쓴다. volatile=False면 volatile 키만 바뀐 내용은 계속 미룬다."""
+        if self.pending is None or (self._pending_volatile and not volatile):
+            return False
+        return self._write(self.pending, time.monotonic())
+
+
+# ── BloomFilter ─────────────────────────────────────────────
+
+
+class BloomFilter:
+    """파일에 mmap으로 기록하는 확장형(scalable) Bloom 필터.
+
+    정확한 최근 목록(DataStore.seen)에서 정리된 오래된 공고 ID를 기억하는 데 쓴다.
+    슬라이스가 용량에 차면 두 배 크기의 슬라이스를 덧붙이며, 슬라이스마다 오탐률을 절반씩
+    줄여 전체 오탐률이 fp_rate를 넘지 않게 한다.
+    """
+
+    MAGIC = b"LHBLOOM1"
+    HEADER = struct.Struct("<8sdI12x")        # magic, fp_rate, 슬라이스 수 (32바이트)
+    SLICE_HEADER = struct.Struct("<QQQI4x")   # capacity, count, 비트 수, 해시 수 (32바이트)
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, filepath="data/seen.bloom", fp_rate: float = 1e-6, capacity: int = 10000):
+        self.filepath = filepath
+        self.fp_rate = fp_rate
+        self.initial_capacity = max(1, capacity)
+        self._slices: list[dict] = []
+        self._file = None
+        self._mm = None
+        if os.path.exists(filepath) and os.path.getsize(filepath) >= self.HEADER.size:
+            self._file = open(filepath, "r+b")
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            if self._parse():
+                return
+            logger.warning("Bloom 필터 파일 형식이 맞지 않아 새로 만듭니다")
+            self.close()
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        self._file = open(filepath, "w+b")
+        self._file.write(self.HEADER.pack(self.MAGIC, fp_rate, 0))
+        self._file.flush()
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._slices = []
+        self._add_slice()
+
+    def _parse(self) -> bool:
+        """mmap된 파일에서 슬라이스 위치를 읽는다. 형식이 다르면 False."""
+        magic, fp_rate, n_slices = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC:
+            return False
+        self.fp_rate = fp_rate
+        offset = self.HEADER.size
+        for _ in range(n_slices):
+            if offset + self.SLICE_HEADER.size > len(self._mm):
+                return False
+            capacity, _count, m_bits, k = self.SLICE_HEADER.unpack_from(self._mm, offset)
+            self._slices.append({"offset": offset, "capacity": capacity, "bits": m_bits, "k": k})
+            offset += self.SLICE_HEADER.size + self._nbytes(m_bits)
+        return bool(self._slices) and offset <= len(self._mm)
+
+    @staticmethod
+    def _nbytes(m_bits: int) -> int:
+        return (m_bits + 63) // 64 * 8
+
+    def _add_slice(self):
+        """다음 슬라이스를 파일 끝에 덧붙이고 다시 mmap한다."""
+        i = len(self._slices)
+        capacity = self.initial_capacity * self.GROWTH ** i
+        p = self.fp_rate * (1 - self.TIGHTENING) * self.TIGHTENING ** i
+        m_bits = max(64, math.ceil(-capacity * math.log(p) / math.log(2) ** 2))
+        k = max(1, round(m_bits / capacity * math.log(2)))
+        offset = len(self._mm)
+        self._mm.close()
+        self._file.truncate(offset + self.SLICE_HEADER.size + self._nbytes(m_bits))
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.SLICE_HEADER.pack_into(self._mm, offset, capacity, 0, m_bits, k)
+        self._slices.append({"offset": offset, "capacity": capacity, "bits": m_bits, "k": k})
+        self.HEADER.pack_into(self._mm, 0, self.MAGIC, self.fp_rate, len(self._slices))
+        if i:
+            logger.info("Bloom 필터 확장: 슬라이스 %d개, 용량 %d", len(self._slices), self.capacity)
+
+    @staticmethod
+    def _hashes(key: str) -> tuple[int, int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def _positions(self, sl: dict, h1: int, h2: int):
+        base = sl["offset"] + self.SLICE_HEADER.size
+        m = sl["bits"]
+        for i in range(sl["k"]):
+            pos = (h1 + i * h2) % m
+            yield base + (pos >> 3), 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = self._hashes(key)
+        mm = self._mm
+        return any(
+            all(mm[byte] & mask for byte, mask in self._positions(sl, h1, h2))
+            for sl in self._slices
+        )
+
+    def add(self, key: str):
+        """키를 추가한다. 마지막 슬라이스가 용량에 차면 새 슬라이스를 만든다."""
+        if key in self:
+            return
+        sl = self._slices[-1]
+        h1, h2 = self._hashes(key)
+        mm = self._mm
+        for byte, mask in self._positions(sl, h1, h2):
+            mm[byte] |= mask
+        count_at = sl["offset"] + 8
+        count = struct.unpack_from("<Q", mm, count_at)[0] + 1
+        struct.pack_into("<Q", mm, count_at, count)
+        if count >= sl["capacity"]:
+            self._add_slice()
+
+    def __len__(self) -> int:
+        return sum(struct.unpack_from("<Q", self._mm, sl["offset"] + 8)[0] for sl in self._slices)
+
+    @property
+    def capacity(self) -> int:
+        return sum(sl["capacity"] for sl in self._slices)
+
+    def fill_ratio(self) -> float:
+        """현재 기록 중인 (마지막) 슬라이스에서 1로 설정된 비트의 비율."""
+        sl = self._slices[-1]
+        start = sl["offset"] + self.SLICE_HEADER.size
+        ones = int.from_bytes(self._mm[start:start + self._nbytes(sl["bits"])], "little").bit_count()
+        return ones / sl["bits"]
+
+    def stats(self) -> str:
+        return "%d건 / 용량 %d, 슬라이스 %d개, 채움률 %.1f%%, 목표 오탐률 %g" % (
+            len(self), self.capacity, len(self._slices), self.fill_ratio() * 100, self.fp_rate)
+
+    def flush(self):
+        if self._mm is not None:
+            self._mm.flush()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._slices = []
+
+
 # ── DataStore ───────────────────────────────────────────────
 
 
 class DataStore:
-    """이미 확인한 공고 ID를 JSON 파일로 관리하여 중복 알림을 방지한다."""
+    """이미 확인한 공고 ID를 JSON 파일로 관리하여 중복 알림을 방지한다.
 
-    def __init__(self, filepath="data/seen.json"):
+    ID는 최초 확인 시각과 함께 삽입 순서대로 dict에 보관하여 O(1)로 조회하고,
+    retention_days보다 오래된 ID만 저장 시점에 정리한다. bloom이 있으면 정리된 ID도
+    Bloom 필터로 계속 기억한다.
+    """
+
+    def __init__(self, filepath="data/seen.json", retention_days: int = 180,
+                 bloom: BloomFilter | None = None, flush_interval: float = 0.0):
         self.filepath = filepath
+        self.retention_days = retention_days
+        self.bloom = bloom
+        self._state = JsonStateFile(filepath, flush_interval, volatile=("last_check",))
+        self._changed = False
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        self.data = {"seen_ids": [], "last_check": None}
+        self.data = {"last_check": None}
+        self.seen: dict[str, str] = {}
+        self._frontier: set[str] = set()
         if os.path.exists(filepath):
             try:
                 with open(filepath, "r", encoding="utf-8") as f:
-                    self.data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
+                    self._load(json.load(f))
+            except (json.JSONDecodeError, ValueError, AttributeError, TypeError):
                 logger.warning("seen.json 파싱 실패, 초기값으로 대체합니다")
+                self.data = {"last_check": None}
+                self.seen = {}
+        self._fill_bloom()
+
+    def _fill_bloom(self):
+        """Bloom 필터 도입 이전에 기록된 ID도 필터에 넣는다 (이미 있으면 무시된다)."""
+        if self.bloom is not None:
+            for ann_id in self.seen:
+                self.bloom.add(ann_id)
+
+    def _load(self, raw: dict):
+        """파일 내용을 읽는다. first_seen이 없는 예전 seen_ids 목록은 last_check 시각으로 이관한다."""
+        first_seen = raw.pop("first_seen", None) or {}
+        seen_ids = raw.pop("seen_ids", None) or []
+        fallback = raw.get("last_check") or _now_iso()
+        for ann_id in seen_ids:
+            self.seen[ann_id] = first_seen.get(ann_id, fallback)
+        for ann_id, ts in first_seen.items():
+            self.seen.setdefault(ann_id, ts)
+        self.data = raw
+        self.data.setdefault("last_check", None)
+        self._frontier = set(self.data.get("frontier", []))
 
     def is_new(self, ann_id: str) -> bool:
-        """새 공고인지 확인한다."""
-        return ann_id not in self.data["seen_ids"]
+        """새 공고인지 확인한다 (최근 목록 → Bloom 필터 순)."""
+        if ann_id in self.seen:
+            return False
+        return self.bloom is None or ann_id not in self.bloom
 
     def mark_seen(self, ann_id: str):
         """확인한 공고로 기록한다 (메모리만, 디스크 쓰기 안 함)."""
-        if ann_id in self.data["seen_ids"]:
+        if ann_id in self.seen:
             return
-        self.data["seen_ids"].append(ann_id)
-        if len(self.data["seen_ids"]) > 500:
-            self.data["seen_ids"] = self.data["seen_ids"][-500:]
+        self.seen[ann_id] = _now_iso()
+        self._changed = True
+        if self.bloom is not None:
+            self.bloom.add(ann_id)
+
+    def is_known(self, ann_id: str) -> bool:
+        """페이지 수집 중단 기준: 기록된 공고이거나 직전 수집 목록에 있던 공고인지 확인한다."""
+        return not self.is_new(ann_id) or ann_id in self._frontier
+
+    def update_frontier(self, ann_ids):
+        """직전 수집 목록의 최신 공고 ID를 기록한다 (지역 필터 이전 기준)."""
+        self.data["frontier"] = list(ann_ids)[:LHCrawler.PAGE_SIZE]
+        self._frontier = set(self.data["frontier"])
+
+    def prune(self) -> int:
+        """retention_days보다 오래전에 처음 확인한 ID를 삭제하고 삭제 수를 반환한다."""
+        if not self.retention_days:
+            return 0
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat(timespec="seconds")
+        expired = []
+        # 삽입 순서 = 확인 순서이므로 앞에서부터 기준 이후 항목을 만나면 멈춘다
+        for ann_id, ts in self.seen.items():
+            if ts >= cutoff:
+                break
+            expired.append(ann_id)
+        for ann_id in expired:
+            del self.seen[ann_id]
+        return len(expired)
 
     def update_check_time(self):
-        """마지막 체크 시간을 갱신하고 파일에 저장한다."""
+        """마지막 체크 시간을 갱신하고 파일에 저장한다.
+
+        새로 기록한 ID가 있으면 바로 쓰고, 그 밖의 변경은 flush_interval 동안 모아서 쓴다.
+        체크 시간만 바뀐 경우는 쓰지 않고 다음 변경이나 종료 시 flush()에 함께 쓴다.
+        """
         self.data["last_check"] = datetime.now().isoformat()
-        self.save()
+        self._persist(urgent=self._changed)
 
     def save(self):
-        """현재 상태를 JSON 파일에 저장한다."""
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        """현재 상태를 JSON 파일에 저장한다 (내용이 같으면 쓰지 않는다).
+
+        예전 버전도 읽을 수 있도록 seen_ids 목록을 함께 기록한다.
+        """
+        self._persist(urgent=True)
+
+    def flush(self, check_time: bool = True):
+        """보류 중인 변경을 바로 쓴다 (종료 시 호출). check_time=False면 체크 시간만 바뀐 내용은 계속 미룬다."""
+        self._state.flush(volatile=check_time)
+
+    def _persist(self, urgent: bool):
+        if self.prune():
+            urgent = True
+        if self.bloom is not None:
+            self.bloom.flush()
+        out = dict(self.data)
+        out["seen_ids"] = list(self.seen)
+        out["first_seen"] = dict(self.seen)
+        self._state.write(out, urgent=urgent)
+        if urgent:
+            self._changed = False
+
+
+class DeadlineExceeded(Exception):
+    """체크 전체 예산을 다 써서 남은 소스 요청을 건너뛸 때 발생한다."""
+
+
+class Unchanged(Exception):
+    """소스 목록이 직전 체크와 같아(304 또는 동일 본문) 파싱·중복 검사를 건너뛸 때 발생한다."""
+
+
+# ── SourceHealth ───────────────────────────────────────────
+
+
+class SourceHealth:
+    """데이터 소스별 성공률·지연시간·연속 실패를 추적하고, 연속 실패한 소스는 서킷을 열어 건너뛴다."""
+
+    SOURCES = ("api", "json", "html")
+    WINDOW = 50
+
+    def __init__(self, filepath=None, failure_threshold: int = 3, cooldown: float = 600,
+                 flush_interval: float = 0.0):
+        self.filepath = filepath
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._state = JsonStateFile(filepath, flush_interval, indent=None) if filepath else None
+        self._circuit_changed = False
+        self._lock = threading.Lock()
+        self.data = {name: self._empty() for name in self.SOURCES}
+        if filepath and os.path.exists(filepath):
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    for name, state in json.load(f).items():
+                        if name in self.data:
+                            self.data[name].update(state)
+            except (json.JSONDecodeError, ValueError, AttributeError):
+                logger.warning("health.json 파싱 실패, 초기값으로 대체합니다")
+
+    @staticmethod
+    def _empty() -> dict:
+        return {"outcomes": [], "latencies": [], "consecutive_failures": 0, "open_until": 0.0}
+
+    def record(self, name: str, ok: bool, latency: float):
+        """소스 호출 결과를 기록한다. 연속 실패가 기준에 닿으면 cooldown 동안 서킷을 연다."""
+        with self._lock:
+            st = self.data[name]
+            st["outcomes"] = (st["outcomes"] + [1 if ok else 0])[-self.WINDOW:]
+            st["latencies"] = (st["latencies"] + [round(latency, 3)])[-self.WINDOW:]
+            if ok:
+                if st["consecutive_failures"] >= self.failure_threshold:
+                    self._circuit_changed = True
+                st["consecutive_failures"] = 0
+                st["open_until"] = 0.0
+                return
+            st["consecutive_failures"] += 1
+            if st["consecutive_failures"] >= self.failure_threshold:
+                st["open_until"] = time.time() + self.cooldown
+                self._circuit_changed = True
+                logger.warning("%s 소스 %d회 연속 실패, %d초 동안 건너뜁니다",
+                               name, st["consecutive_failures"], self.cooldown)
+
+    def is_open(self, name: str) -> bool:
+        """서킷이 열려 있으면 True. cooldown이 지나면 한 번 다시 시도할 수 있다."""
+        return time.time() < self.data[name]["open_until"]
+
+    def success_rate(self, name: str) -> float:
+        outcomes = self.data[name]["outcomes"]
+        return sum(outcomes) / len(outcomes) if outcomes else 1.0
+
+    def percentile(self, name: str, q: float) -> float:
+        """최근 지연시간의 q 분위수(초). 기록이 없으면 0."""
+        latencies = sorted(self.data[name]["latencies"])
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    def order(self, names) -> list[str]:
+        """건강한 순서로 정렬한다: 서킷 닫힘 → 성공률 → 원래 우선순위."""
+        names = list(names)
+        return sorted(names, key=lambda n: (self.is_open(n), -round(self.success_rate(n), 1), names.index(n)))
+
+    def available(self, names) -> list[str]:
+        """서킷이 닫힌 소스를 건강한 순서로 반환한다. 전부 열려 있으면 전부 시도한다."""
+        ordered = self.order(names)
+        closed = [n for n in ordered if not self.is_open(n)]
+        return closed or ordered
+
+    def report(self) -> str:
+        """소스별 상태 요약 문자열."""
+        parts = []
+        for name in self.SOURCES:
+            st = self.data[name]
+            parts.append("%s 성공률 %.0f%% p50 %.1fs p95 %.1fs 연속실패 %d%s" % (
+                name, self.success_rate(name) * 100, self.percentile(name, 0.5),
+                self.percentile(name, 0.95), st["consecutive_failures"],
+                " (차단)" if self.is_open(name) else "",
+            ))
+        return " | ".join(parts)
+
+    def save(self, urgent: bool = False):
+        """현재 상태를 JSON 파일에 저장한다 (filepath가 없으면 메모리에만 유지).
+
+        서킷이 새로 열리고 닫히는 것 외의 통계 변화는 flush_interval 단위로 모아서 쓴다.
+        """
+        if self._state is None:
+            return
+        with self._lock:
+            snapshot = json.loads(json.dumps(self.data))
+            urgent = urgent or self._circuit_changed
+            self._circuit_changed = False
+        self._state.write(snapshot, urgent=urgent)
+
+    def flush(self):
+        if self._state is not None:
+            self._state.flush()
 
 
 # ── LHCrawler ──────────────────────────────────────────────
 
 
+class _ListingRowParser(HTMLParser):
+    """<tbody> 안의 <tr>이 닫히는 즉시 (셀 텍스트 목록, 공고 링크 속성, 제목)을 rows에 쌓는 증분 파서.
+
+    텍스트는 BeautifulSoup의 get_text(strip=True)와 같게 텍스트 노드마다 strip해서 이어 붙이고,
+    공고 링크는 wrtancInfoBtn 클래스를 우선하며 없으면 행의 첫 <a>를 쓴다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[tuple] = []
+        self._tbody = 0
+        self._cells = None   # 열린 행의 셀 텍스트
+        self._cell = None    # 열린 셀의 텍스트 조각
+        self._links = []     # 열린 행의 (속성, 텍스트 조각)
+        self._link = None
+        self._text = []      # 청크 경계에서 나뉜 현재 텍스트 노드
+
+    def handle_starttag(self, tag, attrs):
+        self._end_text()
+        if tag == "tbody":
+            self._tbody += 1
+        elif not self._tbody:
+            return
+        elif tag == "tr":
+            # </tr>, </td>는 생략될 수 있으므로 새 태그가 열리면 이전 것을 닫는다
+            self._end_row()
+            self._cells, self._links = [], []
+        elif self._cells is None:
+            return
+        elif tag == "td":
+            self._end_cell()
+            self._cell = []
+        elif tag == "a":
+            self._link = ({k: v or "" for k, v in attrs}, [])
+            self._links.append(self._link)
+
+    def handle_endtag(self, tag):
+        self._end_text()
+        if tag == "tbody" and self._tbody:
+            self._end_row()
+            self._tbody -= 1
+        elif tag == "tr":
+            self._end_row()
+        elif tag == "td":
+            self._end_cell()
+        elif tag == "a":
+            self._link = None
+
+    def handle_data(self, data):
+        if self._cells is not None:
+            self._text.append(data)
+
+    def _end_text(self):
+        piece = "".join(self._text).strip()
+        self._text.clear()
+        if not piece or self._cells is None:
+            return
+        if self._cell is not None:
+            self._cell.append(piece)
+        if self._link is not None:
+            self._link[1].append(piece)
+
+    def _end_cell(self):
+        if self._cell is not None:
+            self._cells.append("".join(self._cell))
+            self._cell = None
+
+    def _end_row(self):
+        if self._cells is None:
+            return
+        self._end_cell()
+        cells, links = self._cells, self._links
+        self._cells, self._links, self._link = None, [], None
+        if not cells:
+            return
+        link = next((lk for lk in links if "wrtancInfoBtn" in lk[0].get("class", "").split()),
+                    links[0] if links else None)
+        if link:
+            self.rows.append((cells, link[0], "".join(link[1])))
+        else:
+            self.rows.append((cells, None, cells[0]))
+
+
 class LHCrawler:
     """3개 데이터 소스에서 공고를 수집하여 통일된 형식으로 반환한다."""
 
@@ -118,7 +920,33 @@ class LHCrawler:
         "?ccrCnntSysDsCd={ccr}&panId={pan_id}&aisTpCd={ais}&uppAisTpCd={upp}&mi=1026"
     )
 
-    def __init__(self):
+    PAGE_SIZE = 30
+    REQUEST_TIMEOUT = 30
+    MIN_TIMEOUT = 1.0
+    STREAM_CHUNK_SIZE = 8192
+
+    # 소스별 필드 매핑 (FieldMap.resolve로 응답마다 표기법을 한 번 고른다)
+    API_FIELDS = FieldMap(
+        ("id", "title", "rental_type", "reg_date", "rcpt_begin", "rcpt_end", "url"),
+        ("sn", "sj", "typeCdNm", "crtDt", "rceptBgnDt", "rceptEndDt", "dtlUrl"),
+    )
+    JSON_FIELDS = FieldMap(
+        ("id", "type_cd", "ccr", "upp", "title", "status", "reg_date", "rcpt_begin", "rcpt_end"),
+        ("panId", "aisTpCd", "ccrCnntSysDsCd", "uppAisTpCd", "panNm", "panSttNm",
+         "dttmRgst", "clsgBgnDt", "clsgEndDt"),
+        ("PAN_ID", "AIS_TP_CD", "CCR_CNNT_SYS_DS_CD", "UPP_AIS_TP_CD", "PAN_NM", "PAN_STT_NM",
+         "DTTM_RGST", "CLSG_BGN_DT", "CLSG_END_DT"),
+        defaults={"ccr": "03"},
+    )
+    # HTML 컬럼: 번호(0), 유형(1), 공고명(2), 지역(3), 첨부(4), 게시일(5), 마감일(6), 상태(7), 조회수(8)
+    HTML_COLUMNS = itemgetter(1, 5, 6, 7)
+    HTML_MIN_CELLS = 8
+    _TBODY_ONLY = SoupStrainer("tbody")
+
+    def __init__(self, max_pages: int = 5, health: SourceHealth | None = None, stream_html: bool = False):
+        self.max_pages = max(1, max_pages)
+        self.health = health or SourceHealth()
+        self.stream_html = stream_html
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -126,109 +954,327 @@ class LHCrawler:
             "Accept-Language": "ko-KR,ko;q=0.9",
             "Referer": "https://apply.lh.or.kr",
         })
-
-    def fetch_api(self, api_key: str) -> list[dict]:
-        """공공데이터포털 API로 공고를 조회한다."""
+        # 소스별 첫 페이지 지문: {"hash", "etag", "last_modified"}
+        # 응답을 받으면 _staged, 그 결과를 채택하면 _pending, 체크 처리가 끝나면 _fingerprints로 옮긴다
+        self._fingerprints: dict[str, dict] = {}
+        self._staged_fingerprints: dict[str, dict] = {}
+        self._pending_fingerprints: dict[str, dict] = {}
+
+    def fetch_api(self, api_key: str, known=None, deadline: float | None = None) -> list[Announcement]:
+        """공공데이터포털 API로 공고를 조회한다.
+
+        known(ann_id)가 True인 공고가 나오거나 페이지 예산을 다 쓰면 다음 페이지를 요청하지 않는다.
+        서킷이 열려 있거나 deadline(time.monotonic 기준)이 지났으면 요청 없이 빈 리스트를 반환한다.
+        """
+        if self.health.is_open("api"):
+            logger.info("공공데이터 API 서킷 열림, 건너뜁니다")
+            return []
         try:
-            resp = self.session.get(
-                self.API_URL,
-                params={"ServiceKey": api_key, "pageNo": 1, "numOfRows": 30, "type": "json"},
-                timeout=30,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            items = data["response"]["body"]["items"]
-            if not items or not items.get("item"):
-                return []
-            item_list = items["item"]
-            if isinstance(item_list, dict):
-                item_list = [item_list]
-
-            results = []
-            for it in item_list:
-                dtl_url = it.get("dtlUrl", "")
-                pan_id = str(it.get("sn", ""))
-                # dtlUrl이 비어있으면 기본 파라미터로 상세 URL 구성
-                if not dtl_url and pan_id:
-                    dtl_url = self.DETAIL_URL.format(
-                        ccr="03", pan_id=pan_id, ais="", upp="",
-                    )
-                results.append({
-                    "id": pan_id,
-                    "title": it.get("sj", ""),
-                    "rental_type": it.get("typeCdNm", ""),
-                    "status": "",
-                    "reg_date": normalize_date(it.get("crtDt", "")),
-                    "rcpt_begin": normalize_date(it.get("rceptBgnDt", "")),
-                    "rcpt_end": normalize_date(it.get("rceptEndDt", "")),
-                    "url": dtl_url,
-                })
+            results = self._call_source("api", lambda: self._paginate(
+                lambda page: self._fetch_api_page(api_key, page, deadline), known))
             logger.info("공공데이터 API: %d개 수집", len(results))
+            if results:
+                self._adopt("api")
             return results
+        except DeadlineExceeded as e:
+            logger.warning("공공데이터 API 건너뜀: %s", e)
+            return []
         except (requests.RequestException, json.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning("공공데이터 API 조회 실패: %s", e)
             return []
 
-    def fetch_web(self) -> list[dict]:
-        """LH 사이트에서 공고를 수집한다 (JSON API → HTML 크롤링 폴백)."""
-        # 1차: JSON API
-        try:
-            result = self._fetch_json_api()
-            if result:
-                return result
-        except Exception as e:
-            logger.warning("LH JSON API 실패, HTML 크롤링으로 폴백: %s", e)
+    def _fetch_api_page(self, api_key: str, page: int, deadline: float | None = None) -> tuple[list[Announcement], int]:
+        """공공데이터포털 API 한 페이지를 조회하여 (공고 리스트, 원본 행 수)를 반환한다."""
+        resp = self.session.get(
+            self.API_URL,
+            params={"ServiceKey": api_key, "pageNo": page, "numOfRows": self.PAGE_SIZE, "type": "json"},
+            headers=self._conditional_headers("api") if page == 1 else None,
+            timeout=self._timeout(deadline),
+        )
+        resp.raise_for_status()
+        if page == 1:
+            self._fingerprint("api", resp)
+        data = resp.json()
+        items = data["response"]["body"]["items"]
+        if not items or not items.get("item"):
+            return [], 0
+        item_list = items["item"]
+        if isinstance(item_list, dict):
+            item_list = [item_list]
+
+        return self._parse_api_items(item_list), len(item_list)
+
+    def _parse_api_items(self, item_list: list[dict]) -> list[Announcement]:
+        """공공데이터포털 API 행을 Announcement로 바꾼다."""
+        get = self.API_FIELDS.resolve(item_list[0])
+        results = []
+        for it in item_list:
+            sn, title, rental_type, reg, begin, end, dtl_url = get(it)
+            pan_id = str(sn)
+            # dtlUrl이 비어있으면 기본 파라미터로 상세 URL 구성
+            if not dtl_url and pan_id:
+                dtl_url = self.DETAIL_URL.format(
+                    ccr="03", pan_id=pan_id, ais="", upp="",
+                )
+            results.append(Announcement(
+                id=pan_id,
+                title=title,
+                rental_type=rental_type,
+                status="",
+                reg_date=normalize_date(reg),
+                rcpt_begin=normalize_date(begin),
+                rcpt_end=normalize_date(end),
+                url=dtl_url,
+            ))
+        return results
+
+    def _paginate(self, fetch_page, known=None) -> list[Announcement]:
+        """fetch_page(page)를 1페이지부터 반복 호출하여 결과를 합친다.
+
+        이미 아는 공고가 포함된 페이지, 행 수가 PAGE_SIZE 미만인 페이지, 또는
+        max_pages번째 페이지에서 멈춘다. 2페이지 이후의 실패는 그때까지의 결과를 반환한다.
+        """
+        results = []
+        for page in range(1, self.max_pages + 1):
+            try:
+                items, raw_count = fetch_page(page)
+            except Exception as e:
+                if page == 1:
+                    raise
+                logger.warning("%d페이지 조회 실패, %d건까지만 사용: %s", page, len(results), e)
+                break
+            results.extend(items)
+            if raw_count < self.PAGE_SIZE:
+                break
+            if known and any(known(a.id) for a in items):
+                break
+        else:
+            if self.max_pages > 1:
+                logger.warning("페이지 예산(%d페이지) 소진, 이후 공고는 수집하지 못했습니다", self.max_pages)
+        if page > 1:
+            logger.info("%d페이지까지 추가 수집", page)
+        return results
+
+    def fetch_web(self, known=None, deadline: float | None = None) -> list[Announcement]:
+        """LH 사이트에서 공고를 수집한다 (JSON API → HTML 크롤링 폴백).
 
-        # 2차: HTML 크롤링
+        두 소스는 health 기준으로 건강한 쪽부터 시도하고, 서킷이 열린 소스는 건너뛴다.
+        JSON API는 known 기준으로 여러 페이지를 순회하고, HTML 크롤링은 첫 페이지만 읽는다.
+        """
+        sources = dict(self._sources("", known, deadline))
+        names = self.health.available(["json", "html"])
+        unchanged = None
+        for i, name in enumerate(names):
+            try:
+                result = self._call_source(name, sources[name])
+                if result:
+                    self._adopt(name)
+                    return result
+            except Unchanged as e:
+                # 먼저 시도한 소스가 그대로면 체크를 끝내고, 폴백 소스가 그대로면 다음 소스를 계속 본다
+                if i == 0:
+                    raise
+                unchanged = unchanged or e
+            except Exception as e:
+                logger.warning("%s 소스 실패: %s", name, e)
+        if unchanged is not None:
+            raise unchanged
+        logger.error("웹 소스(%s) 모두 실패하거나 빈 결과", ", ".join(names))
+        return []
+
+    def _timeout(self, deadline: float | None) -> float:
+        """요청 timeout을 남은 예산으로 줄인다. 최소 시간도 남지 않았으면 DeadlineExceeded."""
+        if deadline is None:
+            return self.REQUEST_TIMEOUT
+        remaining = deadline - time.monotonic()
+        if remaining < self.MIN_TIMEOUT:
+            raise DeadlineExceeded("체크 예산 소진 (남은 시간 %.1f초)" % max(0.0, remaining))
+        return min(self.REQUEST_TIMEOUT, remaining)
+
+    def _conditional_headers(self, name: str) -> dict:
+        """직전 체크에서 받은 ETag/Last-Modified로 조건부 요청 헤더를 만든다."""
+        fp = self._fingerprints.get(name, {})
+        headers = {}
+        if fp.get("etag"):
+            headers["If-None-Match"] = fp["etag"]
+        if fp.get("last_modified"):
+            headers["If-Modified-Since"] = fp["last_modified"]
+        return headers
+
+    def _fingerprint(self, name: str, resp, hash_body: bool = True):
+        """응답이 304이거나 본문이 직전 체크와 바이트 단위로 같으면 Unchanged를 던진다.
+
+        새 지문은 결과가 채택된 소스(_adopt)의 것만 보류했다가 commit_fingerprints()에서 확정한다.
+        빈 결과·오류 응답이나 쓰지 않은 소스, 처리 도중 실패한 목록을 다음 체크에서
+        '변경 없음'으로 건너뛰지 않기 위해서다.
+        hash_body=False(스트리밍)면 본문을 읽지 않고 304와 ETag/Last-Modified만 본다.
+        """
+        if resp.status_code == 304:
+            raise Unchanged("%s 304 Not Modified" % name)
+        digest = ""
+        if hash_body:
+            body = resp.content
+            if not isinstance(body, (bytes, bytearray)):
+                return
+            digest = hashlib.sha256(body).hexdigest()
+            if self._fingerprints.get(name, {}).get("hash") == digest:
+                raise Unchanged("%s 본문 동일" % name)
+        headers = resp.headers if isinstance(resp.headers, Mapping) else {}
+        self._staged_fingerprints[name] = {
+            "hash": digest,
+            "etag": headers.get("ETag", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+        }
+
+    def _adopt(self, name: str):
+        """name 소스의 결과를 이번 체크에 쓰므로, 그 응답의 지문을 확정 대기로 올린다."""
+        fp = self._staged_fingerprints.pop(name, None)
+        if fp is not None:
+            self._pending_fingerprints[name] = fp
+
+    def commit_fingerprints(self):
+        """이번 체크에서 채택한 목록의 처리가 끝났으므로 지문을 확정한다. 채택되지 않은 응답의 지문은 버린다."""
+        self._fingerprints.update(self._pending_fingerprints)
+        self._pending_fingerprints.clear()
+        self._staged_fingerprints.clear()
+
+    def _call_source(self, name: str, fn) -> list[Announcement]:
+        """소스 함수를 호출하고 결과(빈 결과는 실패)와 지연시간을 health에 기록한다.
+
+        예산 소진으로 건너뛴 경우는 소스 탓이 아니므로 기록하지 않고,
+        목록 변경 없음(Unchanged)은 정상 응답이므로 성공으로 기록한다.
+        """
+        started = time.monotonic()
         try:
-            return self._fetch_html()
-        except Exception as e:
-            logger.error("HTML 크롤링도 실패: %s", e)
+            result = fn()
+        except DeadlineExceeded:
+            self._staged_fingerprints.pop(name, None)
+            raise
+        except Unchanged:
+            self.health.record(name, True, time.monotonic() - started)
+            raise
+        except Exception:
+            self._staged_fingerprints.pop(name, None)
+            self.health.record(name, False, time.monotonic() - started)
+            raise
+        self.health.record(name, bool(result), time.monotonic() - started)
+        if not result:
+            self._staged_fingerprints.pop(name, None)
+        return result
+
+    def fetch_race(self, api_key: str = "", known=None, deadline: float | None = None) -> list[Announcement]:
+        """모든 소스를 스레드 풀에서 동시에 호출하고 가장 먼저 도착한 유효 결과를 반환한다.
+
+        같은 시점에 완료된 결과가 여럿이면 우선순위(API → JSON → HTML)가 높은 쪽을 쓰고,
+        나머지 소스의 결과는 기다리지 않고 버린다. 서킷이 열린 소스는 호출하지 않으며,
+        deadline까지 유효 결과가 없으면 빈 리스트를 반환한다. 최우선 소스가 그대로(Unchanged)면
+        바로 끝내고, 다른 소스가 그대로면 나머지를 기다렸다가 유효 결과가 없을 때만 Unchanged를 던진다.
+        """
+        sources = self._sources(api_key, known, deadline)
+        allowed = set(self.health.available(name for name, _ in sources))
+        sources = [(name, fn) for name, fn in sources if name in allowed]
+        pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="lh-source")
+        started = time.monotonic()
+        try:
+            futures = {pool.submit(self._call_source, name, fn): (rank, name) for rank, (name, fn) in enumerate(sources)}
+            pending = set(futures)
+            unchanged = None
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.warning("체크 예산 소진, 동시 수집 중단 (%.1f초)", time.monotonic() - started)
+                    return []
+                for fut in sorted(done, key=lambda f: futures[f][0]):
+                    rank, name = futures[fut]
+                    try:
+                        result = fut.result()
+                    except Unchanged as e:
+                        logger.info("동시 수집: %s 소스 변경 없음 (%.1f초)", name, time.monotonic() - started)
+                        if rank == 0:
+                            raise
+                        unchanged = unchanged or e
+                        continue
+                    except Exception as e:
+                        logger.warning("%s 소스 실패: %s", name, e)
+                        continue
+                    if result:
+                        logger.info("동시 수집: %s 소스 채택 (%.1f초)", name, time.monotonic() - started)
+                        self._adopt(name)
+                        return result
+            if unchanged is not None:
+                raise unchanged
+            logger.error("모든 소스가 실패하거나 빈 결과를 반환했습니다")
             return []
-
-    def _fetch_json_api(self) -> list[dict]:
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _sources(self, api_key: str, known=None, deadline: float | None = None) -> list[tuple]:
+        """우선순위 순서의 (이름, 호출 함수) 목록. 각 함수는 실패 시 예외를 던진다."""
+        sources = []
+        if api_key:
+            sources.append(("api", lambda: self._paginate(
+                lambda page: self._fetch_api_page(api_key, page, deadline), known)))
+        sources.append(("json", lambda: self._fetch_json_api(known, deadline)))
+        sources.append(("html", lambda: self._fetch_html(deadline, known)))
+        return sources
+
+    def _fetch_json_api(self, known=None, deadline: float | None = None) -> list[Announcement]:
         """LH 내부 JSON API로 공고를 조회한다."""
+        results = self._paginate(lambda page: self._fetch_json_page(page, deadline), known)
+        logger.info("JSON API: %d개 수집", len(results))
+        return results
+
+    def _fetch_json_page(self, page: int, deadline: float | None = None) -> tuple[list[Announcement], int]:
+        """LH 내부 JSON API 한 페이지를 조회하여 (공고 리스트, 원본 행 수)를 반환한다."""
         resp = self.session.post(
             self.JSON_URL,
-            data={"pg": 1, "pgSz": 30, "uppAisTpCd": 13},
-            timeout=30,
+            data={"pg": page, "pgSz": self.PAGE_SIZE, "uppAisTpCd": 13},
+            headers=self._conditional_headers("json") if page == 1 else None,
+            timeout=self._timeout(deadline),
         )
         resp.raise_for_status()
+        if page == 1:
+            self._fingerprint("json", resp)
         data = resp.json()
         items = data.get("dsList") or data.get("list")
         if not items:
+            if page > 1:
+                return [], 0
             raise ValueError("JSON API 응답에 dsList/list 키 없음")
 
+        return self._parse_json_items(items), len(items)
+
+    def _parse_json_items(self, items: list[dict]) -> list[Announcement]:
+        """LH 내부 JSON API 행을 Announcement로 바꾼다. 키 표기법은 첫 행으로 한 번만 판별한다."""
+        get = self.JSON_FIELDS.resolve(items[0])
         results = []
         for it in items:
-            pan_id = it.get("panId") or it.get("PAN_ID", "")
-            type_cd = it.get("aisTpCd") or it.get("AIS_TP_CD", "")
-            ccr = it.get("ccrCnntSysDsCd") or it.get("CCR_CNNT_SYS_DS_CD", "03")
-            upp = it.get("uppAisTpCd") or it.get("UPP_AIS_TP_CD", "")
-            results.append({
-                "id": str(pan_id),
-                "title": it.get("panNm") or it.get("PAN_NM", ""),
-                "rental_type": RENTAL_TYPES.get(type_cd, type_cd),
-                "status": it.get("panSttNm") or it.get("PAN_STT_NM", ""),
-                "reg_date": normalize_date(it.get("dttmRgst") or it.get("DTTM_RGST", "")),
-                "rcpt_begin": normalize_date(it.get("clsgBgnDt") or it.get("CLSG_BGN_DT", "")),
-                "rcpt_end": normalize_date(it.get("clsgEndDt") or it.get("CLSG_END_DT", "")),
-                "url": self.DETAIL_URL.format(ccr=ccr, pan_id=pan_id, ais=type_cd, upp=upp),
-            })
-        logger.info("JSON API: %d개 수집", len(results))
+            pan_id, type_cd, ccr, upp, title, status, reg, begin, end = get(it)
+            results.append(Announcement(
+                id=str(pan_id),
+                title=title,
+                rental_type=RENTAL_TYPES.get(type_cd, type_cd),
+                status=status,
+                reg_date=normalize_date(reg),
+                rcpt_begin=normalize_date(begin),
+                rcpt_end=normalize_date(end),
+                url=self.DETAIL_URL.format(ccr=ccr, pan_id=pan_id, ais=type_cd, upp=upp),
+            ))
         return results
 
-    def _fetch_html(self) -> list[dict]:
-        """LH 웹페이지를 HTML 크롤링하여 공고를 수집한다."""
-        resp = self.session.get(self.HTML_URL, timeout=30)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+    def _fetch_html(self, deadline: float | None = None, known=None) -> list[Announcement]:
+        """LH 웹페이지를 HTML 크롤링하여 공고를 수집한다.
 
-        rows = (
-            soup.select("table tbody tr")
-            or soup.select(".board-list tbody tr")
-            or soup.select(".tbl_list tbody tr")
-        )
+        stream_html이 켜져 있고 known이 주어지면 응답을 스트리밍으로 읽다가 아는 공고 행에서 끊는다.
+        """
+        if self.stream_html and known:
+            return self._stream_html(known, deadline)
+        resp = self.session.get(self.HTML_URL, headers=self._conditional_headers("html"),
+                                timeout=self._timeout(deadline))
+        resp.raise_for_status()
+        self._fingerprint("html", resp)
+        rows = self._listing_rows(resp.text)
         if not rows:
             return []
 
@@ -239,32 +1285,91 @@ class LHCrawler:
                 continue
             # wrtancInfoBtn 링크를 우선 선택 (첨부파일 링크와 혼동 방지)
             link = row.find("a", class_="wrtancInfoBtn") or row.find("a")
-            title = link.get_text(strip=True) if link else cols[0].get_text(strip=True)
-            ann_id = self._extract_id(link, title)
-
-            # 상세 URL 구성에 필요한 추가 파라미터 추출
-            ccr = link.get("data-id2", "03") if link else "03"
-            upp = link.get("data-id3", "") if link else ""
-            ais = link.get("data-id4", "") if link else ""
-
-            # 컬럼에서 데이터 추출 (컬럼 수가 다를 수 있으므로 안전하게)
-            def col_text(idx):
-                return cols[idx].get_text(strip=True) if idx < len(cols) else ""
-
-            # 컬럼: 번호(0), 유형(1), 공고명(2), 지역(3), 첨부(4), 게시일(5), 마감일(6), 상태(7), 조회수(8)
-            results.append({
-                "id": ann_id,
-                "title": title,
-                "rental_type": col_text(1),
-                "reg_date": normalize_date(col_text(5)),
-                "rcpt_begin": normalize_date(col_text(5)),
-                "rcpt_end": normalize_date(col_text(6)),
-                "status": col_text(7),
-                "url": self.DETAIL_URL.format(ccr=ccr, pan_id=ann_id, ais=ais, upp=upp),
-            })
+            cells = [td.get_text(strip=True) for td in cols]
+            title = link.get_text(strip=True) if link else cells[0]
+            results.append(self._html_row(cells, link, title))
         logger.info("HTML 크롤링: %d개 수집", len(results))
         return results
 
+    def _stream_html(self, known, deadline: float | None = None) -> list[Announcement]:
+        """HTML 목록을 iter_content로 받아 증분 파싱하고, 아는 공고 행이 닫히면 다운로드를 중단한다.
+
+        본문을 끝까지 받지 않으므로 본문 해시 대신 ETag/Last-Modified 조건부 요청만 쓴다.
+        """
+        resp = self.session.get(self.HTML_URL, headers=self._conditional_headers("html"),
+                                timeout=self._timeout(deadline), stream=True)
+        try:
+            resp.raise_for_status()
+            self._fingerprint("html", resp, hash_body=False)
+            # charset이 없으면 resp.text의 추정(본문 전체 필요) 대신 LH 페이지 인코딩인 UTF-8로 읽는다
+            decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+            parser = _ListingRowParser()
+            results = []
+            received = 0
+            for chunk in resp.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if self._take_rows(parser, results, known):
+                    logger.info("HTML 스트리밍: 아는 공고에서 중단, %d개 수집 (%.0f KiB 수신)",
+                                len(results), received / 1024)
+                    return results
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+            self._take_rows(parser, results, known)
+        finally:
+            resp.close()
+        logger.info("HTML 스트리밍: %d개 수집 (%.0f KiB 전체 수신)", len(results), received / 1024)
+        return results
+
+    def _take_rows(self, parser: "_ListingRowParser", results: list, known) -> bool:
+        """파서에 쌓인 행을 공고로 바꿔 results에 붙인다. 아는 공고가 나오면 True."""
+        rows, parser.rows = parser.rows, []
+        for cells, link, title in rows:
+            ann = self._html_row(cells, link, title)
+            results.append(ann)
+            if known(ann.id):
+                return True
+        return False
+
+    def _html_row(self, cells: list[str], link, title: str) -> Announcement:
+        """목록 표 한 행을 Announcement로 만든다. link는 공고 <a>의 속성 매핑(Tag 또는 dict)이다."""
+        ann_id = self._extract_id(link, title)
+
+        # 상세 URL 구성에 필요한 추가 파라미터 추출
+        ccr = link.get("data-id2", "03") if link else "03"
+        upp = link.get("data-id3", "") if link else ""
+        ais = link.get("data-id4", "") if link else ""
+
+        # 컬럼 수가 다를 수 있으므로 모자라는 칸은 빈 문자열로 채운다
+        if len(cells) < self.HTML_MIN_CELLS:
+            cells = cells + [""] * (self.HTML_MIN_CELLS - len(cells))
+        rental_type, reg, end, status = self.HTML_COLUMNS(cells)
+        return Announcement(
+            id=ann_id,
+            title=title,
+            rental_type=rental_type,
+            status=status,
+            reg_date=normalize_date(reg),
+            rcpt_begin=normalize_date(reg),
+            rcpt_end=normalize_date(end),
+            url=self.DETAIL_URL.format(ccr=ccr, pan_id=ann_id, ais=ais, upp=upp),
+        )
+
+    def _listing_rows(self, html: str) -> list:
+        """공고 목록 표의 <tr> 행을 찾는다.
+
+        <tbody>만 파싱하는 빠른 경로를 먼저 쓰고, 행이 없으면 문서 전체를 파싱해 셀렉터로 찾는다.
+        """
+        rows = BeautifulSoup(html, HTML_PARSER, parse_only=self._TBODY_ONLY).find_all("tr")
+        if rows:
+            return rows
+        soup = BeautifulSoup(html, "html.parser")
+        return (
+            soup.select("table tbody tr")
+            or soup.select(".board-list tbody tr")
+            or soup.select(".tbl_list tbody tr")
+        )
+
     @staticmethod
     def _extract_id(link, title: str) -> str:
         """<a> 태그에서 공고 ID를 추출한다."""
@@ -275,17 +1380,318 @@ class LHCrawler:
                 return data_id
             href = link.get("href", "")
             # panId= 파라미터
-            m = re.search(r"panId=([^&]+)", href)
+            m = _HREF_PAN_ID.search(href)
             if m:
                 return m.group(1)
             # JavaScript 함수 호출에서 숫자 ID
-            m = re.search(r"['\"](\d+)['\"]", href)
+            m = _HREF_QUOTED_NUM.search(href)
             if m:
                 return m.group(1)
         # fallback: 제목의 MD5 해시 앞 16자
         return hashlib.md5(title.encode("utf-8")).hexdigest()[:16]
 
 
+# ── 알림 HTTP 세션 ──────────────────────────────────────────
+
+
+class _NotifierRetry(Retry):
+    """알림 POST용 재시도 정책: 서버가 처리하지 않았다고 밝힌 응답(Retry-After가 붙은 503)만 다시 보낸다.
+
+    429는 RateLimiter가 수신처 전체의 발송을 멈추고 post_with_limit이 다시 보낸다.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+
+def build_notifier_session(pool_size: int = 10, retries: int = 3) -> requests.Session:
+    """알림 발송용 세션을 만든다: 연결 풀(keep-alive)과 지터 백오프 재시도.
+
+    POST는 중복 발송 위험이 있으므로 요청이 서버에 닿기 전의 연결 실패와 Retry-After가 붙은 503만
+    재시도한다. 502 같은 프록시 오류는 원 서버가 이미 메시지를 보낸 뒤일 수 있어 다시 보내지 않는다.
+    """
+    retry_kwargs = dict(
+        total=retries, connect=retries, read=0, other=0, status=retries,
+        status_forcelist=(), allowed_methods=frozenset({"POST"}),
+        backoff_factor=0.5, raise_on_status=False,
+    )
+    try:
+        retry = _NotifierRetry(backoff_jitter=0.5, **retry_kwargs)
+    except TypeError:
+        # urllib3 1.x에는 backoff_jitter가 없다
+        retry = _NotifierRetry(**retry_kwargs)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# ── RateLimiter ─────────────────────────────────────────────
+
+
+class Stopped(Exception):
+    """종료 중이라 rate limit 대기를 멈추고 발송을 포기했다."""
+
+
+class RateLimiter:
+    """수신처 하나의 토큰 버킷. 응답의 rate limit 헤더/본문으로 대기 시간을 보정한다.
+
+    stop 이벤트가 있으면 대기 중에도 종료 신호를 받아 Stopped를 던진다.
+    """
+
+    def __init__(self, rate: float, burst: int, stop: threading.Event | None = None):
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.stop = stop
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 예약하고, 버킷이 비었거나 서버가 막아둔 시간만큼 대기한다."""
+        if self.stop is not None and self.stop.is_set():
+            raise Stopped("종료 중")
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+        if wait <= 0:
+            return
+        if self.stop is None:
+            time.sleep(wait)
+        elif self.stop.wait(wait):
+            raise Stopped("종료 중")
+
+    def block_for(self, seconds: float):
+        """앞으로 seconds 동안 발송을 멈춘다."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def observe(self, resp) -> float | None:
+        """응답을 반영한다. 429이면 재시도 전 기다릴 초를, 아니면 None을 반환한다.
+
+        Discord의 X-RateLimit-Remaining/Reset-After 헤더와 Telegram/Discord 429 응답의
+        retry_after(본문) 또는 Retry-After(헤더)를 읽는다.
+        """
+        headers = resp.headers if isinstance(getattr(resp, "headers", None), Mapping) else {}
+        try:
+            if float(headers.get("X-RateLimit-Remaining", 1)) <= 0:
+                self.block_for(float(headers.get("X-RateLimit-Reset-After", 0)))
+        except ValueError:
+            pass
+        if resp.status_code != 429:
+            return None
+        retry_after = self._retry_after(resp, headers)
+        self.block_for(retry_after)
+        return retry_after
+
+    @staticmethod
+    def _retry_after(resp, headers) -> float:
+        try:
+            body = resp.json()
+            # Telegram: {"parameters": {"retry_after": 초}}, Discord: {"retry_after": 초}
+            value = (body.get("parameters") or {}).get("retry_after", body.get("retry_after"))
+            if value is not None:
+                return float(value)
+        except (ValueError, AttributeError, TypeError):
+            pass
+        try:
+            return float(headers.get("Retry-After", 1))
+        except ValueError:
+            return 1.0
+
+
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+def json_bytes(obj) -> bytes:
+    """요청 본문용 JSON 직렬화 (한글을 \\u 이스케이프하지 않은 UTF-8)."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def post_with_limit(session: requests.Session, limiter: RateLimiter, url: str,
+                    body: bytes, label: str, attempts: int = 3):
+    """미리 직렬화한 JSON 본문을 limiter 순서에 맞춰 POST하고, 429를 받으면 서버가 알려준 시간만큼 기다려 다시 보낸다."""
+    for attempt in range(1, attempts + 1):
+        limiter.acquire()
+        resp = session.post(url, data=body, headers=JSON_HEADERS, timeout=10)
+        retry_after = limiter.observe(resp)
+        if retry_after is None:
+            return resp
+        logger.warning("%s 429 응답, %.1f초 후 재시도 (%d/%d)", label, retry_after, attempt, attempts)
+    return resp
+
+
+class DeliveryError(Exception):
+    """send()에서 일부 메시지가 실패했다. 나머지 메시지를 모두 시도한 뒤에 던진다."""
+
+    def __init__(self, label: str, failed: int, total: int):
+        super().__init__(f"{label} {failed}/{total}건 발송 실패")
+        self.failed = failed
+        self.total = total
+
+
+# ── 메시지 렌더링 ───────────────────────────────────────────
+
+
+class MessageTemplate:
+    """str.format 문법({title} 등 Announcement 필드)의 템플릿.
+
+    만들 때 한 번 파싱해 %-서식 문자열과 필드 getter로 바꿔 두므로, render는 서식 한 번만 적용한다.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        parts, fields = [], []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            parts.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if field not in Announcement.FIELDS or spec or conversion:
+                raise ValueError(f"템플릿에 쓸 수 없는 필드: {{{field}}} (사용 가능: {', '.join(Announcement.FIELDS)})")
+            parts.append("%s")
+            fields.append(field)
+        self._format = "".join(parts)
+        if not fields:
+            self._values = lambda ann: ()
+        elif len(fields) == 1:
+            get = attrgetter(fields[0])
+            self._values = lambda ann: (get(ann),)
+        else:
+            self._values = attrgetter(*fields)
+
+    def render(self, ann: Announcement) -> str:
+        return self._format % self._values(ann)
+
+
+class _Rendered:
+    __slots__ = ("values", "telegram", "telegram_json", "digest", "embed", "embed_json")
+
+    def __init__(self, values: tuple):
+        self.values = values
+        self.telegram = self.telegram_json = self.digest = self.embed = self.embed_json = None
+
+
+class MessageRenderer:
+    """공고의 텔레그램 HTML과 디스코드 Embed를 형식별로 한 번만 만들어 캐시한다.
+
+    캐시 키는 (공고 ID, 템플릿 버전)이며 같은 ID라도 내용이 바뀌었으면 다시 만든다. 여러 채널과 수신처가 같은
+    공고를 보낼 때 문자열, Embed, 미리 직렬화한 JSON 조각을 그대로 재사용한다. Embed의 timestamp는 처음 만든
+    시각으로 고정된다. 반환된 dict는 공유되므로 고쳐 쓰면 안 된다.
+    """
+
+    TELEGRAM = (
+        "🏠 <b>LH 임대주택 새 공고</b>\n\n"
+        "📋 <b>{title}</b>\n"
+        "🏷 유형: {rental_type}\n"
+        "🟢 상태: {status}\n"
+        "📅 공고일: {reg_date}\n"
+        "📆 접수: {rcpt_begin} ~ {rcpt_end}\n\n"
+        "🔗 <a href=\"{url}\">공고 상세보기</a>"
+    )
+    DISCORD_TITLE = "🏠 {title}"
+    DISCORD_FOOTER = "LH 임대주택 공고 모니터링"
+    DIGEST_TITLE_CHARS = 300
+    MAX_ENTRIES = 2048
+
+    def __init__(self, telegram: str = "", discord_title: str = "", discord_footer: str = "",
+                 max_entries: int = MAX_ENTRIES):
+        sources = {
+            "telegram": telegram or self.TELEGRAM,
+            "discord_title": discord_title or self.DISCORD_TITLE,
+            "discord_footer": discord_footer or self.DISCORD_FOOTER,
+        }
+        self.version = hashlib.sha1(json_bytes(sorted(sources.items()))).hexdigest()[:12]
+        self._telegram = MessageTemplate(sources["telegram"])
+        self._discord_title = MessageTemplate(sources["discord_title"])
+        self._discord_footer = MessageTemplate(sources["discord_footer"])
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache: dict[tuple[str, str], _Rendered] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def load(cls, path: str) -> "MessageRenderer":
+        """템플릿 파일(JSON 객체: telegram, discord_title, discord_footer)을 읽는다. 빠진 항목은 기본 템플릿."""
+        with open(path, "r", encoding="utf-8") as f:
+            templates = json.load(f)
+        return cls(**{k: templates.get(k, "") for k in ("telegram", "discord_title", "discord_footer")})
+
+    def _get(self, ann, slot: str, build):
+        ann = Announcement.of(ann)
+        key = (ann.id, self.version)
+        values = ann._values(ann)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry.values != values:
+                entry = self._cache[key] = _Rendered(values)
+                if len(self._cache) > self.max_entries:
+                    del self._cache[next(iter(self._cache))]
+            value = getattr(entry, slot)
+            if value is None:
+                self.misses += 1
+                value = build(ann)
+                setattr(entry, slot, value)
+            else:
+                self.hits += 1
+            return value
+
+    def telegram(self, ann) -> str:
+        """공고 하나의 개별 알림 메시지 (HTML)."""
+        return self._get(ann, "telegram", self._telegram.render)
+
+    def telegram_json(self, ann) -> bytes:
+        """telegram()을 JSON 문자열로 직렬화한 조각."""
+        return self._get(ann, "telegram_json", lambda a: json_bytes(self.telegram(a)))
+
+    def digest_block(self, ann) -> str:
+        """묶음 메시지에 들어갈 공고 한 건. 태그가 블록 안에서 닫히므로 블록 경계에서 자르면 안전하다."""
+        return self._get(ann, "digest", self._build_digest_block)
+
+    def embed(self, ann) -> dict:
+        """공고 하나의 디스코드 Embed."""
+        return self._get(ann, "embed", self._build_embed)
+
+    def embed_json(self, ann) -> bytes:
+        """embed()를 JSON으로 직렬화한 조각."""
+        return self._get(ann, "embed_json", lambda a: json_bytes(self.embed(a)))
+
+    def _build_digest_block(self, ann: Announcement) -> str:
+        title = ann.title
+        if len(title) > self.DIGEST_TITLE_CHARS:
+            title = title[:self.DIGEST_TITLE_CHARS - 1] + "…"
+        return (
+            f"📋 <b>{title}</b>\n"
+            f"🏷 {ann.rental_type or '-'} · 🟢 {ann.status or '-'}\n"
+            f"📆 접수: {ann.rcpt_begin} ~ {ann.rcpt_end}\n"
+            f"🔗 <a href=\"{ann.url}\">공고 상세보기</a>"
+        )
+
+    def _build_embed(self, ann: Announcement) -> dict:
+        return {
+            "title": self._discord_title.render(ann),
+            "url": ann.url,
+            "color": DiscordNotifier._get_color(ann.status),
+            "fields": [
+                {"name": "🏷 임대유형", "value": ann.rental_type or "-", "inline": True},
+                {"name": "🟢 상태", "value": ann.status or "-", "inline": True},
+                {"name": "📅 공고일", "value": ann.reg_date or "-", "inline": True},
+                {"name": "📆 접수기간", "value": f"{ann.rcpt_begin} ~ {ann.rcpt_end}", "inline": False},
+            ],
+            "footer": {"text": self._discord_footer.render(ann)},
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"캐시 {len(self._cache)}건, 재사용 {self.hits}/{total}회 ({rate:.0f}%), 템플릿 {self.version}"
+
+
 # ── TelegramNotifier ────────────────────────────────────────
 
 
@@ -293,47 +1699,118 @@ class TelegramNotifier:
     """Telegram Bot API를 통해 알림 메시지를 발송한다."""
 
     API_URL = "https://api.telegram.org/bot{}/sendMessage"
-
-    def __init__(self, token: str, chat_id: str):
+    # 같은 채팅방에는 초당 1건 정도가 안전하다
+    RATE = 1.0
+    BURST = 3
+    # 메시지 길이 한도 (UTF-16 코드 단위)와 묶음 메시지 머리말용 여유분
+    MAX_MESSAGE_CHARS = 4096
+    DIGEST_HEADER_RESERVE = 64
+
+    def __init__(self, token: str, chat_id: str, session: requests.Session | None = None,
+                 digest_threshold: int = 0, renderer: MessageRenderer | None = None,
+                 stop: threading.Event | None = None):
         self.token = token
         self.chat_id = chat_id
         self.enabled = bool(token and chat_id)
-
-    def send(self, announcements: list[dict]):
-        """공고별 개별 HTML 메시지를 발송한다."""
+        self.digest_threshold = digest_threshold
+        self.session = session or build_notifier_session()
+        self.limiter = RateLimiter(self.RATE, self.BURST, stop)
+        self.renderer = renderer or MessageRenderer()
+        self._chat_id_json = json_bytes(chat_id)
+
+    def _post(self, text: str):
+        return self._post_json(json_bytes(text))
+
+    def _post_json(self, text_json: bytes):
+        """JSON으로 직렬화된 메시지 조각을 그대로 본문에 끼워 보낸다."""
+        body = b'{"chat_id":%s,"text":%s,"parse_mode":"HTML"}' % (self._chat_id_json, text_json)
+        return post_with_limit(self.session, self.limiter, self.API_URL.format(self.token), body, "TG")
+
+    def send(self, announcements: list[Announcement]):
+        """공고별 개별 HTML 메시지를 발송한다.
+
+        digest_threshold(0이면 끔)보다 공고가 많으면 4096자 한도 안에서 최소 개수의 묶음 메시지로 보낸다.
+        실패한 메시지(예외 또는 200이 아닌 응답)가 있으면 나머지를 모두 보낸 뒤 DeliveryError를 던진다.
+        """
         if not self.enabled:
             return
+        announcements = [Announcement.of(a) for a in announcements]
+        if self.digest_threshold and len(announcements) > self.digest_threshold:
+            self._send_digest(announcements)
+            return
+        failed = 0
         for ann in announcements:
-            msg = (
-                f"🏠 <b>LH 임대주택 새 공고</b>\n\n"
-                f"📋 <b>{ann.get('title', '')}</b>\n"
-                f"🏷 유형: {ann.get('rental_type', '')}\n"
-                f"🟢 상태: {ann.get('status', '')}\n"
-                f"📅 공고일: {ann.get('reg_date', '')}\n"
-                f"📆 접수: {ann.get('rcpt_begin', '')} ~ {ann.get('rcpt_end', '')}\n\n"
-                f"🔗 <a href=\"{ann.get('url', '')}\">공고 상세보기</a>"
-            )
             try:
-                requests.post(
-                    self.API_URL.format(self.token),
-                    json={"chat_id": self.chat_id, "text": msg, "parse_mode": "HTML"},
-                    timeout=10,
-                )
-                logger.info("TG ✅ %s...", ann.get("title", "")[:20])
+                resp = self._post_json(self.renderer.telegram_json(ann))
             except Exception as e:
+                failed += 1
                 logger.warning("TG 발송 실패: %s", e)
-            time.sleep(0.5)
+                continue
+            if resp.status_code == 200:
+                logger.info("TG ✅ %s...", ann.title[:20])
+            else:
+                failed += 1
+                logger.warning("TG 응답 코드 %d: %s...", resp.status_code, ann.title[:20])
+        if failed:
+            raise DeliveryError("TG", failed, len(announcements))
+
+    def _digest_block(self, ann: Announcement) -> str:
+        """묶음 메시지에 들어갈 공고 한 건."""
+        return self.renderer.digest_block(ann)
+
+    @staticmethod
+    def _tg_len(text: str) -> int:
+        """Telegram이 세는 길이 (UTF-16 코드 단위)."""
+        return len(text.encode("utf-16-le")) // 2
+
+    def _digest_messages(self, announcements: list[Announcement]) -> list[str]:
+        """공고 블록을 순서대로 채워 넣어 한도 이하의 메시지 목록을 만든다."""
+        limit = self.MAX_MESSAGE_CHARS - self.DIGEST_HEADER_RESERVE
+        chunks, current, size = [], [], 0
+        for ann in announcements:
+            block = self._digest_block(ann)
+            block_len = self._tg_len(block) + 2  # 블록 사이 빈 줄
+            if current and size + block_len > limit:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(block)
+            size += block_len
+        if current:
+            chunks.append(current)
+
+        total = len(announcements)
+        messages = []
+        for i, blocks in enumerate(chunks, 1):
+            page = f" ({i}/{len(chunks)})" if len(chunks) > 1 else ""
+            header = f"🏠 <b>LH 임대주택 새 공고 {total}건</b>{page}"
+            messages.append(header + "\n\n" + "\n\n".join(blocks))
+        return messages
+
+    def _send_digest(self, announcements: list[Announcement]):
+        """공고를 묶음 메시지로 발송한다."""
+        messages = self._digest_messages(announcements)
+        failed = 0
+        for i, msg in enumerate(messages, 1):
+            try:
+                resp = self._post(msg)
+            except Exception as e:
+                failed += 1
+                logger.warning("TG 묶음 발송 실패: %s", e)
+                continue
+            if resp.status_code == 200:
+                logger.info("TG ✅ 묶음 %d/%d (공고 %d건)", i, len(messages), len(announcements))
+            else:
+                failed += 1
+                logger.warning("TG 묶음 %d/%d 응답 코드 %d", i, len(messages), resp.status_code)
+        if failed:
+            raise DeliveryError("TG 묶음", failed, len(messages))
 
     def send_text(self, text: str):
         """텍스트를 직접 발송한다."""
         if not self.enabled:
             return
         try:
-            requests.post(
-                self.API_URL.format(self.token),
-                json={"chat_id": self.chat_id, "text": text, "parse_mode": "HTML"},
-                timeout=10,
-            )
+            self._post(text)
         except Exception as e:
             logger.warning("TG 텍스트 발송 실패: %s", e)
 
@@ -344,9 +1821,29 @@ class TelegramNotifier:
 class DiscordNotifier:
     """Discord Webhook을 통해 Embed 형식 알림을 발송한다."""
 
-    def __init__(self, webhook_url: str):
+    # 웹훅당 2초에 5건
+    RATE = 2.5
+    BURST = 5
+    # 웹훅 메시지 하나에 담을 수 있는 Embed 수와 Embed 전체 글자 수 한도
+    MAX_EMBEDS = 10
+    MAX_EMBED_CHARS = 6000
+
+    def __init__(self, webhook_url: str, session: requests.Session | None = None, batch_size: int = MAX_EMBEDS,
+                 renderer: MessageRenderer | None = None, stop: threading.Event | None = None):
         self.webhook_url = webhook_url
         self.enabled = bool(webhook_url)
+        self.batch_size = max(1, min(batch_size, self.MAX_EMBEDS))
+        self.session = session or build_notifier_session()
+        self.limiter = RateLimiter(self.RATE, self.BURST, stop)
+        self.renderer = renderer or MessageRenderer()
+
+    def _post(self, embeds: list[dict]):
+        return self._post_json([json_bytes(embed) for embed in embeds])
+
+    def _post_json(self, embeds_json: list[bytes]):
+        """JSON으로 직렬화된 Embed 조각들을 이어 붙여 보낸다."""
+        body = b'{"embeds":[' + b",".join(embeds_json) + b"]}"
+        return post_with_limit(self.session, self.limiter, self.webhook_url, body, "DC")
 
     @staticmethod
     def _get_color(status: str) -> int:
@@ -359,77 +1856,262 @@ class DiscordNotifier:
             return 0xFF0000
         return 0x808080
 
-    def send(self, announcements: list[dict]):
-        """공고별 Embed를 발송한다."""
+    def _build_embed(self, ann: Announcement) -> dict:
+        """공고 하나의 Embed (렌더러 캐시에서 공유되므로 고쳐 쓰지 않는다)."""
+        return self.renderer.embed(ann)
+
+    @staticmethod
+    def _embed_chars(embed: dict) -> int:
+        """Discord가 6000자 한도에 세는 글자 수 (title, description, field, footer, author)."""
+        total = len(embed.get("title", "")) + len(embed.get("description", ""))
+        total += sum(len(f.get("name", "")) + len(f.get("value", "")) for f in embed.get("fields", []))
+        total += len(embed.get("footer", {}).get("text", ""))
+        total += len(embed.get("author", {}).get("name", ""))
+        return total
+
+    def _batches(self, items: list[tuple[Announcement, dict]]) -> list[list[tuple[Announcement, dict]]]:
+        """(공고, Embed) 목록을 batch_size개·MAX_EMBED_CHARS자 이하 묶음으로 나눈다 (순서 유지)."""
+        batches, current, chars = [], [], 0
+        for ann, embed in items:
+            size = self._embed_chars(embed)
+            if current and (len(current) >= self.batch_size or chars + size > self.MAX_EMBED_CHARS):
+                batches.append(current)
+                current, chars = [], 0
+            current.append((ann, embed))
+            chars += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def send(self, announcements: list[Announcement]):
+        """공고 Embed를 최대 batch_size개씩 묶어 웹훅 메시지로 발송한다.
+
+        실패한 묶음이 있으면 나머지를 모두 보낸 뒤 DeliveryError(실패한 공고 수)를 던진다.
+        """
         if not self.enabled:
             return
-        for ann in announcements:
-            embed = {
-                "title": f"🏠 {ann.get('title', '')}",
-                "url": ann.get("url", ""),
-                "color": self._get_color(ann.get("status", "")),
-                "fields": [
-                    {"name": "🏷 임대유형", "value": ann.get("rental_type", "") or "-", "inline": True},
-                    {"name": "🟢 상태", "value": ann.get("status", "") or "-", "inline": True},
-                    {"name": "📅 공고일", "value": ann.get("reg_date", "") or "-", "inline": True},
-                    {"name": "📆 접수기간", "value": f"{ann.get('rcpt_begin', '')} ~ {ann.get('rcpt_end', '')}", "inline": False},
-                ],
-                "footer": {"text": "LH 임대주택 공고 모니터링"},
-                "timestamp": datetime.now().isoformat(),
-            }
+        announcements = [Announcement.of(a) for a in announcements]
+        failed = 0
+        for batch in self._batches([(ann, self._build_embed(ann)) for ann in announcements]):
             try:
-                resp = requests.post(
-                    self.webhook_url,
-                    json={"embeds": [embed]},
-                    timeout=10,
-                )
+                resp = self._post_json([self.renderer.embed_json(ann) for ann, _ in batch])
                 if resp.status_code in (200, 204):
-                    logger.info("DC ✅ %s...", ann.get("title", "")[:20])
+                    for ann, _ in batch:
+                        logger.info("DC ✅ %s...", ann.title[:20])
                 else:
-                    logger.warning("DC 응답 코드 %d", resp.status_code)
+                    failed += len(batch)
+                    logger.warning("DC 응답 코드 %d (%d건)", resp.status_code, len(batch))
             except Exception as e:
-                logger.warning("DC 발송 실패: %s", e)
-            time.sleep(0.5)
+                failed += len(batch)
+                logger.warning("DC 발송 실패 (%d건): %s", len(batch), e)
+        if failed:
+            raise DeliveryError("DC", failed, len(announcements))
 
     def send_embed(self, embed: dict):
         """Embed를 직접 발송한다."""
         if not self.enabled:
             return
         try:
-            requests.post(
-                self.webhook_url,
-                json={"embeds": [embed]},
-                timeout=10,
-            )
+            self._post([embed])
         except Exception as e:
             logger.warning("DC Embed 발송 실패: %s", e)
 
 
+# ── 수신처 레지스트리 ───────────────────────────────────────
+
+
+class Destination:
+    """알림 수신처 하나 (텔레그램 채팅방 또는 디스코드 웹훅). subscription 구독에 맞는 새 공고를 받는다."""
+
+    KINDS = ("telegram", "discord")
+
+    __slots__ = ("name", "kind", "target", "subscription", "notifier", "failures")
+
+    def __init__(self, name: str, kind: str, target: str, subscription: str = "default"):
+        if kind not in self.KINDS:
+            raise ValueError(f"알 수 없는 수신처 종류: {kind!r} ({name})")
+        self.name = name
+        self.kind = kind
+        self.target = target
+        self.subscription = subscription or "default"
+        self.notifier = None
+        self.failures = 0
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Destination":
+        kind = d.get("type", "telegram")
+        target = d.get("chat_id") if kind == "telegram" else d.get("webhook_url")
+        return cls(d["name"], kind, str(target or ""), d.get("subscription", "default"))
+
+    def __repr__(self):
+        return f"Destination({self.name!r}, {self.kind!r})"
+
+
+class DestinationRegistry:
+    """여러 사용자의 수신처 목록. 수신처마다 notifier(와 RateLimiter)를 따로 두고 HTTP 세션은 함께 쓴다.
+
+    텔레그램 수신처는 모두 같은 봇 토큰(TELEGRAM_BOT_TOKEN)으로 보낸다.
+    """
+
+    def __init__(self, destinations: Iterable[Destination], telegram_token: str = "",
+                 session: requests.Session | None = None, digest_threshold: int = 0,
+                 batch_size: int = DiscordNotifier.MAX_EMBEDS, renderer: MessageRenderer | None = None,
+                 stop: threading.Event | None = None):
+        self.session = session or build_notifier_session()
+        # 모든 수신처가 렌더러 하나를 함께 써서 같은 공고의 메시지를 한 번만 만든다
+        self.renderer = renderer or MessageRenderer()
+        self.destinations: dict[str, Destination] = {}
+        self._by_subscription: dict[str, list[Destination]] = {}
+        for dest in destinations:
+            if dest.name in self.destinations:
+                logger.warning("수신처 이름 중복, 무시: %s", dest.name)
+                continue
+            if dest.kind == "telegram":
+                dest.notifier = TelegramNotifier(telegram_token, dest.target, session=self.session,
+                                                 digest_threshold=digest_threshold, renderer=self.renderer,
+                                                 stop=stop)
+            else:
+                dest.notifier = DiscordNotifier(dest.target, session=self.session, batch_size=batch_size,
+                                                renderer=self.renderer, stop=stop)
+            if not dest.notifier.enabled:
+                logger.warning("수신처 설정이 비어 있어 무시: %s", dest.name)
+                continue
+            self.destinations[dest.name] = dest
+            self._by_subscription.setdefault(dest.subscription, []).append(dest)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "DestinationRegistry":
+        """수신처 설정 파일(JSON 배열)을 읽는다. 항목: name, type(telegram/discord), chat_id 또는 webhook_url, subscription."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls([Destination.from_dict(d) for d in json.load(f)], **kwargs)
+
+    @classmethod
+    def from_db(cls, db: "SQLiteState", **kwargs) -> "DestinationRegistry":
+        """SQLite 상태 DB의 destinations 테이블에서 사용 중인 수신처를 읽는다."""
+        return cls([Destination(*row) for row in db.destinations()], **kwargs)
+
+    def for_subscription(self, name: str) -> list[Destination]:
+        return self._by_subscription.get(name, [])
+
+    @property
+    def subscriptions(self) -> set[str]:
+        return set(self._by_subscription)
+
+    def __len__(self):
+        return len(self.destinations)
+
+
+class DeliveryPool:
+    """수신처별 발송을 크기가 제한된 작업자 풀에서 실행한다.
+
+    수신처 하나의 공고는 작업 하나가 순서대로 보내므로, 느리거나 실패하는 수신처는 작업자 하나만 붙잡고
+    다른 수신처의 발송에는 영향을 주지 않는다. 수신처별 발송 속도는 각 notifier의 RateLimiter가 지킨다.
+    """
+
+    def __init__(self, registry: DestinationRegistry, workers: int = 8):
+        self.registry = registry
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="lh-deliver")
+
+    def deliver(self, routed: dict[str, list[Announcement]]) -> int:
+        """구독별 새 공고를 해당 구독의 수신처들에 보내고 모두 끝날 때까지 기다린다. 성공한 수신처 수를 반환한다."""
+        futures = {
+            self._pool.submit(dest.notifier.send, announcements): dest
+            for name, announcements in routed.items()
+            for dest in self.registry.for_subscription(name)
+        }
+        delivered = 0
+        for fut, dest in futures.items():
+            try:
+                fut.result()
+            except Exception as e:
+                dest.failures += 1
+                logger.warning("수신처 %s 발송 실패 (연속 %d회): %s", dest.name, dest.failures, e)
+                continue
+            dest.failures = 0
+            delivered += 1
+        if futures:
+            logger.info("수신처 발송: %d/%d곳 완료", delivered, len(futures))
+        return delivered
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+
 # ── DailySummary ────────────────────────────────────────────
 
 
 class DailySummary:
-    """하루 동안 발견된 새 공고를 누적하여 일일 요약 리포트를 생성한다."""
+    """하루 동안 발견된 새 공고를 누적하여 일일 요약 리포트를 생성한다.
+
+    공고 추가는 NDJSON 저널에 한 줄씩 덧붙이고, 전체 스냅샷(JSON)은 날짜가 바뀌거나
+    시작 시 저널을 재생한 뒤에만 다시 쓴다. 저널 줄마다 일련번호를 붙이고 스냅샷에 반영한
+    마지막 번호를 함께 기록하므로, 스냅샷을 쓰고 저널을 지우기 전에 죽어도 같은 줄을 두 번 재생하지 않는다.
+    """
 
     def __init__(self, filepath="data/daily_summary.json"):
         self.filepath = filepath
+        self.journal_path = os.path.splitext(filepath)[0] + ".ndjson"
+        self._state = JsonStateFile(filepath)
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         self.data = {"date": "", "announcements": []}
+        self._journal = None
+        self._unsynced = False
+        self._seq = 0
         if os.path.exists(filepath):
             try:
                 with open(filepath, "r", encoding="utf-8") as f:
                     self.data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
+                self.data["announcements"] = [Announcement.of(a) for a in self.data["announcements"]]
+                self._seq = int(self.data.pop("journal_seq", 0))
+            except (json.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError):
                 logger.warning("daily_summary.json 파싱 실패, 초기값으로 대체합니다")
-
-    def add(self, ann: dict):
+                self.data = {"date": "", "announcements": []}
+                self._seq = 0
+        if self._replay():
+            self.save()
+
+    def _replay(self) -> int:
+        """저널에 남은 추가분을 스냅샷 위에 다시 적용하고 적용한 줄 수를 반환한다."""
+        if not os.path.exists(self.journal_path):
+            return 0
+        applied = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    day, ann = entry["date"], Announcement.of(entry["ann"])
+                    seq = int(entry.get("seq", 0))
+                except (json.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError):
+                    # 기록 도중 죽어 잘린 마지막 줄
+                    logger.warning("요약 저널의 손상된 줄을 건너뜁니다")
+                    continue
+                if seq:
+                    if seq <= self._seq:
+                        continue  # 압축 도중 죽어 스냅샷에 이미 반영된 줄
+                    self._seq = seq
+                if day > self.data["date"]:
+                    self.data = {"date": day, "announcements": []}
+                if day == self.data["date"]:
+                    self.data["announcements"].append(ann)
+                    applied += 1
+        return applied
+
+    def add(self, ann: Announcement):
         """새 공고를 추가한다. 날짜가 바뀌면 자동 리셋."""
+        ann = Announcement.of(ann)
         today = date.today().isoformat()
         if self.data["date"] != today:
             self.data["date"] = today
             self.data["announcements"] = []
+            self.save()
         self.data["announcements"].append(ann)
-        self.save()
+        if self._journal is None:
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._seq += 1
+        self._journal.write(json.dumps({"seq": self._seq, "date": today, "ann": ann.to_dict()},
+                                       ensure_ascii=False) + "\n")
+        self._journal.flush()
+        self._unsynced = True
 
     def get_tg_msg(self) -> str | None:
         """Telegram 요약 메시지를 생성한다. 공고가 없으면 None."""
@@ -438,7 +2120,7 @@ class DailySummary:
             return None
         lines = [f"📊 <b>LH 임대주택 일일 요약 ({self.data['date']})</b>\n"]
         for a in anns:
-            lines.append(f"• {a.get('title', '')} [{a.get('rental_type', '')}]")
+            lines.append(f"• {a.title} [{a.rental_type}]")
         lines.append(f"\n총 {len(anns)}건")
         return "\n".join(lines)
 
@@ -447,7 +2129,7 @@ class DailySummary:
         anns = self.data["announcements"]
         if not anns:
             return None
-        desc_lines = [f"• {a.get('title', '')} [{a.get('rental_type', '')}]" for a in anns]
+        desc_lines = [f"• {a.title} [{a.rental_type}]" for a in anns]
         return {
             "title": f"📊 LH 임대주택 일일 요약 ({self.data['date']})",
             "description": "\n".join(desc_lines),
@@ -456,121 +2138,1035 @@ class DailySummary:
             "timestamp": datetime.now().isoformat(),
         }
 
+    def flush(self):
+        """체크 한 번의 추가분을 디스크에 확정한다 (fsync 한 번)."""
+        if self._journal is not None and self._unsynced:
+            os.fsync(self._journal.fileno())
+            self._unsynced = False
+
     def save(self):
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        """스냅샷 전체를 원자적으로 다시 쓰고 저널을 비운다 (압축)."""
+        self._state.write({**self.data, "journal_seq": self._seq})
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._unsynced = False
+
+
+# ── SQLite 저장소 ───────────────────────────────────────────
+
+
+class SQLiteState:
+    """SQLiteStore와 SQLiteSummary가 함께 쓰는 WAL 모드 SQLite 데이터베이스."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS seen (
+            id TEXT PRIMARY KEY,
+            first_seen TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_seen_first_seen ON seen (first_seen);
+        CREATE TABLE IF NOT EXISTS summary (
+            day TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (day, seq)
+        );
+        CREATE TABLE IF NOT EXISTS checks (
+            checked_at TEXT NOT NULL,
+            new_count INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_checks_checked_at ON checks (checked_at);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS destinations (
+            name TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            target TEXT NOT NULL,
+            subscription TEXT NOT NULL DEFAULT 'default',
+            enabled INTEGER NOT NULL DEFAULT 1
+        );
+    """
+
+    def __init__(self, path="data/lh_monitor.db"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.lock = threading.Lock()
+
+    def get_meta(self, key: str, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    @staticmethod
+    def put_meta(cur, key: str, value):
+        cur.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, json.dumps(value, ensure_ascii=False)),
+        )
+
+    def check_history(self, since: str = "") -> list[tuple[str, int]]:
+        """since(ISO) 이후의 (체크 시각, 새 공고 수) 목록."""
+        return self.conn.execute(
+            "SELECT checked_at, new_count FROM checks WHERE checked_at >= ? ORDER BY checked_at",
+            (since,),
+        ).fetchall()
+
+    def destinations(self) -> list[tuple[str, str, str, str]]:
+        """사용 중인 수신처의 (이름, 종류, 대상, 구독) 목록."""
+        return self.conn.execute(
+            "SELECT name, kind, target, subscription FROM destinations WHERE enabled = 1 ORDER BY name"
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+class SQLiteStore(DataStore):
+    """DataStore와 같은 인터페이스의 SQLite 구현. 체크마다 새 ID를 한 트랜잭션으로 기록한다."""
+
+    def __init__(self, db: SQLiteState, retention_days: int = 180, bloom: BloomFilter | None = None):
+        self.db = db
+        self.filepath = db.path
+        self.retention_days = retention_days
+        self.bloom = bloom
+        self._changed = False
+        self.data = db.get_meta("store", {"last_check": None})
+        self.data.setdefault("last_check", None)
+        self.seen = dict(db.conn.execute("SELECT id, first_seen FROM seen ORDER BY first_seen, rowid"))
+        self._frontier = set(self.data.get("frontier", []))
+        self._pending: dict[str, str] = {}
+        self._fill_bloom()
+
+    def mark_seen(self, ann_id: str):
+        """확인한 공고로 기록한다 (다음 저장 시 한꺼번에 INSERT)."""
+        if ann_id in self.seen:
+            return
+        super().mark_seen(ann_id)
+        self._pending[ann_id] = self.seen[ann_id]
+
+    def update_check_time(self):
+        """마지막 체크 시간을 갱신하고, 이번 체크 기록과 함께 저장한다."""
+        self.data["last_check"] = datetime.now().isoformat()
+        self._commit(record_check=True)
+
+    def save(self):
+        self._commit(record_check=False)
+
+    def flush(self, check_time: bool = True):
+        """SQLite는 체크마다 커밋하므로 보류 중인 변경이 없다."""
+
+    def _commit(self, record_check: bool):
+        self.prune()
+        if self.bloom is not None:
+            self.bloom.flush()
+        cutoff = ""
+        if self.retention_days:
+            cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat(timespec="seconds")
+        with self.db.lock, self.db.conn as cur:
+            cur.executemany("INSERT OR IGNORE INTO seen (id, first_seen) VALUES (?, ?)", self._pending.items())
+            if cutoff:
+                cur.execute("DELETE FROM seen WHERE first_seen < ?", (cutoff,))
+            self.db.put_meta(cur, "store", self.data)
+            if record_check:
+                cur.execute("INSERT INTO checks (checked_at, new_count) VALUES (?, ?)",
+                            (self.data["last_check"], len(self._pending)))
+        self._pending = {}
+
+
+class SQLiteSummary(DailySummary):
+    """DailySummary와 같은 인터페이스의 SQLite 구현. add()는 메모리에 쌓고 flush()에서 한 번에 기록한다."""
+
+    def __init__(self, db: SQLiteState):
+        self.db = db
+        self.filepath = db.path
+        row = db.conn.execute("SELECT MAX(day) FROM summary").fetchone()
+        day = row[0] or ""
+        rows = db.conn.execute("SELECT payload FROM summary WHERE day = ? ORDER BY seq", (day,))
+        self.data = {"date": day, "announcements": [Announcement.of(json.loads(r[0])) for r in rows]}
+        self._pending: list[tuple] = []
+
+    def add(self, ann: Announcement):
+        """새 공고를 추가한다. 날짜가 바뀌면 자동 리셋 (이전 날짜 기록은 DB에 남는다)."""
+        ann = Announcement.of(ann)
+        today = date.today().isoformat()
+        if self.data["date"] != today:
+            self.data["date"] = today
+            self.data["announcements"] = []
+        self.data["announcements"].append(ann)
+        self._pending.append((today, len(self.data["announcements"]), ann.id,
+                              json.dumps(ann.to_dict(), ensure_ascii=False)))
+
+    def flush(self):
+        """쌓인 공고를 한 트랜잭션으로 기록한다."""
+        if not self._pending:
+            return
+        with self.db.lock, self.db.conn as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO summary (day, seq, id, payload) VALUES (?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def save(self):
+        self.flush()
+
+
+def import_json_state(db: SQLiteState, seen_path: str, summary_path: str) -> tuple[int, int]:
+    """기존 seen.json / daily_summary.json 내용을 SQLite로 한 번 옮긴다.
+
+    이미 가져온 적이 있으면 아무것도 하지 않는다. (seen ID 수, 요약 공고 수)를 반환한다.
+    """
+    if db.get_meta("imported_json"):
+        return 0, 0
+    seen_count = summary_count = 0
+    if os.path.exists(seen_path):
+        legacy = DataStore(seen_path)
+        with db.lock, db.conn as cur:
+            cur.executemany("INSERT OR IGNORE INTO seen (id, first_seen) VALUES (?, ?)", legacy.seen.items())
+            db.put_meta(cur, "store", legacy.data)
+        seen_count = len(legacy.seen)
+    if os.path.exists(summary_path):
+        legacy_summary = DailySummary(summary_path)
+        day = legacy_summary.data.get("date", "")
+        rows = [(day, i, a.id, json.dumps(a.to_dict(), ensure_ascii=False))
+                for i, a in enumerate(legacy_summary.data.get("announcements", []), 1)]
+        with db.lock, db.conn as cur:
+            cur.executemany("INSERT OR IGNORE INTO summary (day, seq, id, payload) VALUES (?, ?, ?, ?)", rows)
+        summary_count = len(rows)
+    with db.lock, db.conn as cur:
+        db.put_meta(cur, "imported_json", True)
+    if seen_count or summary_count:
+        logger.info("JSON 상태 이관 완료: seen %d건, 요약 %d건", seen_count, summary_count)
+    return seen_count, summary_count
+
+
+# ── PollSchedule ────────────────────────────────────────────
+
+
+class PollSchedule:
+    """새 공고가 처음 확인된 시각 기록으로 요일·시간대별 폴링 간격을 정한다.
+
+    일주일을 168칸(요일 × 시)으로 나누고 칸마다 새 공고가 나온 날의 수를 센다 (첫 실행이나
+    이관처럼 한꺼번에 기록된 ID는 한 번으로 센다). 고정 간격 interval과 같은 주간 요청 수 안에서
+    기대 탐지 지연이 가장 작도록 칸별 간격을 발생 비중의 제곱근에 반비례하게 나누고,
+    min_interval~max_interval로 자른다. 기록이 MIN_EVENTS보다 적으면 고정 간격을 쓴다.
+    """
+
+    SLOTS = 7 * 24
+    SLOT_SECONDS = 3600
+    MIN_EVENTS = 20
+    # 기록이 없는 칸에도 주는 가상 발생 수 (한 번도 안 나온 시간대도 완전히 버리지 않는다)
+    PRIOR = 0.25
+
+    def __init__(self, interval: float, min_interval: float = 300, max_interval: float = 7200,
+                 jitter: float = 0.1, rng: random.Random | None = None):
+        self.interval = float(interval)
+        self.min_interval = min(float(min_interval), self.interval)
+        self.max_interval = max(float(max_interval), self.interval)
+        self.jitter = max(0.0, min(jitter, 0.5))
+        self.rng = rng or random.Random()
+        self.weights = [1.0 / self.SLOTS] * self.SLOTS
+        self.intervals = [self.interval] * self.SLOTS
+        self.events = 0
+
+    @property
+    def learned(self) -> bool:
+        return self.events >= self.MIN_EVENTS
+
+    @classmethod
+    def _slot(cls, dt: datetime) -> int:
+        return dt.weekday() * 24 + dt.hour
+
+    def learn(self, first_seen: Iterable[str]):
+        """first_seen ISO 시각들로 칸별 발생 비중과 간격을 다시 계산한다."""
+        days = [set() for _ in range(self.SLOTS)]
+        for ts in first_seen:
+            try:
+                dt = datetime.fromisoformat(ts)
+            except (TypeError, ValueError):
+                continue
+            days[self._slot(dt)].add(dt.date())
+        counts = [len(d) for d in days]
+        self.events = sum(counts)
+        if not self.learned:
+            self.weights = [1.0 / self.SLOTS] * self.SLOTS
+            self.intervals = [self.interval] * self.SLOTS
+            return
+        total = self.events + self.PRIOR * self.SLOTS
+        self.weights = [(c + self.PRIOR) / total for c in counts]
+        self.intervals = self._allocate(self.interval)
+
+    def _allocate(self, interval: float) -> list[float]:
+        """주간 요청 수가 고정 간격 interval과 같아지도록 칸별 간격 c/√w를 이분 탐색으로 맞춘다."""
+        budget = self.SLOTS * self.SLOT_SECONDS / interval
+        roots = [math.sqrt(w) for w in self.weights]
+
+        def intervals(c):
+            return [min(self.max_interval, max(self.min_interval, c / r)) for r in roots]
+
+        lo, hi = 1e-6, 1e9
+        for _ in range(100):
+            mid = math.sqrt(lo * hi)
+            requests = sum(self.SLOT_SECONDS / i for i in intervals(mid))
+            if requests > budget:
+                lo = mid
+            else:
+                hi = mid
+        return intervals(hi)
+
+    def expected_latency(self, intervals: list[float] | None = None) -> float:
+        """공고가 칸별 비중대로 나온다고 할 때의 기대 탐지 지연 (초, 간격의 절반의 가중 평균)."""
+        intervals = intervals or self.intervals
+        return sum(w * i / 2 for w, i in zip(self.weights, intervals))
+
+    def requests_per_day(self, intervals: list[float] | None = None) -> float:
+        intervals = intervals or self.intervals
+        return sum(self.SLOT_SECONDS / i for i in intervals) / 7
+
+    def tradeoff(self, factors=(0.5, 1, 2, 4)) -> list[tuple[float, float, float]]:
+        """요청 예산을 고정 간격의 factor배로 바꿨을 때의 (하루 요청 수, 기대 지연, 고정 간격의 기대 지연)."""
+        rows = []
+        for f in factors:
+            intervals = self._allocate(self.interval / f) if self.learned else [self.interval / f] * self.SLOTS
+            rows.append((self.requests_per_day(intervals), self.expected_latency(intervals), self.interval / f / 2))
+        return rows
+
+    def report(self) -> str:
+        if not self.learned:
+            return "기록 %d건으로는 부족, 고정 간격 %d초" % (self.events, self.interval)
+        return " / ".join(
+            "하루 %.0f회 → 예상 지연 %.1f분 (고정 %.1f분)" % (n, lat / 60, fixed / 60)
+            for n, lat, fixed in self.tradeoff()
+        )
+
+    def next_delay(self, now: datetime) -> float:
+        """다음 체크까지 기다릴 초. 다음 칸이 더 촘촘하면 그 칸 시작 직후로 당기고 지터를 더한다."""
+        slot = self._slot(now)
+        delay = self.intervals[slot]
+        until_next = self.SLOT_SECONDS - (now.minute * 60 + now.second)
+        delay = min(delay, until_next + self.intervals[(slot + 1) % self.SLOTS])
+        if self.jitter:
+            delay *= 1 + self.rng.uniform(-self.jitter, self.jitter)
+        return max(1.0, delay)
+
+
+# ── Scheduler ───────────────────────────────────────────────
+
+
+class _Job:
+    __slots__ = ("name", "fn", "interval", "next_time", "retry")
+
+    def __init__(self, name, fn, interval=None, next_time=None, retry=None):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.next_time = next_time
+        self.retry = retry
+
+
+class Scheduler:
+    """time.monotonic 기준 힙(우선순위 큐)으로 여러 작업을 각자의 일정에 맞춰 실행한다.
+
+    반복 작업은 직전 '예정' 시각에 간격을 더해 다음 시각을 잡으므로 작업 시간만큼 주기가 밀리지 않는다.
+    놓친 회차는 몰아서 실행하지 않는다: 예정 시각이 지난 작업은 한 번만 실행하고 다음 회차는 주기에 맞춘다. 벽시계 작업(매일 21시 등)은 next_time(now)이
+    돌려준 datetime까지의 시간으로 잡는다. monotonic 시계는 절전 중에 멈추므로 벽시계와의 차이가
+    벌어지면 그만큼 예정 시각을 앞당겨, 복귀 직후 놓친 작업을 실행한다.
+    """
+
+    # 절전 복귀나 시계 변경을 이 시간 안에 알아차린다
+    MAX_SLEEP = 60.0
+    CLOCK_SKEW = 5.0
+
+    def __init__(self):
+        self._heap: list[tuple] = []
+        self._seq = itertools.count()
+        self._offset = self._clock_offset()
+
+    @staticmethod
+    def _clock_offset() -> float:
+        return time.time() - time.monotonic()
+
+    def _push(self, due: float, job: _Job):
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+
+    def every(self, name: str, fn, interval, first: float | None = None, retry: float | None = None):
+        """interval(초, 또는 초를 돌려주는 함수)마다 fn을 실행한다.
+
+        first는 첫 실행까지의 초(기본은 간격 하나), retry는 실패 시 다시 시도할 때까지의 초다.
+        """
+        job = _Job(name, fn, interval=interval, retry=retry)
+        self._push(time.monotonic() + (self._interval(job) if first is None else first), job)
+
+    def at(self, name: str, fn, next_time, first: datetime | None = None):
+        """next_time(now)이 돌려주는 벽시계 시각마다 fn을 실행한다. first가 있으면 첫 실행 시각."""
+        job = _Job(name, fn, next_time=next_time)
+        now = datetime.now()
+        self._push(time.monotonic() + max(0.0, ((first or next_time(now)) - now).total_seconds()), job)
+
+    @staticmethod
+    def _interval(job: _Job) -> float:
+        return job.interval() if callable(job.interval) else job.interval
+
+    def _next_due(self, job: _Job, due: float) -> float:
+        now = time.monotonic()
+        if job.next_time is not None:
+            wall = datetime.now()
+            return now + max(0.0, (job.next_time(wall) - wall).total_seconds())
+        interval = self._interval(job)
+        nxt = due + interval
+        if nxt <= now:
+            # 늦게 실행된 이번 회차가 놓친 회차를 대신하고, 다음 회차는 원래 주기에 맞춘다
+            missed = int((now - due) // interval)
+            logger.warning("⏰ %s: %d회 놓침, 다음 회차는 주기에 맞춰 실행합니다", job.name, missed)
+            nxt = due + (missed + 1) * interval
+        return nxt
+
+    def _check_clock(self):
+        """벽시계가 monotonic보다 크게 앞서 가면(절전 복귀) 그만큼 모든 예정 시각을 앞당긴다."""
+        offset = self._clock_offset()
+        jump, self._offset = offset - self._offset, offset
+        if abs(jump) <= self.CLOCK_SKEW:
+            return
+        now = time.monotonic()
+        wall = datetime.now()
+        heap = []
+        for due, seq, job in self._heap:
+            if job.next_time is not None:
+                due = now + max(0.0, (job.next_time(wall - timedelta(seconds=max(0.0, jump))) - wall).total_seconds())
+            elif jump > 0:
+                due -= jump
+            heap.append((due, seq, job))
+        heapq.heapify(heap)
+        self._heap = heap
+        logger.warning("⏰ 시계가 %.0f초 건너뜀 (절전 복귀 또는 시각 변경), 일정을 다시 맞춥니다", jump)
+
+    def run_pending(self) -> float:
+        """예정 시각이 지난 작업을 실행하고, 다음 작업까지 남은 초를 반환한다."""
+        self._check_clock()
+        # 이번 호출 시점까지 예정된 작업만 실행한다 (밀린 작업이 다른 작업과 시계 확인을 막지 않도록)
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            due, _, job = heapq.heappop(self._heap)
+            try:
+                job.fn()
+            except Exception as e:
+                logger.error("%s 작업 실패: %s", job.name, e)
+                if job.retry is not None:
+                    self._push(time.monotonic() + job.retry, job)
+                    continue
+            self._push(self._next_due(job, due), job)
+        if not self._heap:
+            return self.MAX_SLEEP
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def run(self):
+        """작업을 끝없이 실행한다. KeyboardInterrupt는 호출한 쪽으로 전달된다."""
+        while True:
+            time.sleep(min(self.run_pending(), self.MAX_SLEEP))
+
+
+# ── asyncio 실행 모드 ───────────────────────────────────────
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수를 asyncio.Semaphore로 제한하면서 동기 HTTP 함수를 스레드에서 실행한다.
+
+    executor를 주면 그 스레드 풀에서 실행한다 (없으면 이벤트 루프의 기본 실행기).
+    """
+
+    def __init__(self, per_host: int = 2, executor: ThreadPoolExecutor | None = None):
+        self.per_host = max(1, per_host)
+        self.executor = executor
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        return sem
+
+    async def run(self, url: str, fn, *args):
+        async with self.semaphore(url):
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+
+class AsyncLHCrawler:
+    """LHCrawler의 소스를 asyncio 태스크로 동시에 호출한다.
+
+    요청 자체는 LHCrawler의 동기 세션을 스레드에서 쓰므로 health 기록, 조건부 요청, 페이지 순회 등은
+    동기 버전과 같다. 태스크를 취소해도 이미 보낸 요청은 timeout까지 스레드에서 끝나고 결과만 버려진다
+    (종료 시에는 LHMonitor가 그 스레드를 기다리지 않는다).
+    """
+
+    SOURCE_URLS = {"api": LHCrawler.API_URL, "json": LHCrawler.JSON_URL, "html": LHCrawler.HTML_URL}
+
+    def __init__(self, crawler: LHCrawler, hosts: HostLimiter):
+        self.crawler = crawler
+        self.hosts = hosts
+
+    async def fetch_race(self, api_key: str = "", known=None, deadline: float | None = None) -> list[Announcement]:
+        """LHCrawler.fetch_race의 asyncio 버전: 가장 먼저 도착한 유효 결과를 쓰고 나머지 태스크는 취소한다."""
+        crawler = self.crawler
+        sources = crawler._sources(api_key, known, deadline)
+        allowed = set(crawler.health.available(name for name, _ in sources))
+        tasks = {
+            asyncio.create_task(self.hosts.run(self.SOURCE_URLS[name], crawler._call_source, name, fn)): (rank, name)
+            for rank, (name, fn) in enumerate(sources) if name in allowed
+        }
+        first = min((rank for rank, _ in tasks.values()), default=0)
+        started = time.monotonic()
+        try:
+            pending = set(tasks)
+            unchanged = None
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.warning("체크 예산 소진, 동시 수집 중단 (%.1f초)", time.monotonic() - started)
+                    return []
+                for task in sorted(done, key=lambda t: tasks[t][0]):
+                    rank, name = tasks[task]
+                    try:
+                        result = task.result()
+                    except Unchanged as e:
+                        logger.info("동시 수집: %s 소스 변경 없음 (%.1f초)", name, time.monotonic() - started)
+                        if rank == first:
+                            raise
+                        unchanged = unchanged or e
+                        continue
+                    except Exception as e:
+                        logger.warning("%s 소스 실패: %s", name, e)
+                        continue
+                    if result:
+                        logger.info("동시 수집: %s 소스 채택 (%.1f초)", name, time.monotonic() - started)
+                        crawler._adopt(name)
+                        return result
+            if unchanged is not None:
+                raise unchanged
+            logger.error("모든 소스가 실패하거나 빈 결과를 반환했습니다")
+            return []
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class AsyncNotifier:
+    """TelegramNotifier/DiscordNotifier의 asyncio 버전. 같은 호스트로의 동시 발송은 HostLimiter가 제한한다."""
+
+    def __init__(self, notifier, url: str, hosts: HostLimiter):
+        self.notifier = notifier
+        self.url = url
+        self.hosts = hosts
+
+    @property
+    def enabled(self) -> bool:
+        return self.notifier.enabled
+
+    async def send(self, announcements: list[Announcement]):
+        await self.hosts.run(self.url, self.notifier.send, announcements)
+
+    async def send_text(self, text: str):
+        await self.hosts.run(self.url, self.notifier.send_text, text)
+
+    async def send_embed(self, embed: dict):
+        await self.hosts.run(self.url, self.notifier.send_embed, embed)
 
 
 # ── LHMonitor ──────────────────────────────────────────────
 
 
+def _interrupt(signum, frame):
+    """SIGTERM을 KeyboardInterrupt로 바꿔 동기 실행 모드가 같은 종료 경로를 타게 한다."""
+    raise KeyboardInterrupt
+
+
 class LHMonitor:
     """전체 모니터링 루프를 관리하는 오케스트레이터."""
 
+    SUMMARY_HOUR = 21
+    # 종료 시 진행 중인 알림 발송을 기다리는 최대 시간 (초)
+    NOTIFY_DRAIN_TIMEOUT = 30.0
+
     def __init__(self):
         data_dir = os.getenv("DATA_DIR", "./data")
-        self.store = DataStore(os.path.join(data_dir, "seen.json"))
-        self.crawler = LHCrawler()
+        retention_days = int(os.getenv("SEEN_RETENTION_DAYS", "180"))
+        flush_interval = float(os.getenv("STATE_FLUSH_INTERVAL", "300"))
+        self.maintenance_interval = flush_interval or 300.0
+        bloom = None
+        if os.getenv("SEEN_BLOOM", "1") != "0":
+            bloom = BloomFilter(
+                os.path.join(data_dir, "seen.bloom"),
+                fp_rate=float(os.getenv("BLOOM_FP_RATE", "1e-6")),
+                capacity=int(os.getenv("BLOOM_CAPACITY", "10000")),
+            )
+        db = None
+        if os.getenv("STORAGE_BACKEND", "json") == "sqlite":
+            db = SQLiteState(os.path.join(data_dir, "lh_monitor.db"))
+            import_json_state(db, os.path.join(data_dir, "seen.json"),
+                              os.path.join(data_dir, "daily_summary.json"))
+            self.store = SQLiteStore(db, retention_days=retention_days, bloom=bloom)
+            self.summary = SQLiteSummary(db)
+        else:
+            self.store = DataStore(os.path.join(data_dir, "seen.json"), retention_days=retention_days,
+                                   bloom=bloom, flush_interval=flush_interval)
+            self.summary = DailySummary(os.path.join(data_dir, "daily_summary.json"))
+        health = SourceHealth(
+            os.path.join(data_dir, "health.json"),
+            failure_threshold=int(os.getenv("CIRCUIT_FAILURES", "3")),
+            cooldown=float(os.getenv("CIRCUIT_COOLDOWN", "600")),
+            flush_interval=flush_interval,
+        )
+        self.crawler = LHCrawler(
+            max_pages=int(os.getenv("MAX_PAGES", "5")),
+            health=health,
+            stream_html=os.getenv("HTML_STREAM", "0") == "1",
+        )
+        # 두 채널이 연결 풀 하나와 메시지 렌더러 하나를 공유한다
+        http = build_notifier_session()
+        # 종료 시 세워서 rate limit 대기 중인 발송을 바로 끝낸다
+        self._stop = threading.Event()
+        template_file = os.getenv("TEMPLATE_FILE", "")
+        self.renderer = MessageRenderer.load(template_file) if template_file else MessageRenderer()
         self.tg = TelegramNotifier(
             os.getenv("TELEGRAM_BOT_TOKEN", ""),
             os.getenv("TELEGRAM_CHAT_ID", ""),
+            session=http,
+            digest_threshold=int(os.getenv("TG_DIGEST_THRESHOLD", "5")),
+            renderer=self.renderer,
+            stop=self._stop,
+        )
+        self.dc = DiscordNotifier(
+            os.getenv("DISCORD_WEBHOOK_URL", ""),
+            session=http,
+            batch_size=int(os.getenv("DC_BATCH_SIZE", "10")),
+            renderer=self.renderer,
+            stop=self._stop,
         )
-        self.dc = DiscordNotifier(os.getenv("DISCORD_WEBHOOK_URL", ""))
-        self.summary = DailySummary(os.path.join(data_dir, "daily_summary.json"))
+        # 기본 채널 둘과 구독자 수신처 발송을 동시에 돌린다. 채널 안의 순서와 rate limit은 각 notifier가 지킨다.
+        self._notify_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="lh-notify")
         self.api_key = os.getenv("DATA_GO_KR_API_KEY", "")
         self.interval = int(os.getenv("CHECK_INTERVAL", "1800"))
+        self.fetch_mode = os.getenv("FETCH_MODE", "serial")
+        self.poll_deadline = float(os.getenv("POLL_DEADLINE", "0"))
         self.daily_sent_date = ""
-
-    def check_once(self) -> list[dict]:
-        """한 번 체크하여 새 공고를 알림 발송하고 반환한다."""
-        # 데이터 수집 (폴백 전략)
-        if self.api_key:
-            announcements = self.crawler.fetch_api(self.api_key)
-            if not announcements:
-                announcements = self.crawler.fetch_web()
+        self.cache_hits = 0
+        self.schedule = None
+        self._schedule_date = ""
+        self.run_mode = os.getenv("RUN_MODE", "sync")
+        # asyncio 실행 모드의 동기 호출(HTTP, 상태 저장)은 이 풀에서 돌리고, 종료 시 기다리지 않고 버린다
+        self._async_pool = ThreadPoolExecutor(thread_name_prefix="lh-async")
+        hosts = HostLimiter(int(os.getenv("ASYNC_PER_HOST", "2")), executor=self._async_pool)
+        self.acrawler = AsyncLHCrawler(self.crawler, hosts)
+        self.atg = AsyncNotifier(self.tg, TelegramNotifier.API_URL, hosts)
+        self.adc = AsyncNotifier(self.dc, self.dc.webhook_url, hosts)
+        self._inflight: set[asyncio.Task] = set()
+        subscriptions_file = os.getenv("SUBSCRIPTIONS_FILE", "")
+        if subscriptions_file:
+            subscriptions = load_subscriptions(subscriptions_file)
+        else:
+            regions = [r.strip() for r in os.getenv("REGION_FILTER", "부산").split(",")]
+            subscriptions = [Subscription("default", regions=regions)]
+        self.matcher = SubscriptionMatcher(subscriptions)
+        # 구독자별 수신처: 설정 파일이 없으면 SQLite 상태 DB의 destinations 테이블을 쓴다
+        registry_kwargs = dict(
+            telegram_token=self.tg.token, session=http, digest_threshold=self.tg.digest_threshold,
+            batch_size=self.dc.batch_size, renderer=self.renderer, stop=self._stop,
+        )
+        destinations_file = os.getenv("DESTINATIONS_FILE", "")
+        if destinations_file:
+            self.destinations = DestinationRegistry.load(destinations_file, **registry_kwargs)
+        elif db is not None:
+            self.destinations = DestinationRegistry.from_db(db, **registry_kwargs)
         else:
-            announcements = self.crawler.fetch_web()
+            self.destinations = DestinationRegistry((), **registry_kwargs)
+        unknown = self.destinations.subscriptions - {sub.name for sub in subscriptions}
+        if unknown:
+            logger.warning("수신처가 없는 구독을 가리킵니다: %s", ", ".join(sorted(unknown)))
+        self.delivery = DeliveryPool(self.destinations, workers=int(os.getenv("DELIVERY_WORKERS", "8")))
+        # 직전 체크의 구독별 새 공고
+        self.last_matches: dict[str, list[Announcement]] = {}
+        if os.getenv("POLL_SCHEDULE", "fixed") == "adaptive":
+            self.schedule = PollSchedule(
+                self.interval,
+                min_interval=float(os.getenv("POLL_MIN_INTERVAL", "300")),
+                max_interval=float(os.getenv("POLL_MAX_INTERVAL", "7200")),
+                jitter=float(os.getenv("POLL_JITTER", "0.1")),
+            )
+
+    def _collect(self, budget: float = 0) -> list[Announcement]:
+        """폴백 전략(또는 동시 수집)으로 공고를 수집하고, 다음 페이지 수집의 중단 기준을 갱신한다.
+
+        budget(초)이 있으면 전체 폴백 체인이 그 안에 끝나도록 각 요청의 timeout을 줄인다.
+        """
+        known = self.store.is_known
+        deadline = time.monotonic() + budget if budget else None
+        try:
+            if self.fetch_mode == "race":
+                announcements = self.crawler.fetch_race(self.api_key, known=known, deadline=deadline)
+            else:
+                api = lambda: self.crawler.fetch_api(self.api_key, known=known, deadline=deadline)  # noqa: E731
+                web = lambda: self.crawler.fetch_web(known=known, deadline=deadline)  # noqa: E731
+                if self.api_key and self.crawler.health.order(SourceHealth.SOURCES)[0] == "api":
+                    stages = [api, web]
+                else:
+                    # 웹 소스가 더 건강하면 웹 먼저, API는 폴백으로만 사용
+                    stages = [web, api] if self.api_key else [web]
+                announcements = self._fallback(stages)
+        finally:
+            self.crawler.health.save()
+        return self._collected(announcements)
+
+    @staticmethod
+    def _fallback(stages: list) -> list:
+        """수집 단계를 차례로 시도하여 첫 유효 결과를 반환한다.
+
+        첫 단계의 목록이 그대로(Unchanged)면 체크를 끝내고, 폴백 단계의 Unchanged는 기억해 두었다가
+        뒤 단계에서도 유효 결과가 없을 때만 다시 던진다.
+        """
+        unchanged = None
+        for i, stage in enumerate(stages):
+            try:
+                announcements = stage()
+            except Unchanged as e:
+                if i == 0:
+                    raise
+                unchanged = unchanged or e
+                continue
+            if announcements:
+                return announcements
+        if unchanged is not None:
+            raise unchanged
+        return []
+
+    def _collected(self, announcements: list) -> list[Announcement]:
+        """수집 결과를 Announcement로 맞추고 다음 페이지 수집의 중단 기준을 갱신한다."""
+        announcements = [Announcement.of(a) for a in announcements]
+        if announcements:
+            self.store.update_frontier(a.id for a in announcements)
+        return announcements
+
+    def check_once(self, budget: float | None = None) -> list[Announcement]:
+        """한 번 체크하여 새 공고를 알림 발송하고 반환한다.
+
+        budget은 수집 전체에 쓸 수 있는 초 단위 예산이다 (None이면 POLL_DEADLINE, 0이면 무제한).
+        """
+        # 데이터 수집 (폴백 전략). 목록이 직전과 같으면 파싱·중복 검사를 통째로 건너뛴다
+        try:
+            announcements = self._collect(self.poll_deadline if budget is None else budget)
+        except Unchanged as e:
+            return self._unchanged(e)
 
-        # 지역 필터링 (부산)
-        announcements = [a for a in announcements if "부산" in a.get("title", "")]
+        new_list = self._process(announcements)
+        if new_list:
+            self._notify([(self.tg.send, new_list), (self.dc.send, new_list),
+                          (self.delivery.deliver, self.last_matches)])
+        return new_list
+
+    def _unchanged(self, e: Unchanged) -> list:
+        self.cache_hits += 1
+        logger.info("목록 변경 없음 (%s), 체크 생략 [누적 %d회]", e, self.cache_hits)
+        self.store.update_check_time()
+        return []
 
-        # 중복 필터링
+    def _process(self, announcements: list[Announcement]) -> list[Announcement]:
+        """구독 필터와 중복 검사를 거친 새 공고를 기록하고 반환한다."""
+        # 구독 필터링 + 중복 필터링: 하나 이상의 구독에 맞는 새 공고만 남기고 구독별로도 모아 둔다
+        # (기본 구독은 제목에 "부산")
         new_list = []
+        routed: dict[str, list[Announcement]] = {}
         for ann in announcements:
-            if self.store.is_new(ann["id"]):
+            subscribers = self.matcher.match(ann)
+            if subscribers and self.store.is_new(ann.id):
                 new_list.append(ann)
-                self.store.mark_seen(ann["id"])
+                self.store.mark_seen(ann.id)
                 self.summary.add(ann)
+                for sub in subscribers:
+                    routed.setdefault(sub.name, []).append(ann)
+        self.last_matches = routed
 
         self.store.update_check_time()
+        self.summary.flush()
+        self.crawler.commit_fingerprints()
 
         if new_list:
-            logger.info("🆕 새 공고 %d건!", len(new_list))
-            self.tg.send(new_list)
-            self.dc.send(new_list)
+            logger.info("🆕 새 공고 %d건! (구독 %d곳)", len(new_list), len(self.last_matches))
         else:
             logger.info("새 공고 없음")
+        return new_list
 
+    async def check_once_async(self) -> list[Announcement]:
+        """check_once의 asyncio 버전. 소스를 동시에 수집하고, 알림은 다음 체크를 막지 않도록 백그라운드로 보낸다."""
+        deadline = time.monotonic() + self.poll_deadline if self.poll_deadline else None
+        try:
+            try:
+                announcements = await self.acrawler.fetch_race(self.api_key, known=self.store.is_known,
+                                                               deadline=deadline)
+            finally:
+                await self._in_thread(self.crawler.health.save)
+        except Unchanged as e:
+            return await self._in_thread(self._unchanged, e)
+
+        # 상태 저장과 저널 fsync가 이벤트 루프를 막지 않도록 스레드에서 처리한다
+        new_list = await self._in_thread(self._process, self._collected(announcements))
+        if new_list:
+            self._spawn(self._notify_async([(self.atg.send, new_list), (self.adc.send, new_list),
+                                            (self._deliver_async, self.last_matches)]))
         return new_list
 
-    def send_daily_summary(self):
-        """일일 요약 리포트를 발송한다."""
+    async def _deliver_async(self, routed: dict[str, list[Announcement]]):
+        await self._in_thread(self.delivery.deliver, routed)
+
+    async def _in_thread(self, fn, *args):
+        """동기 함수를 asyncio 실행 모드 전용 스레드 풀에서 실행한다."""
+        return await asyncio.get_running_loop().run_in_executor(self._async_pool, fn, *args)
+
+    def next_delay(self) -> float:
+        """다음 체크까지 기다릴 초. 적응형 일정은 하루에 한 번 first_seen 기록으로 다시 학습한다."""
+        if self.schedule is None:
+            return self.interval
+        today = date.today().isoformat()
+        if self._schedule_date != today:
+            self.schedule.learn(self.store.seen.values())
+            self._schedule_date = today
+            logger.info("⏱ 폴링 일정 갱신: %s", self.schedule.report())
+        return self.schedule.next_delay(datetime.now())
+
+    def _notify(self, calls: list[tuple]):
+        """(발송 함수, 인자) 목록을 채널별로 동시에 실행하고 모두 끝날 때까지 기다린다."""
+        futures = [self._notify_pool.submit(fn, arg) for fn, arg in calls]
+        for fut in futures:
+            try:
+                fut.result()
+            except Exception as e:
+                logger.warning("알림 채널 오류: %s", e)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """종료 시 기다릴 수 있도록 추적되는 백그라운드 태스크를 만든다."""
+        task = asyncio.create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return task
+
+    async def _notify_async(self, calls: list[tuple]):
+        """(async 발송 함수, 인자) 목록을 동시에 실행한다. 한 채널의 실패가 다른 채널을 막지 않는다."""
+        results = await asyncio.gather(*(fn(arg) for fn, arg in calls), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("알림 채널 오류: %s", result)
+
+    def flush_state(self, final: bool = False):
+        """보류 중인 상태(소스 상태, Bloom 필터 등)를 디스크에 쓴다 (정기 유지보수 작업).
+
+        체크 시간만 바뀐 seen.json은 final(종료 시)일 때만 쓴다.
+        """
+        self.store.flush(check_time=final)
+        self.crawler.health.flush()
+        if self.store.bloom is not None:
+            self.store.bloom.flush()
+
+    def close(self):
+        """진행 중인 알림·배달을 마저 끝내고 보류 중인 상태를 모두 디스크에 쓴다 (종료 시 호출)."""
+        self._notify_pool.shutdown(wait=True)
+        self.delivery.close()
+        self.flush_state(final=True)
+        self.summary.flush()
+
+    def _summary_calls(self, tg, dc) -> list[tuple]:
+        logger.info("🖨 메시지 렌더링: %s", self.renderer.stats())
+        calls = []
         tg_msg = self.summary.get_tg_msg()
         if tg_msg:
-            self.tg.send_text(tg_msg)
+            calls.append((tg.send_text, tg_msg))
         dc_embed = self.summary.get_dc_embed()
         if dc_embed:
-            self.dc.send_embed(dc_embed)
-        self.daily_sent_date = date.today().isoformat()
+            calls.append((dc.send_embed, dc_embed))
+        return calls
+
+    def send_daily_summary(self):
+        """일일 요약 리포트를 발송한다."""
+        self._notify(self._summary_calls(self.tg, self.dc))
+        self.daily_sent_date = self._summary_day(datetime.now())
+        logger.info("일일 요약 발송 완료")
+
+    async def send_daily_summary_async(self):
+        await self._notify_async(self._summary_calls(self.atg, self.adc))
+        self.daily_sent_date = self._summary_day(datetime.now())
         logger.info("일일 요약 발송 완료")
 
     def run(self):
-        """메인 무한 루프."""
+        """메인 무한 루프. RUN_MODE=async이면 asyncio 실행 모드로 돈다."""
+        if self.run_mode == "async":
+            asyncio.run(self.run_async())
+            return
+        if not self._start():
+            return
+
+        # 메인 루프: 체크, 21시 일일 요약, 상태 저장을 각자의 일정으로 실행
+        scheduler = self.build_scheduler()
+        # docker stop 등 SIGTERM도 Ctrl+C처럼 처리해 보류 중인 상태를 저장하고 끝낸다
+        try:
+            previous = signal.signal(signal.SIGTERM, _interrupt)
+        except ValueError:
+            previous = None  # 메인 스레드가 아닌 경우: 신호 처리기를 달 수 없다
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            logger.info("⛔ 종료")
+            self.close()
+            sys.exit(0)
+        finally:
+            if previous is not None:
+                signal.signal(signal.SIGTERM, previous)
+
+    def _start(self) -> bool:
+        """시작 로그를 남기고 첫 체크를 한다 (최초 실행이면 기존 공고를 기록만 한다). 알림 채널이 없으면 False."""
         source = "공공데이터 API + 웹크롤링" if self.api_key else "웹크롤링"
         logger.info("🏠 LH 임대주택 공고 모니터링 봇 시작")
         logger.info("⏱  간격: %d초 (%d분)", self.interval, self.interval // 60)
-        logger.info("📬 TG: %s  DC: %s",
+        logger.info("📬 TG: %s  DC: %s  수신처: %d곳",
                      "✅" if self.tg.enabled else "❌",
-                     "✅" if self.dc.enabled else "❌")
+                     "✅" if self.dc.enabled else "❌",
+                     len(self.destinations))
         logger.info("🔑 방식: %s", source)
+        logger.info("🩺 소스 상태: %s", self.crawler.health.report())
+        if self.store.bloom is not None:
+            logger.info("🧮 장기 중복 필터: %s", self.store.bloom.stats())
 
-        if not self.tg.enabled and not self.dc.enabled:
+        if not self.tg.enabled and not self.dc.enabled and not self.destinations:
             logger.error("알림 채널이 하나도 설정되지 않았습니다. 종료합니다.")
             sys.exit(1)
-            return
+            return False
 
         # 최초 실행 판단
         if not self.store.data.get("last_check"):
             logger.info("최초 실행: 기존 공고를 기록합니다 (알림 미발송)")
-            if self.api_key:
-                anns = self.crawler.fetch_api(self.api_key)
-                if not anns:
-                    anns = self.crawler.fetch_web()
-            else:
-                anns = self.crawler.fetch_web()
-            anns = [a for a in anns if "부산" in a.get("title", "")]
+            anns = self._collect(self.poll_deadline)
+            anns = self.matcher.select(anns)
             for ann in anns:
-                self.store.mark_seen(ann["id"])
+                self.store.mark_seen(ann.id)
             self.store.update_check_time()
+            self.crawler.commit_fingerprints()
             logger.info("기존 공고 %d건 기록 완료", len(anns))
         else:
             self.check_once()
+        return True
+
+    async def run_async(self):
+        """asyncio 실행 모드. 체크, 일일 요약, 상태 저장을 각각의 태스크로 돌린다.
+
+        알림은 백그라운드 태스크로 보내므로 느린 채널이 다음 체크를 막지 않는다. SIGINT/SIGTERM을 받으면
+        태스크를 취소하고, 진행 중인 알림을 NOTIFY_DRAIN_TIMEOUT까지 기다린 뒤 상태를 저장하고 끝낸다.
+        """
+        if not self._start():
+            return
+        loop = asyncio.get_running_loop()
+        main = asyncio.current_task()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, main.cancel)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass  # Windows 또는 메인 스레드가 아닌 경우: KeyboardInterrupt로 취소된다
+        tasks = [
+            asyncio.create_task(self._poll_loop(), name="체크"),
+            asyncio.create_task(self._summary_loop(), name="일일 요약"),
+            asyncio.create_task(self._maintenance_loop(), name="상태 저장"),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            logger.info("⛔ 종료")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._inflight:
+                _, pending = await asyncio.wait(set(self._inflight), timeout=self.NOTIFY_DRAIN_TIMEOUT)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    logger.warning("종료 대기 시간 초과, 알림 %d건 취소", len(pending))
+            # 남은 스레드 작업은 기다리지 않는다: rate limit 대기는 깨우고, 아직 시작하지 않은 호출은 버린다
+            self._stop.set()
+            self._async_pool.shutdown(wait=False, cancel_futures=True)
+            self.close()
+
+    async def _poll_loop(self):
+        """직전 예정 시각 + 간격으로 체크한다 (체크 시간만큼 주기가 밀리지 않음). 실패하면 60초 뒤 재시도."""
+        due = time.monotonic() + self.next_delay()
+        while True:
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            try:
+                await self.check_once_async()
+            except Exception as e:
+                logger.error("체크 작업 실패: %s", e)
+                due = time.monotonic() + 60
+                continue
+            due += self.next_delay()
+            if due < time.monotonic():
+                due = time.monotonic()
+
+    async def _summary_loop(self):
+        now = datetime.now()
+        if now.hour != self.SUMMARY_HOUR or self.daily_sent_date == self._summary_day(now):
+            await self._sleep_until(self._next_summary_time(now))
+        while True:
+            if self.daily_sent_date != self._summary_day(datetime.now()):
+                try:
+                    await self.send_daily_summary_async()
+                except Exception as e:
+                    logger.error("일일 요약 작업 실패: %s", e)
+            await self._sleep_until(self._next_summary_time(datetime.now()))
+
+    @staticmethod
+    async def _sleep_until(at: datetime):
+        """벽시계 시각 at까지 잔다. 절전 복귀를 놓치지 않도록 Scheduler.MAX_SLEEP마다 깨서 다시 잰다."""
+        while (remaining := (at - datetime.now()).total_seconds()) > 0:
+            await asyncio.sleep(min(remaining, Scheduler.MAX_SLEEP))
 
-        # 메인 루프
+    async def _maintenance_loop(self):
         while True:
+            await asyncio.sleep(self.maintenance_interval)
             try:
-                time.sleep(self.interval)
-                self.check_once()
-                # 21시 일일 요약
-                now = datetime.now()
-                if now.hour == 21 and self.daily_sent_date != date.today().isoformat():
-                    self.send_daily_summary()
-            except KeyboardInterrupt:
-                logger.info("⛔ 종료")
-                sys.exit(0)
+                await self._in_thread(self.flush_state)
             except Exception as e:
-                logger.error("예외 발생: %s", e)
-                time.sleep(60)
+                logger.error("상태 저장 작업 실패: %s", e)
+
+    def build_scheduler(self) -> Scheduler:
+        scheduler = Scheduler()
+        scheduler.every("체크", self.check_once, self.next_delay, retry=60)
+        now = datetime.now()
+        # 21시대에 (재)시작했고 아직 보내지 않았으면 바로 보낸다
+        first = now if now.hour == self.SUMMARY_HOUR and self.daily_sent_date != self._summary_day(now) else None
+        scheduler.at("일일 요약", self._daily_summary_job, self._next_summary_time, first=first)
+        scheduler.every("상태 저장", self.flush_state, self.maintenance_interval)
+        return scheduler
+
+    def _next_summary_time(self, now: datetime) -> datetime:
+        """now 이후 처음 오는 SUMMARY_HOUR 정각."""
+        at = now.replace(hour=self.SUMMARY_HOUR, minute=0, second=0, microsecond=0)
+        return at if at > now else at + timedelta(days=1)
+
+    def _summary_day(self, now: datetime) -> str:
+        """now 기준으로 가장 최근에 지난 SUMMARY_HOUR 회차의 날짜.
+
+        절전 복귀로 자정을 넘겨 늦게 보낸 요약은 원래 회차의 날짜로 기록해야 그날 21시 요약을 건너뛰지 않는다.
+        """
+        day = now.date() if now.hour >= self.SUMMARY_HOUR else now.date() - timedelta(days=1)
+        return day.isoformat()
+
+    def _daily_summary_job(self):
+        if self.daily_sent_date != self._summary_day(datetime.now()):
+            self.send_daily_summary()
 
 
 # ── 메인 진입점 ─────────────────────────────────────────────
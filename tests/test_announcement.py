@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Announcement 모델 단위 테스트 및 요약 저장 연동 테스트"""
+
+import json
+import sys
+
+import pytest
+
+from lh_monitor import Announcement, DailySummary, LHCrawler
+
+SAMPLE = {
+    "id": "12345",
+    "title": "부산강서 국민임대",
+    "rental_type": "국민임대",
+    "status": "접수중",
+    "reg_date": "2026-02-19",
+    "rcpt_begin": "2026-03-01",
+    "rcpt_end": "2026-03-15",
+    "url": "https://apply.lh.or.kr/detail/12345",
+}
+
+
+class TestAnnouncement:
+    def test_no_instance_dict(self):
+        ann = Announcement.of(SAMPLE)
+        assert not hasattr(ann, "__dict__")
+        assert sys.getsizeof(ann) < sys.getsizeof(dict(SAMPLE))
+
+    def test_mapping_protocol(self):
+        """기존 dict 코드(ann["id"], get, keys, ==)와 그대로 호환된다."""
+        ann = Announcement.of(SAMPLE)
+        assert ann["id"] == "12345"
+        assert ann.get("missing", "x") == "x"
+        assert set(ann.keys()) == set(SAMPLE)
+        assert ann == SAMPLE
+        assert SAMPLE == ann
+        with pytest.raises(KeyError):
+            ann["missing"]
+
+    def test_repeated_values_interned(self):
+        a = Announcement.of(SAMPLE)
+        b = Announcement.of({**SAMPLE, "rental_type": "".join(["국민", "임대"]), "status": "접수" + "중"})
+        assert a.rental_type is b.rental_type
+        assert a.status is b.status
+
+    def test_of_fills_missing_and_none(self):
+        ann = Announcement.of({"id": "1", "title": None})
+        assert ann.title == ""
+        assert ann.url == ""
+
+    def test_json_roundtrip(self):
+        ann = Announcement.of(SAMPLE)
+        assert Announcement.of(json.loads(json.dumps(ann.to_dict()))) == ann
+
+    def test_crawler_returns_announcements(self):
+        result = LHCrawler()._parse_json_items([{"panId": "A1", "panNm": "부산 행복주택", "aisTpCd": "04"}])
+        assert isinstance(result[0], Announcement)
+        assert result[0].rental_type == "행복주택"
+
+
+class TestSummaryPersistence:
+    def test_snapshot_and_journal_store_plain_dicts(self, tmp_path):
+        path = str(tmp_path / "daily_summary.json")
+        s = DailySummary(path)
+        s.add(SAMPLE)
+        s.flush()
+        with open(s.journal_path, encoding="utf-8") as f:
+            assert json.loads(f.readline())["ann"] == SAMPLE
+        s.save()
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["announcements"] == [SAMPLE]
+
+    def test_reload_gives_announcements(self, tmp_path):
+        path = str(tmp_path / "daily_summary.json")
+        s = DailySummary(path)
+        s.add(SAMPLE)
+        s.flush()
+        reloaded = DailySummary(path)
+        assert isinstance(reloaded.data["announcements"][0], Announcement)
+        assert reloaded.data["announcements"] == [SAMPLE]
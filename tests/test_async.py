@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""asyncio 실행 모드 테스트 (HostLimiter, AsyncLHCrawler, LHMonitor 비동기 체크·종료)"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from lh_monitor import AsyncLHCrawler, HostLimiter, LHCrawler, LHMonitor, Unchanged
+
+SAMPLE_ANN = {
+    "id": "12345",
+    "title": "부산강서 국민임대",
+    "rental_type": "국민임대",
+    "status": "접수중",
+    "reg_date": "2026-02-19",
+    "rcpt_begin": "2026-03-01",
+    "rcpt_end": "2026-03-15",
+    "url": "https://apply.lh.or.kr/detail/12345",
+}
+
+
+def _make_monitor(**env_overrides):
+    env = {"TELEGRAM_BOT_TOKEN": "tok", "TELEGRAM_CHAT_ID": "123", "DISCORD_WEBHOOK_URL": "https://hook",
+           "CHECK_INTERVAL": "1800", **env_overrides}
+    return lambda key, default="": env.get(key, default)
+
+
+def _race(crawler, **kwargs):
+    return asyncio.run(AsyncLHCrawler(crawler, HostLimiter(2)).fetch_race(**kwargs))
+
+
+class TestHostLimiter:
+    def test_concurrency_bounded_per_host(self):
+        active = {"a": 0, "b": 0}
+        peak = {"a": 0, "b": 0}
+        lock = threading.Lock()
+
+        def request(host):
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+
+        async def main():
+            hosts = HostLimiter(2)
+            await asyncio.gather(
+                *(hosts.run("https://a.example/x", request, "a") for _ in range(6)),
+                *(hosts.run("https://b.example/y", request, "b") for _ in range(6)),
+            )
+
+        asyncio.run(main())
+        assert peak == {"a": 2, "b": 2}
+
+
+class TestAsyncFetchRace:
+    def test_fastest_valid_source_wins(self):
+        c = LHCrawler()
+        release = threading.Event()
+
+        def slow_json(known=None, deadline=None):
+            release.wait(0.5)
+            return [{"id": "json"}]
+
+        c._fetch_json_api = slow_json
+        c._fetch_html = MagicMock(return_value=[{"id": "html"}])
+        try:
+            assert _race(c) == [{"id": "html"}]
+        finally:
+            release.set()
+
+    def test_failed_and_empty_sources_skipped(self):
+        c = LHCrawler()
+        c._fetch_json_api = MagicMock(return_value=[])
+        c._fetch_html = MagicMock(side_effect=RuntimeError("down"))
+        assert _race(c) == []
+
+    def test_propagates_unchanged(self):
+        c = LHCrawler()
+        c._fetch_json_api = MagicMock(side_effect=Unchanged("json"))
+        c._fetch_html = MagicMock(return_value=[])
+        with pytest.raises(Unchanged):
+            _race(c)
+
+    def test_gives_up_at_deadline(self):
+        c = LHCrawler()
+        release = threading.Event()
+
+        def hang(known=None, deadline=None):
+            release.wait(0.5)
+            return [{"id": "late"}]
+
+        c._fetch_json_api = hang
+        c._fetch_html = hang
+        try:
+            assert _race(c, deadline=time.monotonic() + 0.1) == []
+        finally:
+            release.set()
+
+
+class TestMonitorAsync:
+    def _build(self, tmp_path, **env):
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), **env)
+            return LHMonitor()
+
+    def test_check_once_async_notifies_in_background(self, tmp_path):
+        mon = self._build(tmp_path)
+        mon.crawler._fetch_json_api = MagicMock(return_value=[SAMPLE_ANN])
+        mon.crawler._fetch_html = MagicMock(return_value=[])
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
+
+        async def main():
+            new = await mon.check_once_async()
+            await asyncio.gather(*mon._inflight)
+            return new
+
+        assert [a.id for a in asyncio.run(main())] == ["12345"]
+        mon.tg.send.assert_called_once()
+        mon.dc.send.assert_called_once()
+        assert mon.store.is_known("12345")
+        assert mon.store.data.get("last_check")
+
+    def test_shutdown_drains_notifications_and_closes(self, tmp_path):
+        """취소되면 루프를 멈추고, 진행 중인 알림을 기다린 뒤 상태를 저장한다."""
+        mon = self._build(tmp_path)
+        mon.store.update_check_time()
+        mon.check_once = MagicMock(return_value=[])
+        mon.close = MagicMock()
+        sent = threading.Event()
+
+        def slow_send(announcements):
+            time.sleep(0.1)
+            sent.set()
+
+        mon.tg.send = slow_send
+        mon.tg.send_text = MagicMock()
+        mon.dc.send_embed = MagicMock()
+
+        async def main():
+            task = asyncio.create_task(mon.run_async())
+            await asyncio.sleep(0.05)
+            mon._spawn(mon.atg.send([SAMPLE_ANN]))
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        asyncio.run(main())
+        assert sent.is_set()
+        mon.close.assert_called_once()
+
+    def test_shutdown_does_not_wait_for_worker_threads(self, tmp_path):
+        """종료 시 멈춘 요청 스레드를 기다리지 않고, rate limit 대기 중인 발송은 깨워서 끝낸다."""
+        mon = self._build(tmp_path)
+        mon.store.update_check_time()
+        mon.check_once = MagicMock(return_value=[])
+        mon.close = MagicMock()
+        mon.NOTIFY_DRAIN_TIMEOUT = 0.1
+        mon.tg.send_text = MagicMock()
+        mon.dc.send_embed = MagicMock()
+        mon.tg.session.post = MagicMock()
+        mon.tg.limiter.block_for(30)
+        release = threading.Event()
+        send_done = threading.Event()
+        send = mon.tg.send
+
+        def tracked_send(announcements):
+            try:
+                send(announcements)
+            finally:
+                send_done.set()
+
+        mon.tg.send = tracked_send
+
+        async def main():
+            task = asyncio.create_task(mon.run_async())
+            await asyncio.sleep(0.05)
+            mon._spawn(mon.acrawler.hosts.run("https://slow.example/", release.wait, 5))
+            mon._spawn(mon.atg.send([SAMPLE_ANN]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await task
+
+        started = time.monotonic()
+        try:
+            asyncio.run(main())
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+        assert elapsed < 2
+        assert send_done.wait(1)
+        mon.tg.session.post.assert_not_called()
+        mon.close.assert_called_once()
+
+    def test_run_dispatches_to_async_mode(self, tmp_path):
+        mon = self._build(tmp_path, RUN_MODE="async")
+        mon.run_async = MagicMock(return_value=asyncio.sleep(0))
+        with patch("lh_monitor.Scheduler.run") as sync_run:
+            mon.run()
+        mon.run_async.assert_called_once()
+        sync_run.assert_not_called()
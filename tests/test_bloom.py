@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""BloomFilter 단위 테스트 및 DataStore 장기 중복 판정 연동 테스트"""
+
+from lh_monitor import BloomFilter, DataStore
+
+
+class TestBloomFilter:
+    def test_added_keys_found(self, tmp_path):
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), capacity=100)
+        for i in range(50):
+            bf.add(f"id{i}")
+        assert all(f"id{i}" in bf for i in range(50))
+        assert len(bf) == 50
+
+    def test_false_positive_rate_bounded(self, tmp_path):
+        """없는 키의 오탐 비율이 목표보다 크게 높지 않다."""
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), fp_rate=0.01, capacity=1000)
+        for i in range(1000):
+            bf.add(f"in{i}")
+        false_hits = sum(f"out{i}" in bf for i in range(10000))
+        assert false_hits / 10000 < 0.03
+
+    def test_duplicate_add_not_counted(self, tmp_path):
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), capacity=10)
+        bf.add("a")
+        bf.add("a")
+        assert len(bf) == 1
+
+    def test_auto_resize(self, tmp_path):
+        """용량을 넘으면 슬라이스를 늘리고 이전 키도 계속 찾는다."""
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), capacity=10)
+        for i in range(40):
+            bf.add(f"id{i}")
+        assert bf.capacity > 10
+        assert all(f"id{i}" in bf for i in range(40))
+
+    def test_persists_across_reopen(self, tmp_path):
+        fp = str(tmp_path / "seen.bloom")
+        bf = BloomFilter(fp, capacity=10)
+        for i in range(25):
+            bf.add(f"id{i}")
+        bf.close()
+        bf2 = BloomFilter(fp, capacity=10)
+        assert all(f"id{i}" in bf2 for i in range(25))
+        assert len(bf2) == 25
+        assert "missing" not in bf2
+
+    def test_fill_ratio(self, tmp_path):
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), capacity=100)
+        assert bf.fill_ratio() == 0.0
+        for i in range(50):
+            bf.add(f"id{i}")
+        assert 0.0 < bf.fill_ratio() < 1.0
+        assert "채움률" in bf.stats()
+
+    def test_corrupted_file_recreated(self, tmp_path):
+        fp = tmp_path / "seen.bloom"
+        fp.write_bytes(b"not a bloom filter at all, just junk bytes")
+        bf = BloomFilter(str(fp), capacity=10)
+        assert len(bf) == 0
+        bf.add("a")
+        assert "a" in bf
+
+
+class TestDataStoreBloom:
+    def test_pruned_id_still_not_new(self, tmp_path):
+        """보관 기간이 지나 정리된 ID도 Bloom 필터 덕분에 다시 알리지 않는다."""
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), capacity=100)
+        ds = DataStore(str(tmp_path / "seen.json"), retention_days=30, bloom=bf)
+        ds.mark_seen("old")
+        ds.seen["old"] = "2000-01-01T00:00:00"
+        ds.save()
+        assert "old" not in ds.seen
+        assert ds.is_new("old") is False
+        assert ds.is_known("old") is True
+
+    def test_legacy_ids_backfilled(self, tmp_path):
+        """Bloom 필터 도입 전에 기록된 ID도 로드 시 필터에 들어간다."""
+        fp = str(tmp_path / "seen.json")
+        ds = DataStore(fp)
+        ds.mark_seen("a")
+        ds.save()
+        bf = BloomFilter(str(tmp_path / "seen.bloom"), capacity=100)
+        DataStore(fp, bloom=bf)
+        assert "a" in bf
+
+    def test_without_bloom_pruned_id_is_new(self, tmp_path):
+        ds = DataStore(str(tmp_path / "seen.json"), retention_days=30)
+        ds.seen["old"] = "2000-01-01T00:00:00"
+        ds.save()
+        assert ds.is_new("old") is True
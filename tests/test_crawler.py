@@ -2,11 +2,15 @@
 """LHCrawler 모킹 기반 단위 테스트"""
 
 import json
+import threading
+import time
 from unittest.mock import patch, MagicMock
 
+import pytest
 import requests
+from bs4 import SoupStrainer
 
-from lh_monitor import LHCrawler
+from lh_monitor import LHCrawler, Unchanged
 
 EXPECTED_KEYS = {"id", "title", "rental_type", "status", "reg_date", "rcpt_begin", "rcpt_end", "url"}
 
@@ -363,6 +367,80 @@ class TestFetchWebHtml:
 # ── 폴백 체인 ────────────────────────────────────────────────
 
 
+class TestListingRows:
+    def test_fast_path_ignores_markup_outside_tbody(self):
+        html = "<html><head><script>var x = '<tr>';</script></head><body>" \
+               "<nav><ul><li>메뉴</li></ul></nav>" + HTML_WITH_PANID + "</body></html>"
+        rows = LHCrawler()._listing_rows(html)
+        assert len(rows) == 1
+        assert rows[0].find("a")["href"].endswith("panId=C003")
+
+    def test_falls_back_to_full_parse(self):
+        """빠른 경로에서 행을 못 찾으면 전체 파싱 + 셀렉터로 다시 찾는다."""
+        c = LHCrawler()
+        with patch.object(LHCrawler, "_TBODY_ONLY", SoupStrainer("thead")):
+            rows = c._listing_rows(HTML_WITH_PANID)
+        assert len(rows) == 1
+
+
+def _stream_page(count):
+    rows = "".join(
+        f'<tr><td>{n}</td><td>국민임대</td><td><a href="#">첨부</a>'
+        f'<a class="bbs wrtancInfoBtn" data-id1="P{n}" data-id2="03">부산 &amp; {n}단지 <b>모집</b></a></td>'
+        f"<td>부산</td><td></td><td>2026.02.{n % 28 + 1:02d}</td><td>20260315</td><td>접수중</td></tr>"
+        for n in range(count)
+    )
+    return f"<html><head><script>var s = '<tr>';</script></head><body><table><tbody>{rows}</tbody></table></body></html>"
+
+
+def _stream_response(html, chunk=64):
+    body = html.encode("utf-8")
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {}
+    resp.encoding = "utf-8"
+    resp.text = html
+    resp.content = body
+    resp.raise_for_status = MagicMock()
+    resp.consumed = []
+
+    def iter_content(chunk_size=None):
+        for i in range(0, len(body), chunk):
+            resp.consumed.append(i)
+            yield body[i:i + chunk]
+
+    resp.iter_content = iter_content
+    return resp
+
+
+class TestStreamHtml:
+    @pytest.mark.parametrize("html", [_stream_page(5), HTML_WITH_PANID, HTML_WITH_JS, HTML_NO_HREF, HTML_WITH_DATA_ATTRS],
+                             ids=["rows", "panid", "js", "no_href", "data_attrs"])
+    @patch.object(requests.Session, "get")
+    def test_same_result_as_soup_path(self, mock_get, html):
+        """증분 파서와 BeautifulSoup 경로는 같은 공고를 만든다 (청크가 멀티바이트 문자를 잘라도)."""
+        mock_get.return_value = _stream_response(html, chunk=7)
+        streamed = LHCrawler(stream_html=True)._fetch_html(known=lambda _id: False)
+        assert streamed == LHCrawler()._fetch_html()
+        assert streamed
+
+    @patch.object(requests.Session, "get")
+    def test_aborts_at_known_row(self, mock_get):
+        resp = _stream_response(_stream_page(30))
+        mock_get.return_value = resp
+        result = LHCrawler(stream_html=True)._fetch_html(known=lambda ann_id: ann_id == "P2")
+        assert [a["id"] for a in result] == ["P0", "P1", "P2"]
+        assert mock_get.call_args[1]["stream"] is True
+        assert len(resp.consumed) < len(resp.content) // 64 / 2
+        resp.close.assert_called_once()
+
+    @patch.object(requests.Session, "get")
+    def test_disabled_without_flag(self, mock_get):
+        mock_get.return_value = _stream_response(_stream_page(3))
+        LHCrawler()._fetch_html(known=lambda _id: True)
+        assert "stream" not in mock_get.call_args[1]
+
+
 class TestFallbackChain:
     @patch.object(requests.Session, "get")
     @patch.object(requests.Session, "post")
@@ -389,3 +467,284 @@ class TestFallbackChain:
         result = LHCrawler().fetch_web()
         mock_get.assert_called_once()
         assert len(result) == 1
+
+
+# ── 페이지 순회 ──────────────────────────────────────────────
+
+
+def _api_page(start, count):
+    """sn이 start부터 count개인 공공데이터 API 응답을 만든다."""
+    items = [{**API_ITEM, "sn": str(n)} for n in range(start, start + count)]
+    resp = MagicMock()
+    resp.json.return_value = _make_api_response(items)
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+def _json_page(start, count):
+    """panId가 start부터 count개인 LH JSON API 응답을 만든다."""
+    items = [{**JSON_ITEM_CAMEL, "panId": str(n)} for n in range(start, start + count)]
+    resp = MagicMock()
+    resp.json.return_value = {"dsList": items}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+class TestPagination:
+    @patch.object(requests.Session, "get")
+    def test_short_page_stops(self, mock_get):
+        """첫 페이지가 PAGE_SIZE 미만이면 한 번만 요청한다."""
+        mock_get.return_value = _api_page(0, 5)
+        result = LHCrawler(max_pages=5).fetch_api("fake_key")
+        assert len(result) == 5
+        assert mock_get.call_count == 1
+
+    @patch.object(requests.Session, "get")
+    def test_stops_at_known_id(self, mock_get):
+        """이미 아는 ID가 포함된 페이지에서 멈춘다."""
+        mock_get.side_effect = [_api_page(0, 30), _api_page(30, 30), _api_page(60, 30)]
+        result = LHCrawler(max_pages=5).fetch_api("fake_key", known=lambda i: i == "45")
+        assert len(result) == 60
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[1][1]["params"]["pageNo"] == 2
+
+    @patch.object(requests.Session, "get")
+    def test_page_budget(self, mock_get):
+        """아는 ID가 없어도 max_pages를 넘지 않는다."""
+        mock_get.side_effect = [_api_page(n * 30, 30) for n in range(5)]
+        result = LHCrawler(max_pages=3).fetch_api("fake_key", known=lambda i: False)
+        assert len(result) == 90
+        assert mock_get.call_count == 3
+
+    @patch.object(requests.Session, "get")
+    def test_later_page_failure_keeps_earlier_pages(self, mock_get):
+        """2페이지 이후 실패 시 앞 페이지 결과는 유지한다."""
+        mock_get.side_effect = [_api_page(0, 30), requests.RequestException("timeout")]
+        result = LHCrawler(max_pages=3).fetch_api("fake_key")
+        assert len(result) == 30
+
+    @patch.object(requests.Session, "post")
+    def test_json_api_paginates(self, mock_post):
+        """LH JSON API도 pg 파라미터로 다음 페이지를 요청한다."""
+        mock_post.side_effect = [_json_page(0, 30), _json_page(30, 10)]
+        result = LHCrawler(max_pages=5).fetch_web(known=lambda i: False)
+        assert len(result) == 40
+        assert [c[1]["data"]["pg"] for c in mock_post.call_args_list] == [1, 2]
+
+
+# ── 동시 수집 ────────────────────────────────────────────────
+
+
+class TestFetchRace:
+    def test_fastest_valid_source_wins(self):
+        """느린 상위 소스를 기다리지 않고 먼저 도착한 유효 결과를 쓴다."""
+        c = LHCrawler()
+        release = threading.Event()
+
+        def slow_json(known=None, deadline=None):
+            release.wait(5)
+            return [{"id": "json"}]
+
+        c._fetch_json_api = slow_json
+        c._fetch_html = MagicMock(return_value=[{"id": "html"}])
+        try:
+            result = c.fetch_race()
+        finally:
+            release.set()
+        assert result == [{"id": "html"}]
+
+    def test_failed_and_empty_sources_skipped(self):
+        """예외나 빈 결과는 건너뛰고 다음 유효 결과를 쓴다."""
+        c = LHCrawler()
+        c._fetch_api_page = MagicMock(side_effect=requests.RequestException("down"))
+        c._fetch_json_api = MagicMock(return_value=[])
+        c._fetch_html = MagicMock(return_value=[{"id": "html"}])
+        assert c.fetch_race("key") == [{"id": "html"}]
+
+    def test_priority_when_completed_together(self):
+        """동시에 완료된 결과는 우선순위가 높은 소스를 고른다."""
+        c = LHCrawler()
+        c._fetch_json_api = MagicMock(return_value=[{"id": "json"}])
+        c._fetch_html = MagicMock(return_value=[{"id": "html"}])
+        with patch("lh_monitor.wait") as mock_wait:
+            def fake_wait(pending, timeout=None, return_when=None):
+                for f in pending:
+                    f.result()
+                return set(pending), set()
+            mock_wait.side_effect = fake_wait
+            assert c.fetch_race() == [{"id": "json"}]
+
+    def test_all_fail_returns_empty(self):
+        c = LHCrawler()
+        c._fetch_json_api = MagicMock(side_effect=ValueError("bad"))
+        c._fetch_html = MagicMock(return_value=[])
+        assert c.fetch_race() == []
+
+
+# ── 체크 예산 ────────────────────────────────────────────────
+
+
+class TestDeadline:
+    @patch.object(requests.Session, "get")
+    def test_timeout_shortened_to_remaining_budget(self, mock_get):
+        """남은 예산이 기본 timeout보다 짧으면 그만큼만 기다린다."""
+        mock_get.return_value = _api_page(0, 1)
+        with patch("lh_monitor.time.monotonic", return_value=100.0):
+            LHCrawler().fetch_api("key", deadline=105.0)
+        assert mock_get.call_args[1]["timeout"] == 5.0
+
+    @patch.object(requests.Session, "get")
+    def test_no_deadline_uses_default_timeout(self, mock_get):
+        mock_get.return_value = _api_page(0, 1)
+        LHCrawler().fetch_api("key")
+        assert mock_get.call_args[1]["timeout"] == LHCrawler.REQUEST_TIMEOUT
+
+    @patch.object(requests.Session, "get")
+    @patch.object(requests.Session, "post")
+    def test_expired_deadline_skips_all_requests(self, mock_post, mock_get):
+        """예산이 소진되면 남은 소스는 요청하지 않고, health에도 실패로 남기지 않는다."""
+        c = LHCrawler()
+        with patch("lh_monitor.time.monotonic", return_value=100.0):
+            assert c.fetch_api("key", deadline=100.5) == []
+            assert c.fetch_web(deadline=100.5) == []
+        mock_get.assert_not_called()
+        mock_post.assert_not_called()
+        assert c.health.data["json"]["outcomes"] == []
+
+    def test_race_gives_up_at_deadline(self):
+        """동시 수집도 예산이 끝나면 느린 소스를 기다리지 않는다."""
+        c = LHCrawler()
+        release = threading.Event()
+        c._fetch_json_api = lambda known=None, deadline=None: release.wait(5) and []
+        c._fetch_html = lambda deadline=None, known=None: release.wait(5) and []
+        try:
+            assert c.fetch_race(deadline=time.monotonic() + 0.2) == []
+        finally:
+            release.set()
+
+
+# ── 변경 없음 단축 ──────────────────────────────────────────
+
+
+def _html_response(body=HTML_WITH_PANID, status=200, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = body
+    resp.content = body.encode("utf-8")
+    resp.headers = headers or {}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+class TestUnchanged:
+    @patch.object(requests.Session, "get")
+    def test_identical_body_raises_unchanged(self, mock_get):
+        """확정된 지문과 본문이 같으면 파싱하지 않고 Unchanged."""
+        mock_get.return_value = _html_response()
+        c = LHCrawler()
+        assert len(c._fetch_html()) == 1
+        c._adopt("html")
+        c.commit_fingerprints()
+        with patch("lh_monitor.BeautifulSoup") as soup:
+            with pytest.raises(Unchanged):
+                c._fetch_html()
+            soup.assert_not_called()
+
+    @patch.object(requests.Session, "get")
+    def test_uncommitted_fingerprint_not_used(self, mock_get):
+        """처리가 끝나지 않은(commit 전) 목록은 다음 체크에서 다시 파싱한다."""
+        mock_get.return_value = _html_response()
+        c = LHCrawler()
+        c._fetch_html()
+        assert len(c._fetch_html()) == 1
+
+    @patch.object(requests.Session, "get")
+    def test_conditional_headers_and_304(self, mock_get):
+        mock_get.return_value = _html_response(headers={"ETag": '"v1"', "Last-Modified": "Sat, 17 Oct 2026 00:00:00 GMT"})
+        c = LHCrawler()
+        c._fetch_html()
+        c._adopt("html")
+        c.commit_fingerprints()
+        mock_get.return_value = _html_response(body="", status=304)
+        with pytest.raises(Unchanged):
+            c._fetch_html()
+        headers = mock_get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Sat, 17 Oct 2026 00:00:00 GMT"
+
+    @patch.object(requests.Session, "get")
+    @patch.object(requests.Session, "post")
+    def test_fetch_web_propagates_and_records_success(self, mock_post, mock_get):
+        """변경 없음은 폴백 대상이 아니며 health에는 성공으로 남는다."""
+        mock_post.side_effect = Exception("JSON API fail")
+        mock_get.return_value = _html_response()
+        c = LHCrawler()
+        c.fetch_web()
+        c.commit_fingerprints()
+        with pytest.raises(Unchanged):
+            c.fetch_web()
+        assert c.health.data["html"]["outcomes"][-1] == 1
+
+    def test_race_propagates_unchanged(self):
+        c = LHCrawler()
+        c._fetch_json_api = MagicMock(side_effect=Unchanged("json 본문 동일"))
+        c._fetch_html = MagicMock(return_value=[])
+        with pytest.raises(Unchanged):
+            c.fetch_race()
+
+    @patch.object(requests.Session, "get")
+    @patch.object(requests.Session, "post")
+    def test_error_body_not_fingerprinted(self, mock_post, mock_get):
+        """dsList 없는 JSON 오류 응답이 반복돼도 '변경 없음'이 되지 않아 HTML 폴백이 계속 돈다."""
+        mock_post.return_value = _html_response(body=json.dumps({"error": "점검 중"}))
+        mock_post.return_value.json = MagicMock(return_value={"error": "점검 중"})
+        mock_get.return_value = _html_response()
+        c = LHCrawler()
+        c.health.available = MagicMock(return_value=["json", "html"])
+        assert len(c.fetch_web()) == 1
+        c.commit_fingerprints()
+        assert set(c._fingerprints) == {"html"}
+        # 두 번째 체크도 JSON 오류 뒤 HTML까지 가서, 변경 없음은 HTML이 판단한다
+        with pytest.raises(Unchanged, match="html"):
+            c.fetch_web()
+        assert mock_get.call_count == 2
+
+    def test_fallback_unchanged_does_not_end_fetch(self):
+        """폴백 소스가 그대로여도 뒤 소스의 유효 결과를 쓴다."""
+        c = LHCrawler()
+        c.health.available = MagicMock(return_value=["html", "json"])
+        c._fetch_html = MagicMock(return_value=[])
+        c._fetch_json_api = MagicMock(side_effect=Unchanged("json 본문 동일"))
+        with pytest.raises(Unchanged):
+            c.fetch_web()
+        c._fetch_html = MagicMock(side_effect=Unchanged("html 본문 동일"))
+        with pytest.raises(Unchanged):
+            c.fetch_web()
+        c.health.available = MagicMock(return_value=["json", "html"])
+        c._fetch_json_api = MagicMock(return_value=[])
+        c._fetch_html = MagicMock(side_effect=Unchanged("html 본문 동일"))
+        with pytest.raises(Unchanged):
+            c.fetch_web()
+
+    def test_race_commits_only_adopted_source(self):
+        c = LHCrawler()
+
+        def json_source(known=None, deadline=None):
+            c._staged_fingerprints["json"] = {"hash": "j", "etag": "", "last_modified": ""}
+            return [{"id": "json"}]
+
+        def html_source(deadline=None, known=None):
+            c._staged_fingerprints["html"] = {"hash": "h", "etag": "", "last_modified": ""}
+            return [{"id": "html"}]
+
+        c._fetch_json_api = json_source
+        c._fetch_html = html_source
+        with patch("lh_monitor.wait") as mock_wait:
+            def fake_wait(pending, timeout=None, return_when=None):
+                for f in pending:
+                    f.result()
+                return set(pending), set()
+            mock_wait.side_effect = fake_wait
+            assert c.fetch_race() == [{"id": "json"}]
+        c.commit_fingerprints()
+        assert set(c._fingerprints) == {"json"}
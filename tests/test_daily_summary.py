@@ -4,6 +4,8 @@
 import json
 from datetime import date
 
+import pytest
+
 from lh_monitor import DailySummary
 
 SAMPLE_ANN = {
@@ -79,3 +81,84 @@ class TestDailySummaryPersistence:
         ds.add(SAMPLE_ANN)
         ds2 = DailySummary(fp)
         assert len(ds2.data["announcements"]) == 1
+
+
+class TestDailySummaryJournal:
+    def test_add_appends_journal_not_snapshot(self, tmp_path):
+        """같은 날 추가분은 스냅샷을 다시 쓰지 않고 저널에 한 줄씩 덧붙인다."""
+        fp = tmp_path / "daily.json"
+        ds = DailySummary(str(fp))
+        ds.add(SAMPLE_ANN)
+        snapshot = fp.read_text()
+        ds.add({**SAMPLE_ANN, "id": "2"})
+        ds.add({**SAMPLE_ANN, "id": "3"})
+        assert fp.read_text() == snapshot
+        lines = (tmp_path / "daily.ndjson").read_text().splitlines()
+        assert [json.loads(l)["ann"]["id"] for l in lines] == ["12345", "2", "3"]
+
+    def test_replay_after_crash_skips_torn_line(self, tmp_path):
+        """잘린 마지막 줄은 건너뛰고 나머지 저널을 재생한 뒤 압축한다."""
+        fp = tmp_path / "daily.json"
+        ds = DailySummary(str(fp))
+        ds.add(SAMPLE_ANN)
+        ds.add({**SAMPLE_ANN, "id": "2"})
+        with open(tmp_path / "daily.ndjson", "a", encoding="utf-8") as f:
+            f.write('{"date": "' + date.today().isoformat() + '", "ann": {"id"')
+        ds2 = DailySummary(str(fp))
+        assert [a["id"] for a in ds2.data["announcements"]] == ["12345", "2"]
+        assert not (tmp_path / "daily.ndjson").exists()
+        assert len(json.loads(fp.read_text())["announcements"]) == 2
+
+    def test_crash_between_snapshot_and_journal_removal(self, tmp_path):
+        """압축이 스냅샷을 쓴 뒤 저널을 지우기 전에 죽어도 다음 시작에서 같은 공고를 두 번 넣지 않는다."""
+        from unittest.mock import patch
+
+        fp = str(tmp_path / "daily.json")
+        ds = DailySummary(fp)
+        for i in range(3):
+            ds.add({**SAMPLE_ANN, "id": str(i)})
+        ds.flush()
+        with patch("lh_monitor.os.remove", side_effect=OSError("killed")):
+            with pytest.raises(OSError):
+                DailySummary(fp)
+        assert (tmp_path / "daily.ndjson").exists()
+        ds2 = DailySummary(fp)
+        assert [a["id"] for a in ds2.data["announcements"]] == ["0", "1", "2"]
+        ds2.add({**SAMPLE_ANN, "id": "3"})
+        assert [a["id"] for a in DailySummary(fp).data["announcements"]] == ["0", "1", "2", "3"]
+
+    def test_rollover_compacts(self, tmp_path):
+        """날짜가 바뀌면 스냅샷을 새 날짜로 쓰고 이전 저널을 비운다."""
+        fp = tmp_path / "daily.json"
+        ds = DailySummary(str(fp))
+        ds.add(SAMPLE_ANN)
+        ds.data["date"] = "2020-01-01"
+        ds.add({**SAMPLE_ANN, "id": "new"})
+        lines = (tmp_path / "daily.ndjson").read_text().splitlines()
+        assert [json.loads(l)["ann"]["id"] for l in lines] == ["new"]
+        assert json.loads(fp.read_text())["date"] == date.today().isoformat()
+        assert [a["id"] for a in DailySummary(str(fp)).data["announcements"]] == ["new"]
+
+    def test_old_journal_entries_ignored(self, tmp_path):
+        fp = tmp_path / "daily.json"
+        fp.write_text(json.dumps({"date": "2026-02-20", "announcements": []}))
+        (tmp_path / "daily.ndjson").write_text(json.dumps({"date": "2026-02-19", "ann": {"id": "old"}}) + "\n")
+        assert DailySummary(str(fp)).data["announcements"] == []
+
+    def test_flush_fsyncs_once(self, tmp_path):
+        from unittest.mock import patch
+
+        ds = DailySummary(str(tmp_path / "daily.json"))
+        for i in range(5):
+            ds.add({**SAMPLE_ANN, "id": str(i)})
+        with patch("lh_monitor.os.fsync") as mock_fsync:
+            ds.flush()
+            ds.flush()
+        assert mock_fsync.call_count == 1
+
+    def test_rendering_unchanged_after_reload(self, tmp_path):
+        fp = str(tmp_path / "daily.json")
+        ds = DailySummary(fp)
+        for i in range(3):
+            ds.add({**SAMPLE_ANN, "title": f"공고{i}"})
+        assert DailySummary(fp).get_tg_msg() == ds.get_tg_msg()
@@ -3,6 +3,7 @@
 
 import json
 import os
+from unittest.mock import patch
 
 from lh_monitor import DataStore
 
@@ -20,7 +21,7 @@ class TestDataStoreInit:
         """파일이 없으면 기본값으로 초기화한다."""
         fp = tmp_path / "seen.json"
         ds = DataStore(str(fp))
-        assert ds.data["seen_ids"] == []
+        assert ds.seen == {}
         assert ds.data["last_check"] is None
 
     def test_loads_existing_file(self, tmp_path):
@@ -28,7 +29,7 @@ class TestDataStoreInit:
         fp = tmp_path / "seen.json"
         fp.write_text(json.dumps({"seen_ids": ["a", "b"], "last_check": "2026-01-01T00:00:00"}))
         ds = DataStore(str(fp))
-        assert ds.data["seen_ids"] == ["a", "b"]
+        assert list(ds.seen) == ["a", "b"]
         assert ds.data["last_check"] == "2026-01-01T00:00:00"
 
     def test_corrupted_json_falls_back(self, tmp_path):
@@ -36,7 +37,7 @@ class TestDataStoreInit:
         fp = tmp_path / "seen.json"
         fp.write_text("{invalid json!!!")
         ds = DataStore(str(fp))
-        assert ds.data["seen_ids"] == []
+        assert ds.seen == {}
         assert ds.data["last_check"] is None
 
 
@@ -59,29 +60,82 @@ class TestMarkSeen:
     def test_adds_id(self, tmp_path):
         ds = DataStore(str(tmp_path / "seen.json"))
         ds.mark_seen("x")
-        assert "x" in ds.data["seen_ids"]
+        assert "x" in ds.seen
 
     def test_duplicate_ignored(self, tmp_path):
-        """중복 호출 시 리스트 길이가 변하지 않는다."""
+        """중복 호출 시 최초 확인 시각과 개수가 변하지 않는다."""
         ds = DataStore(str(tmp_path / "seen.json"))
         ds.mark_seen("x")
+        first = ds.seen["x"]
         ds.mark_seen("x")
-        assert ds.data["seen_ids"].count("x") == 1
+        assert len(ds.seen) == 1
+        assert ds.seen["x"] == first
 
-    def test_max_500_limit(self, tmp_path):
-        """501개 삽입 후 길이는 500이다."""
+    def test_no_count_limit(self, tmp_path):
+        """개수 제한 없이 501번째 이후에도 처음 ID를 기억한다."""
         ds = DataStore(str(tmp_path / "seen.json"))
         for i in range(501):
             ds.mark_seen(str(i))
-        assert len(ds.data["seen_ids"]) == 500
+        assert len(ds.seen) == 501
+        assert ds.is_new("0") is False
 
-    def test_oldest_removed_on_overflow(self, tmp_path):
-        """501번째 삽입 시 첫 번째 ID가 삭제된다."""
+    def test_records_first_seen_timestamp(self, tmp_path):
         ds = DataStore(str(tmp_path / "seen.json"))
-        for i in range(501):
-            ds.mark_seen(str(i))
-        assert "0" not in ds.data["seen_ids"]
-        assert "500" in ds.data["seen_ids"]
+        ds.mark_seen("x")
+        assert "T" in ds.seen["x"]
+
+
+class TestRetention:
+    """prune() / 보관 기간 테스트"""
+
+    def test_old_ids_pruned(self, tmp_path):
+        ds = DataStore(str(tmp_path / "seen.json"), retention_days=180)
+        ds.seen["old"] = "2000-01-01T00:00:00"
+        ds.seen["keep"] = "2999-01-01T00:00:00"
+        assert ds.prune() == 1
+        assert list(ds.seen) == ["keep"]
+
+    def test_save_prunes(self, tmp_path):
+        fp = tmp_path / "seen.json"
+        ds = DataStore(str(fp), retention_days=30)
+        ds.seen["old"] = "2000-01-01T00:00:00"
+        ds.mark_seen("new")
+        ds.save()
+        assert list(DataStore(str(fp)).seen) == ["new"]
+
+    def test_zero_retention_keeps_all(self, tmp_path):
+        ds = DataStore(str(tmp_path / "seen.json"), retention_days=0)
+        ds.seen["old"] = "2000-01-01T00:00:00"
+        assert ds.prune() == 0
+
+
+class TestFileFormat:
+    """디스크 형식 호환성 테스트"""
+
+    def test_migrates_legacy_seen_ids(self, tmp_path):
+        """first_seen이 없는 예전 파일은 last_check 시각으로 이관한다."""
+        fp = tmp_path / "seen.json"
+        fp.write_text(json.dumps({"seen_ids": ["a"], "last_check": "2026-01-01T00:00:00"}))
+        ds = DataStore(str(fp))
+        assert ds.seen == {"a": "2026-01-01T00:00:00"}
+
+    def test_saved_file_keeps_seen_ids_list(self, tmp_path):
+        """예전 버전이 읽을 수 있도록 seen_ids 목록을 함께 저장한다."""
+        fp = tmp_path / "seen.json"
+        ds = DataStore(str(fp))
+        ds.mark_seen("a")
+        ds.mark_seen("b")
+        ds.save()
+        raw = json.loads(fp.read_text())
+        assert raw["seen_ids"] == ["a", "b"]
+        assert set(raw["first_seen"]) == {"a", "b"}
+
+    def test_round_trip_preserves_timestamps(self, tmp_path):
+        fp = tmp_path / "seen.json"
+        ds = DataStore(str(fp))
+        ds.mark_seen("a")
+        ds.save()
+        assert DataStore(str(fp)).seen == ds.seen
 
 
 class TestUpdateCheckTime:
@@ -104,4 +158,79 @@ class TestUpdateCheckTime:
         # 파일 재로드
         ds2 = DataStore(str(fp))
         assert ds2.data["last_check"] is not None
-        assert "a" in ds2.data["seen_ids"]
+        assert "a" in ds2.seen
+
+
+class TestIsKnown:
+    """is_known() / update_frontier() 메서드 테스트"""
+
+    def test_seen_id_is_known(self, tmp_path):
+        ds = DataStore(str(tmp_path / "seen.json"))
+        ds.mark_seen("a")
+        assert ds.is_known("a") is True
+
+    def test_frontier_id_is_known(self, tmp_path):
+        """알림 대상이 아니었던 ID도 직전 수집 목록에 있으면 아는 공고다."""
+        ds = DataStore(str(tmp_path / "seen.json"))
+        ds.update_frontier(["x", "y"])
+        assert ds.is_known("y") is True
+        assert ds.is_known("z") is False
+        assert ds.is_new("y") is True
+
+
+class TestWriteBehind:
+    """쓰기 지연 / 원자적 저장 테스트"""
+
+    def test_check_time_only_is_coalesced(self, tmp_path):
+        """체크 시간만 바뀐 경우 flush_interval 안에서는 파일을 다시 쓰지 않는다."""
+        fp = tmp_path / "seen.json"
+        ds = DataStore(str(fp), flush_interval=300)
+        ds.update_check_time()
+        first = fp.read_text()
+        ds.update_check_time()
+        assert fp.read_text() == first
+        ds.flush()
+        assert json.loads(fp.read_text())["last_check"] == ds.data["last_check"]
+
+    def test_unchanged_polls_do_not_rewrite(self, tmp_path):
+        """기본 주기(체크 1800초, 정기 저장 300초)에서 새 공고가 없는 체크는 파일을 다시 쓰지 않는다."""
+        fp = tmp_path / "seen.json"
+        clock = [1000.0]
+        with patch("lh_monitor.time.monotonic", lambda: clock[0]):
+            ds = DataStore(str(fp), flush_interval=300)
+            ds.mark_seen("a")
+            ds.update_check_time()
+            with patch("lh_monitor.atomic_write_json") as write:
+                for _ in range(10):
+                    clock[0] += 1800
+                    ds.update_check_time()
+                    clock[0] += 300
+                    ds.flush(check_time=False)
+                write.assert_not_called()
+            ds.flush()
+        assert json.loads(fp.read_text())["last_check"] == ds.data["last_check"]
+
+    def test_check_time_written_with_real_change(self, tmp_path):
+        """보류된 체크 시간은 다음 실제 변경과 함께 저장된다."""
+        fp = tmp_path / "seen.json"
+        ds = DataStore(str(fp), flush_interval=300)
+        ds.update_check_time()
+        ds.update_check_time()
+        ds.mark_seen("a")
+        ds.update_check_time()
+        assert json.loads(fp.read_text())["last_check"] == ds.data["last_check"]
+
+    def test_new_id_written_immediately(self, tmp_path):
+        """새 ID가 기록된 체크는 flush_interval과 관계없이 바로 쓴다."""
+        fp = tmp_path / "seen.json"
+        ds = DataStore(str(fp), flush_interval=300)
+        ds.update_check_time()
+        ds.mark_seen("a")
+        ds.update_check_time()
+        assert "a" in DataStore(str(fp)).seen
+
+    def test_no_temp_files_left(self, tmp_path):
+        ds = DataStore(str(tmp_path / "seen.json"))
+        ds.mark_seen("a")
+        ds.save()
+        assert os.listdir(tmp_path) == ["seen.json"]
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""수신처 레지스트리와 DeliveryPool 테스트"""
+
+import json
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from lh_monitor import (
+    Announcement, DeliveryPool, Destination, DestinationRegistry, DiscordNotifier, LHMonitor, SQLiteState,
+    TelegramNotifier,
+)
+
+ANN = Announcement(id="1", title="부산 행복주택")
+
+
+def _registry(*destinations):
+    return DestinationRegistry(destinations, telegram_token="tok", session=MagicMock())
+
+
+class TestDestinationRegistry:
+    def test_load_file(self, tmp_path):
+        path = tmp_path / "destinations.json"
+        path.write_text(json.dumps([
+            {"name": "alice", "type": "telegram", "chat_id": 111, "subscription": "busan"},
+            {"name": "bob", "type": "discord", "webhook_url": "https://hook/bob", "subscription": "busan"},
+            {"name": "carol", "type": "telegram", "chat_id": 333},
+            {"name": "alice", "type": "telegram", "chat_id": 999},
+            {"name": "empty", "type": "discord"},
+        ]), encoding="utf-8")
+        reg = DestinationRegistry.load(str(path), telegram_token="tok", session=MagicMock())
+        assert sorted(reg.destinations) == ["alice", "bob", "carol"]
+        assert [d.name for d in reg.for_subscription("busan")] == ["alice", "bob"]
+        assert [d.name for d in reg.for_subscription("default")] == ["carol"]
+        alice, bob = reg.for_subscription("busan")
+        assert isinstance(alice.notifier, TelegramNotifier) and alice.notifier.chat_id == "111"
+        assert isinstance(bob.notifier, DiscordNotifier)
+        # 수신처마다 rate limit을 따로 둔다
+        assert alice.notifier.limiter is not reg.destinations["carol"].notifier.limiter
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(ValueError):
+            Destination("x", "sms", "010")
+
+    def test_from_db(self, tmp_path):
+        db = SQLiteState(str(tmp_path / "lh_monitor.db"))
+        db.conn.executemany(
+            "INSERT INTO destinations (name, kind, target, subscription, enabled) VALUES (?, ?, ?, ?, ?)",
+            [("a", "telegram", "1", "busan", 1), ("b", "discord", "https://hook/b", "default", 0)],
+        )
+        db.conn.commit()
+        reg = DestinationRegistry.from_db(db, telegram_token="tok", session=MagicMock())
+        assert list(reg.destinations) == ["a"]
+        assert reg.subscriptions == {"busan"}
+        db.close()
+
+
+class TestDeliveryPool:
+    def test_routes_by_subscription(self):
+        reg = _registry(Destination("a", "telegram", "1", "busan"), Destination("b", "telegram", "2", "seoul"))
+        for dest in reg.destinations.values():
+            dest.notifier.send = MagicMock()
+        assert DeliveryPool(reg).deliver({"busan": [ANN]}) == 1
+        reg.destinations["a"].notifier.send.assert_called_once_with([ANN])
+        reg.destinations["b"].notifier.send.assert_not_called()
+
+    def test_failure_isolated(self):
+        reg = _registry(*(Destination(f"d{i}", "telegram", str(i)) for i in range(3)))
+        for dest in reg.destinations.values():
+            dest.notifier.send = MagicMock()
+        reg.destinations["d1"].notifier.send.side_effect = RuntimeError("boom")
+        pool = DeliveryPool(reg, workers=2)
+        assert pool.deliver({"default": [ANN]}) == 2
+        assert pool.deliver({"default": [ANN]}) == 2
+        assert reg.destinations["d1"].failures == 2
+        assert reg.destinations["d0"].notifier.send.call_count == 2
+        pool.close()
+
+    def test_real_notifier_failures_counted(self):
+        """실제 notifier의 403(봇 차단)·5xx 응답이 수신처 실패로 집계된다."""
+        session = MagicMock()
+
+        def post(url, data=None, **kwargs):
+            body = json.loads(data)
+            if body.get("chat_id") == "blocked" or url.endswith("/broken"):
+                return MagicMock(status_code=403 if "chat_id" in body else 500, headers={})
+            return MagicMock(status_code=200, headers={})
+
+        session.post.side_effect = post
+        reg = DestinationRegistry([
+            Destination("ok", "telegram", "1"), Destination("blocked", "telegram", "blocked"),
+            Destination("hook", "discord", "https://hook/ok"), Destination("broken", "discord", "https://hook/broken"),
+        ], telegram_token="tok", session=session)
+        pool = DeliveryPool(reg, workers=2)
+        assert pool.deliver({"default": [ANN]}) == 2
+        assert pool.deliver({"default": [ANN]}) == 2
+        assert {name: d.failures for name, d in reg.destinations.items()} == {
+            "ok": 0, "blocked": 2, "hook": 0, "broken": 2,
+        }
+        assert session.post.call_count == 8
+        pool.close()
+
+    def test_worker_pool_bounded(self):
+        reg = _registry(*(Destination(f"d{i}", "telegram", str(i)) for i in range(8)))
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def send(announcements):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        for dest in reg.destinations.values():
+            dest.notifier.send = send
+        pool = DeliveryPool(reg, workers=3)
+        assert pool.deliver({"default": [ANN]}) == 8
+        assert peak[0] == 3
+        pool.close()
+
+
+class TestMonitorDelivery:
+    def test_one_poll_fans_out_to_destinations(self, tmp_path):
+        subs = tmp_path / "subscriptions.json"
+        subs.write_text(json.dumps([{"name": "busan", "regions": ["부산"]}, {"name": "seoul", "regions": ["서울"]}]),
+                        encoding="utf-8")
+        dests = tmp_path / "destinations.json"
+        dests.write_text(json.dumps([
+            {"name": "alice", "chat_id": "1", "subscription": "busan"},
+            {"name": "bob", "chat_id": "2", "subscription": "seoul"},
+        ]), encoding="utf-8")
+        env = {"DATA_DIR": str(tmp_path), "TELEGRAM_BOT_TOKEN": "tok",
+               "SUBSCRIPTIONS_FILE": str(subs), "DESTINATIONS_FILE": str(dests)}
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = lambda key, default="": env.get(key, default)
+            mon = LHMonitor()
+        assert not mon.tg.enabled
+        for dest in mon.destinations.destinations.values():
+            dest.notifier.send = MagicMock()
+        mon.crawler.fetch_web = MagicMock(return_value=[
+            {"id": "1", "title": "부산 행복주택"}, {"id": "2", "title": "서울 국민임대"},
+        ])
+        mon.check_once()
+        mon.crawler.fetch_web.assert_called_once()
+        alice = mon.destinations.destinations["alice"].notifier.send
+        bob = mon.destinations.destinations["bob"].notifier.send
+        assert [a.id for a in alice.call_args[0][0]] == ["1"]
+        assert [a.id for a in bob.call_args[0][0]] == ["2"]
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """LHMonitor 통합 모킹 테스트"""
 
+import json
+import os
+import signal
+import time
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock, PropertyMock
 
-from lh_monitor import LHMonitor
+import pytest
+
+from lh_monitor import LHMonitor, Unchanged
 
 SAMPLE_ANN = {
     "id": "12345",
@@ -51,6 +58,8 @@ class TestCheckOnce:
             mon = LHMonitor()
         mon.crawler.fetch_api = MagicMock(return_value=[SAMPLE_ANN])
         mon.crawler.fetch_web = MagicMock()
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
         mon.check_once()
         mon.crawler.fetch_api.assert_called_once()
         mon.crawler.fetch_web.assert_not_called()
@@ -62,6 +71,8 @@ class TestCheckOnce:
             mon = LHMonitor()
         mon.crawler.fetch_api = MagicMock(return_value=[])
         mon.crawler.fetch_web = MagicMock(return_value=[SAMPLE_ANN])
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
         mon.check_once()
         mon.crawler.fetch_web.assert_called_once()
 
@@ -166,6 +177,9 @@ class TestMonitorInit:
         mon.crawler.fetch_web = MagicMock(return_value=[SAMPLE_ANN])
         mon.tg.send = MagicMock()
         mon.dc.send = MagicMock()
+        # 21시대에 실행되면 일일 요약이 먼저 나갈 수 있으므로 막아 둔다
+        mon.tg.send_text = MagicMock()
+        mon.dc.send_embed = MagicMock()
         with patch("lh_monitor.time.sleep", side_effect=KeyboardInterrupt):
             try:
                 mon.run()
@@ -174,3 +188,267 @@ class TestMonitorInit:
         # check_once가 실행되어 새 공고 알림이 발송됨
         mon.tg.send.assert_called_once()
         mon.dc.send.assert_called_once()
+
+    def test_sigterm_closes_like_interrupt(self, tmp_path):
+        """동기 모드에서 SIGTERM(docker stop)을 받으면 상태를 저장하고 종료한다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        mon.store.data["last_check"] = "2026-02-19T10:00:00"
+        mon._start = MagicMock(return_value=True)
+        mon.close = MagicMock()
+        before = signal.getsignal(signal.SIGTERM)
+
+        def terminate():
+            os.kill(os.getpid(), signal.SIGTERM)
+            time.sleep(1)  # 처리기가 KeyboardInterrupt를 던져 여기서 빠져나온다
+
+        with patch("lh_monitor.Scheduler.run", side_effect=terminate):
+            with pytest.raises(SystemExit):
+                mon.run()
+        mon.close.assert_called_once()
+        assert signal.getsignal(signal.SIGTERM) is before
+
+
+class TestFetchMode:
+    def test_race_mode_uses_fetch_race(self, tmp_path):
+        """FETCH_MODE=race이면 fetch_race로 수집한다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), FETCH_MODE="race")
+            mon = LHMonitor()
+        mon.crawler.fetch_race = MagicMock(return_value=[SAMPLE_ANN])
+        mon.crawler.fetch_web = MagicMock()
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
+        assert mon.check_once() == [SAMPLE_ANN]
+        mon.crawler.fetch_web.assert_not_called()
+
+    def test_unhealthy_api_tried_after_web(self, tmp_path):
+        """API 서킷이 열려 있으면 웹 소스를 먼저 호출한다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), DATA_GO_KR_API_KEY="mykey")
+            mon = LHMonitor()
+        for _ in range(mon.crawler.health.failure_threshold):
+            mon.crawler.health.record("api", False, 30.0)
+        mon.crawler.fetch_api = MagicMock(return_value=[])
+        mon.crawler.fetch_web = MagicMock(return_value=[SAMPLE_ANN])
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
+        mon.check_once()
+        mon.crawler.fetch_web.assert_called_once()
+        mon.crawler.fetch_api.assert_not_called()
+        assert (tmp_path / "health.json").exists()
+
+    def test_poll_deadline_passed_to_crawler(self, tmp_path):
+        """POLL_DEADLINE이 있으면 절대 시각 deadline을 수집 함수에 넘긴다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), POLL_DEADLINE="20")
+            mon = LHMonitor()
+        mon.crawler.fetch_web = MagicMock(return_value=[])
+        with patch("lh_monitor.time.monotonic", return_value=1000.0):
+            mon.check_once()
+        assert mon.crawler.fetch_web.call_args[1]["deadline"] == 1020.0
+
+    def test_check_once_budget_overrides_env(self, tmp_path):
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        mon.crawler.fetch_web = MagicMock(return_value=[])
+        mon.check_once()
+        assert mon.crawler.fetch_web.call_args[1]["deadline"] is None
+        with patch("lh_monitor.time.monotonic", return_value=10.0):
+            mon.check_once(budget=5)
+        assert mon.crawler.fetch_web.call_args[1]["deadline"] == 15.0
+
+
+    def test_unchanged_listing_skips_check(self, tmp_path):
+        """목록이 직전과 같으면 필터·중복 검사·알림 없이 캐시 적중만 기록한다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        mon.crawler.fetch_web = MagicMock(side_effect=Unchanged("html 본문 동일"))
+        mon.store.is_new = MagicMock()
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
+        assert mon.check_once() == []
+        assert mon.cache_hits == 1
+        assert mon.store.data["last_check"]
+        mon.store.is_new.assert_not_called()
+        mon.tg.send.assert_not_called()
+
+    def test_empty_api_does_not_hide_changing_json_listing(self, tmp_path):
+        """API가 매번 같은 빈 응답이어도 JSON 목록의 새 공고를 놓치지 않는다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), DATA_GO_KR_API_KEY="key")
+            mon = LHMonitor()
+        mon.store.update_check_time()
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
+
+        def response(payload):
+            body = json.dumps(payload, ensure_ascii=False)
+            resp = MagicMock(status_code=200, content=body.encode("utf-8"), headers={})
+            resp.json = MagicMock(return_value=payload)
+            return resp
+
+        def listing(*ids):
+            return response({"dsList": [{"panId": i, "panNm": f"부산 공고 {i}", "aisTpCd": "06"} for i in ids]})
+
+        empty_api = {"response": {"body": {"items": ""}}}
+        mon.crawler.session.get = MagicMock(side_effect=lambda *a, **k: response(empty_api))
+        notified = []
+        for ids in (["A"], ["B", "A"], ["C", "B", "A"]):
+            mon.crawler.session.post = MagicMock(return_value=listing(*ids))
+            notified.append([a.id for a in mon.check_once()])
+        assert notified == [["A"], ["B"], ["C"]]
+        assert mon.cache_hits == 0
+        assert "api" not in mon.crawler._fingerprints
+
+    def test_fingerprints_committed_after_check(self, tmp_path):
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        mon.crawler.fetch_web = MagicMock(return_value=[])
+        mon.crawler._pending_fingerprints["html"] = {"hash": "abc", "etag": "", "last_modified": ""}
+        mon.check_once()
+        assert mon.crawler._fingerprints["html"]["hash"] == "abc"
+
+
+class TestConcurrentNotify:
+    def test_channels_run_in_parallel(self, tmp_path):
+        """Discord 발송이 Telegram 발송이 끝나기를 기다리지 않는다."""
+        import threading
+
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        dc_started = threading.Event()
+
+        def slow_tg(anns):
+            # Discord가 시작해야만 Telegram이 끝난다: 순차 실행이면 타임아웃
+            assert dc_started.wait(5)
+
+        mon.crawler.fetch_web = MagicMock(return_value=[SAMPLE_ANN])
+        mon.tg.send = MagicMock(side_effect=slow_tg)
+        mon.dc.send = MagicMock(side_effect=lambda anns: dc_started.set())
+        mon.check_once()
+        mon.tg.send.assert_called_once_with([SAMPLE_ANN])
+        mon.dc.send.assert_called_once_with([SAMPLE_ANN])
+
+    def test_channel_error_isolated(self, tmp_path):
+        """한 채널의 예외가 다른 채널 발송이나 check_once를 막지 않는다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        mon.crawler.fetch_web = MagicMock(return_value=[SAMPLE_ANN])
+        mon.tg.send = MagicMock(side_effect=RuntimeError("boom"))
+        mon.dc.send = MagicMock()
+        assert mon.check_once() == [SAMPLE_ANN]
+        mon.dc.send.assert_called_once()
+
+    def test_daily_summary_both_channels(self, tmp_path):
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        mon.summary.add(SAMPLE_ANN)
+        mon.tg.send_text = MagicMock()
+        mon.dc.send_embed = MagicMock()
+        mon.send_daily_summary()
+        mon.tg.send_text.assert_called_once()
+        mon.dc.send_embed.assert_called_once()
+
+    def test_close_drains_pools_before_flush(self, tmp_path):
+        """close()는 진행 중인 알림을 기다리고 워커 풀을 닫은 뒤 상태를 저장한다."""
+        import threading
+
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        sent = threading.Event()
+
+        def slow_send(anns):
+            time.sleep(0.1)
+            sent.set()
+
+        mon._notify_pool.submit(slow_send, [SAMPLE_ANN])
+        flushed_after_send = []
+        mon.flush_state = MagicMock(side_effect=lambda final=False: flushed_after_send.append(sent.is_set()))
+        mon.close()
+        assert flushed_after_send == [True]
+        with pytest.raises(RuntimeError):
+            mon._notify_pool.submit(slow_send, [])
+        with pytest.raises(RuntimeError):
+            mon.delivery._pool.submit(slow_send, [])
+
+
+class TestSQLiteBackend:
+    def test_sqlite_backend_check_once(self, tmp_path):
+        """STORAGE_BACKEND=sqlite이면 SQLite에 체크 결과를 기록한다."""
+        from lh_monitor import SQLiteStore, SQLiteSummary
+
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), STORAGE_BACKEND="sqlite")
+            mon = LHMonitor()
+        assert isinstance(mon.store, SQLiteStore)
+        assert isinstance(mon.summary, SQLiteSummary)
+        mon.crawler.fetch_web = MagicMock(return_value=[SAMPLE_ANN])
+        mon.tg.send = MagicMock()
+        mon.dc.send = MagicMock()
+        mon.check_once()
+        db = mon.store.db
+        assert db.conn.execute("SELECT id FROM seen").fetchall() == [("12345",)]
+        assert db.conn.execute("SELECT COUNT(*) FROM summary").fetchone()[0] == 1
+        assert [n for _, n in db.check_history()] == [1]
+
+
+class TestPollDelay:
+    def test_fixed_by_default(self, tmp_path):
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            mon = LHMonitor()
+        assert mon.schedule is None
+        assert mon.next_delay() == 1800
+
+    def test_adaptive_learns_from_first_seen(self, tmp_path):
+        """POLL_SCHEDULE=adaptive이면 기록된 first_seen 시각으로 대기 시간을 정한다."""
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path), POLL_SCHEDULE="adaptive", POLL_JITTER="0")
+            mon = LHMonitor()
+        start = datetime(2026, 6, 1, 10, 15)
+        for k in range(60):
+            mon.store.seen[f"id{k}"] = (start + timedelta(days=k)).isoformat()
+        delay = mon.next_delay()
+        assert mon.schedule.learned
+        assert 300 <= delay <= 7200
+
+
+class TestMainSchedule:
+    def _mon(self, tmp_path):
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = _make_monitor(DATA_DIR=str(tmp_path))
+            return LHMonitor()
+
+    def test_poll_summary_and_flush_are_separate_jobs(self, tmp_path):
+        mon = self._mon(tmp_path)
+        jobs = {job.name: job for _, _, job in mon.build_scheduler()._heap}
+        assert set(jobs) == {"체크", "일일 요약", "상태 저장"}
+        assert jobs["체크"].retry == 60
+
+    def test_next_summary_time(self, tmp_path):
+        mon = self._mon(tmp_path)
+        assert mon._next_summary_time(datetime(2026, 6, 1, 20, 59)) == datetime(2026, 6, 1, 21, 0)
+        assert mon._next_summary_time(datetime(2026, 6, 1, 21, 0)) == datetime(2026, 6, 2, 21, 0)
+
+    def test_summary_job_sends_once_per_day(self, tmp_path):
+        mon = self._mon(tmp_path)
+        mon.send_daily_summary = MagicMock(side_effect=lambda: setattr(
+            mon, "daily_sent_date", mon._summary_day(datetime.now())))
+        mon._daily_summary_job()
+        mon._daily_summary_job()
+        mon.send_daily_summary.assert_called_once()
+
+    def test_summary_day_is_last_scheduled_run(self, tmp_path):
+        """21시 전이면 전날 회차, 21시부터는 그날 회차로 본다."""
+        mon = self._mon(tmp_path)
+        assert mon._summary_day(datetime(2026, 6, 2, 8, 0)) == "2026-06-01"
+        assert mon._summary_day(datetime(2026, 6, 2, 21, 0)) == "2026-06-02"
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 """TelegramNotifier / DiscordNotifier 모킹 기반 단위 테스트"""
 
+import json
+import time
 from unittest.mock import patch, MagicMock, call
 
-from lh_monitor import TelegramNotifier, DiscordNotifier
+import pytest
+import requests
+
+from lh_monitor import (DeliveryError, TelegramNotifier, DiscordNotifier, RateLimiter, Stopped,
+                        build_notifier_session)
 
 SAMPLE_ANN = {
     "id": "12345",
@@ -17,6 +23,11 @@ SAMPLE_ANN = {
 }
 
 
+def _payload(c):
+    """session.post 호출 하나의 JSON 본문 (미리 직렬화된 data 바이트)."""
+    return json.loads(c[1]["data"])
+
+
 # ── TelegramNotifier ─────────────────────────────────────────
 
 
@@ -35,7 +46,7 @@ class TestTelegramEnabled:
 
 
 class TestTelegramSend:
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_disabled_no_http(self, mock_post):
         """enabled=False이면 HTTP 요청을 하지 않는다."""
         tg = TelegramNotifier("", "")
@@ -43,7 +54,7 @@ class TestTelegramSend:
         mock_post.assert_not_called()
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_sends_correct_api_url(self, mock_post, _sleep):
         """올바른 Telegram API URL로 POST 요청을 보낸다."""
         mock_post.return_value = MagicMock(status_code=200)
@@ -54,46 +65,50 @@ class TestTelegramSend:
         assert "/sendMessage" in args[0]
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_payload_has_html_parse_mode(self, mock_post, _sleep):
         """parse_mode가 HTML로 설정된다."""
         mock_post.return_value = MagicMock(status_code=200)
         tg = TelegramNotifier("tok", "123")
         tg.send([SAMPLE_ANN])
-        payload = mock_post.call_args[1].get("json") or mock_post.call_args[1].get("data")
+        payload = _payload(mock_post.call_args)
         assert payload["parse_mode"] == "HTML"
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_message_contains_html_tags(self, mock_post, _sleep):
         """메시지에 HTML 태그가 포함된다."""
         mock_post.return_value = MagicMock(status_code=200)
         tg = TelegramNotifier("tok", "123")
         tg.send([SAMPLE_ANN])
-        payload = mock_post.call_args[1].get("json") or mock_post.call_args[1].get("data")
+        payload = _payload(mock_post.call_args)
         text = payload["text"]
         assert "<b>" in text
         assert "<a href=" in text
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
-    def test_send_failure_no_exception(self, mock_post, _sleep):
-        """발송 실패 시 예외가 전파되지 않는다."""
-        mock_post.side_effect = Exception("network error")
+    @patch.object(requests.Session, "post")
+    def test_send_failure_reported_after_all_attempts(self, mock_post, _sleep):
+        """실패한 메시지가 있어도 나머지를 모두 보낸 뒤 DeliveryError로 알린다 (403 차단 포함)."""
+        mock_post.side_effect = [Exception("network error"), MagicMock(status_code=403),
+                                 MagicMock(status_code=200)]
         tg = TelegramNotifier("tok", "123")
-        tg.send([SAMPLE_ANN])  # 예외 없이 통과
+        with pytest.raises(DeliveryError) as exc:
+            tg.send([SAMPLE_ANN] * 3)
+        assert (exc.value.failed, exc.value.total) == (2, 3)
+        assert mock_post.call_count == 3
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_send_text(self, mock_post, _sleep):
         """send_text()가 텍스트를 그대로 전송한다."""
         mock_post.return_value = MagicMock(status_code=200)
         tg = TelegramNotifier("tok", "123")
         tg.send_text("hello")
-        payload = mock_post.call_args[1].get("json") or mock_post.call_args[1].get("data")
+        payload = _payload(mock_post.call_args)
         assert payload["text"] == "hello"
 
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_send_text_disabled_no_http(self, mock_post):
         """enabled=False이면 send_text도 HTTP 요청 안 한다."""
         tg = TelegramNotifier("", "")
@@ -115,7 +130,7 @@ class TestDiscordEnabled:
 
 
 class TestDiscordSend:
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_disabled_no_http(self, mock_post):
         """enabled=False이면 HTTP 요청을 하지 않는다."""
         dc = DiscordNotifier("")
@@ -123,14 +138,14 @@ class TestDiscordSend:
         mock_post.assert_not_called()
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_embed_has_required_fields(self, mock_post, _sleep):
         """Embed JSON에 title, url, color, fields, footer, timestamp가 포함된다."""
         resp = MagicMock(status_code=204)
         mock_post.return_value = resp
         dc = DiscordNotifier("https://hook")
         dc.send([SAMPLE_ANN])
-        payload = mock_post.call_args[1].get("json")
+        payload = _payload(mock_post.call_args)
         embed = payload["embeds"][0]
         assert "title" in embed
         assert "url" in embed
@@ -140,40 +155,40 @@ class TestDiscordSend:
         assert "timestamp" in embed
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_color_accepting(self, mock_post, _sleep):
         """접수중 → 0x00FF00."""
         mock_post.return_value = MagicMock(status_code=204)
         dc = DiscordNotifier("https://hook")
         ann = {**SAMPLE_ANN, "status": "접수중"}
         dc.send([ann])
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _payload(mock_post.call_args)["embeds"][0]
         assert embed["color"] == 0x00FF00
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_color_upcoming(self, mock_post, _sleep):
         """접수예정 → 0x0099FF."""
         mock_post.return_value = MagicMock(status_code=204)
         dc = DiscordNotifier("https://hook")
         ann = {**SAMPLE_ANN, "status": "접수예정"}
         dc.send([ann])
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _payload(mock_post.call_args)["embeds"][0]
         assert embed["color"] == 0x0099FF
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_color_closed(self, mock_post, _sleep):
         """접수마감 → 0xFF0000."""
         mock_post.return_value = MagicMock(status_code=204)
         dc = DiscordNotifier("https://hook")
         ann = {**SAMPLE_ANN, "status": "접수마감"}
         dc.send([ann])
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _payload(mock_post.call_args)["embeds"][0]
         assert embed["color"] == 0xFF0000
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_response_200_and_204_both_ok(self, mock_post, _sleep):
         """응답 코드 200, 204 모두 성공 처리."""
         for code in (200, 204):
@@ -182,27 +197,262 @@ class TestDiscordSend:
             dc.send([SAMPLE_ANN])  # 예외 없이 통과
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
-    def test_send_failure_no_exception(self, mock_post, _sleep):
-        """발송 실패 시 예외가 전파되지 않는다."""
-        mock_post.side_effect = Exception("network error")
-        dc = DiscordNotifier("https://hook")
-        dc.send([SAMPLE_ANN])  # 예외 없이 통과
+    @patch.object(requests.Session, "post")
+    def test_send_failure_reported_after_all_attempts(self, mock_post, _sleep):
+        """실패한 묶음이 있어도 나머지 묶음을 보낸 뒤 DeliveryError로 알린다."""
+        mock_post.side_effect = [Exception("network error"), MagicMock(status_code=204)]
+        dc = DiscordNotifier("https://hook", batch_size=1)
+        with pytest.raises(DeliveryError) as exc:
+            dc.send([SAMPLE_ANN] * 2)
+        assert (exc.value.failed, exc.value.total) == (1, 2)
+        assert mock_post.call_count == 2
 
     @patch("lh_monitor.time.sleep")
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_send_embed(self, mock_post, _sleep):
         """send_embed()가 Embed를 직접 전송한다."""
         mock_post.return_value = MagicMock(status_code=200)
         dc = DiscordNotifier("https://hook")
         embed = {"title": "요약", "color": 0x0099FF}
         dc.send_embed(embed)
-        payload = mock_post.call_args[1]["json"]
+        payload = _payload(mock_post.call_args)
         assert payload["embeds"][0]["title"] == "요약"
 
-    @patch("lh_monitor.requests.post")
+    @patch.object(requests.Session, "post")
     def test_send_embed_disabled_no_http(self, mock_post):
         """enabled=False이면 send_embed도 HTTP 요청 안 한다."""
         dc = DiscordNotifier("")
         dc.send_embed({"title": "test"})
         mock_post.assert_not_called()
+
+
+# ── 알림 HTTP 세션 ───────────────────────────────────────────
+
+
+class TestNotifierSession:
+    def test_adapter_pool_and_retry(self):
+        """https 어댑터에 연결 풀 크기와 POST 재시도 정책이 설정된다."""
+        s = build_notifier_session(pool_size=8, retries=2)
+        adapter = s.get_adapter("https://api.telegram.org")
+        assert adapter._pool_maxsize == 8
+        retry = adapter.max_retries
+        assert retry.total == 2
+        assert retry.read == 0
+        assert "POST" in retry.allowed_methods
+        assert not retry.status_forcelist
+
+    def test_post_retried_only_when_server_did_not_process(self):
+        """502는 원 서버가 이미 보냈을 수 있어 재시도하지 않고, Retry-After가 붙은 503만 재시도한다."""
+        retry = build_notifier_session().get_adapter("https://api.telegram.org").max_retries
+        assert retry.is_retry("POST", 503, has_retry_after=True)
+        assert not retry.is_retry("POST", 503, has_retry_after=False)
+        assert not retry.is_retry("POST", 502, has_retry_after=True)
+        assert not retry.is_retry("POST", 500, has_retry_after=False)
+        # 429는 post_with_limit이 RateLimiter와 함께 처리한다
+        assert not retry.is_retry("POST", 429, has_retry_after=True)
+        # 연결 실패는 재시도하고, 다음 회차도 같은 정책을 쓴다
+        from urllib3.exceptions import ConnectTimeoutError
+
+        assert type(retry.increment("POST", "/x", error=ConnectTimeoutError())) is type(retry)
+
+    def test_notifiers_share_given_session(self):
+        s = build_notifier_session()
+        assert TelegramNotifier("tok", "1", session=s).session is s
+        assert DiscordNotifier("https://hook", session=s).session is s
+
+    def test_default_session_per_notifier(self):
+        assert isinstance(TelegramNotifier("tok", "1").session, requests.Session)
+
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_send_reuses_session(self, mock_post, _sleep):
+        """여러 건 발송 시 모듈 수준 requests.post가 아닌 세션으로 보낸다."""
+        mock_post.return_value = MagicMock(status_code=200)
+        with patch("lh_monitor.requests.post") as module_post:
+            TelegramNotifier("tok", "123").send([SAMPLE_ANN, SAMPLE_ANN])
+        module_post.assert_not_called()
+        assert mock_post.call_count == 2
+
+
+# ── RateLimiter ──────────────────────────────────────────────
+
+
+def _resp(status, headers=None, body=None):
+    resp = MagicMock(status_code=status)
+    resp.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    resp.json.return_value = body or {}
+    return resp
+
+
+class TestRateLimiter:
+    @patch("lh_monitor.time.sleep")
+    def test_burst_without_wait(self, mock_sleep):
+        """버킷 용량 안에서는 대기하지 않는다."""
+        lim = RateLimiter(rate=1.0, burst=3)
+        for _ in range(3):
+            lim.acquire()
+        mock_sleep.assert_not_called()
+
+    @patch("lh_monitor.time.sleep")
+    def test_empty_bucket_waits_refill_time(self, mock_sleep):
+        with patch("lh_monitor.time.monotonic", return_value=0.0):
+            lim = RateLimiter(rate=2.0, burst=1)
+            lim.acquire()
+            lim.acquire()
+        assert mock_sleep.call_args[0][0] == 0.5
+
+    @patch("lh_monitor.time.sleep")
+    def test_discord_bucket_headers_block(self, mock_sleep):
+        """X-RateLimit-Remaining이 0이면 Reset-After만큼 다음 발송을 미룬다."""
+        with patch("lh_monitor.time.monotonic", return_value=0.0):
+            lim = RateLimiter(rate=100.0, burst=10)
+            assert lim.observe(_resp(204, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"})) is None
+            lim.acquire()
+        assert mock_sleep.call_args[0][0] == 1.5
+
+    def test_stop_interrupts_wait(self):
+        """종료 신호를 받으면 대기를 멈추고 Stopped를 던진다."""
+        import threading
+
+        stop = threading.Event()
+        lim = RateLimiter(rate=1.0, burst=1, stop=stop)
+        lim.block_for(30)
+        threading.Timer(0.05, stop.set).start()
+        started = time.monotonic()
+        with pytest.raises(Stopped):
+            lim.acquire()
+        assert time.monotonic() - started < 5
+        with pytest.raises(Stopped):
+            lim.acquire()
+
+    def test_telegram_retry_after_body(self):
+        lim = RateLimiter(rate=1.0, burst=1)
+        resp = _resp(429, body={"ok": False, "error_code": 429, "parameters": {"retry_after": 7}})
+        assert lim.observe(resp) == 7.0
+
+    def test_discord_retry_after_body(self):
+        lim = RateLimiter(rate=1.0, burst=1)
+        assert lim.observe(_resp(429, body={"retry_after": 0.25, "global": False})) == 0.25
+
+    def test_retry_after_header_fallback(self):
+        lim = RateLimiter(rate=1.0, burst=1)
+        resp = _resp(429, {"Retry-After": "3"})
+        resp.json.side_effect = ValueError("not json")
+        assert lim.observe(resp) == 3.0
+
+
+class TestRateLimitedSend:
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_telegram_429_retried(self, mock_post, mock_sleep):
+        """429를 받은 메시지는 retry_after만큼 기다린 뒤 다시 보낸다."""
+        mock_post.side_effect = [
+            _resp(429, body={"parameters": {"retry_after": 4}}),
+            _resp(200),
+        ]
+        TelegramNotifier("tok", "123").send([SAMPLE_ANN])
+        assert mock_post.call_count == 2
+        assert any(c[0][0] >= 3.9 for c in mock_sleep.call_args_list)
+
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_no_fixed_sleep_with_headroom(self, mock_post, mock_sleep):
+        """버킷 여유가 있으면 고정 0.5초 대기 없이 연속 발송한다."""
+        mock_post.return_value = _resp(204)
+        DiscordNotifier("https://hook").send([SAMPLE_ANN] * 3)
+        mock_sleep.assert_not_called()
+
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_gives_up_after_attempts(self, mock_post, _sleep):
+        mock_post.return_value = _resp(429, body={"retry_after": 0.1})
+        DiscordNotifier("https://hook").send_embed({"title": "t"})
+        assert mock_post.call_count == 3
+
+
+# ── Discord 묶음 발송 ─────────────────────────────────────────
+
+
+class TestDiscordBatch:
+    @patch.object(requests.Session, "post")
+    def test_packs_up_to_ten_embeds(self, mock_post):
+        """23건은 10 + 10 + 3개 Embed로 세 번 나눠 보낸다."""
+        mock_post.return_value = MagicMock(status_code=204)
+        anns = [{**SAMPLE_ANN, "id": str(i)} for i in range(23)]
+        DiscordNotifier("https://hook").send(anns)
+        sizes = [len(_payload(c)["embeds"]) for c in mock_post.call_args_list]
+        assert sizes == [10, 10, 3]
+
+    @patch.object(requests.Session, "post")
+    def test_order_preserved(self, mock_post):
+        mock_post.return_value = MagicMock(status_code=204)
+        anns = [{**SAMPLE_ANN, "title": f"공고{i}"} for i in range(12)]
+        DiscordNotifier("https://hook").send(anns)
+        titles = [e["title"] for c in mock_post.call_args_list for e in _payload(c)["embeds"]]
+        assert titles == [f"🏠 공고{i}" for i in range(12)]
+
+    def test_respects_total_char_limit(self):
+        """Embed 글자 수 합계가 6000자를 넘지 않도록 나눈다."""
+        dc = DiscordNotifier("https://hook")
+        items = [(SAMPLE_ANN, {"title": "t", "description": "가" * 2500}) for _ in range(5)]
+        batches = dc._batches(items)
+        assert [len(b) for b in batches] == [2, 2, 1]
+        for b in batches:
+            assert sum(dc._embed_chars(e) for _, e in b) <= DiscordNotifier.MAX_EMBED_CHARS
+
+    @patch.object(requests.Session, "post")
+    def test_batch_size_one_sends_individually(self, mock_post):
+        mock_post.return_value = MagicMock(status_code=204)
+        DiscordNotifier("https://hook", batch_size=1).send([SAMPLE_ANN] * 3)
+        assert mock_post.call_count == 3
+
+
+# ── Telegram 묶음 발송 ────────────────────────────────────────
+
+
+class TestTelegramDigest:
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_below_threshold_individual(self, mock_post, _sleep):
+        """임계값 이하이면 공고마다 개별 메시지를 보낸다."""
+        mock_post.return_value = MagicMock(status_code=200)
+        TelegramNotifier("tok", "123", digest_threshold=5).send([SAMPLE_ANN] * 5)
+        assert mock_post.call_count == 5
+
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_above_threshold_single_digest(self, mock_post, _sleep):
+        """임계값을 넘으면 한도 안에서 한 메시지로 묶는다."""
+        mock_post.return_value = MagicMock(status_code=200)
+        anns = [{**SAMPLE_ANN, "title": f"부산 공고{i}"} for i in range(15)]
+        TelegramNotifier("tok", "123", digest_threshold=5).send(anns)
+        assert mock_post.call_count == 1
+        text = _payload(mock_post.call_args)["text"]
+        assert "15건" in text
+        assert all(f"부산 공고{i}" in text for i in range(15))
+
+    def test_split_respects_limit_and_tags(self):
+        """긴 묶음은 4096자 이하로 나누고, 각 메시지의 태그는 짝이 맞는다."""
+        tg = TelegramNotifier("tok", "123", digest_threshold=1)
+        anns = [{**SAMPLE_ANN, "title": f"공고{i} " + "가" * 200} for i in range(60)]
+        messages = tg._digest_messages(anns)
+        assert len(messages) > 1
+        for msg in messages:
+            assert tg._tg_len(msg) <= TelegramNotifier.MAX_MESSAGE_CHARS
+            assert msg.count("<b>") == msg.count("</b>")
+            assert msg.count("<a ") == msg.count("</a>")
+        joined = "".join(messages)
+        assert all(f"공고{i} " in joined for i in range(60))
+        assert messages[0].index("공고0 ") < messages[-1].index("공고59 ")
+
+    def test_long_title_truncated(self):
+        tg = TelegramNotifier("tok", "123", digest_threshold=1)
+        block = tg._digest_block({**SAMPLE_ANN, "title": "가" * 5000})
+        assert tg._tg_len(block) < TelegramNotifier.MAX_MESSAGE_CHARS
+
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_zero_threshold_disables_digest(self, mock_post, _sleep):
+        mock_post.return_value = MagicMock(status_code=200)
+        TelegramNotifier("tok", "123").send([SAMPLE_ANN] * 8)
+        assert mock_post.call_count == 8
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""atomic_write_json / JsonStateFile 단위 테스트"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from lh_monitor import atomic_write_json, JsonStateFile
+
+
+class TestAtomicWriteJson:
+    def test_writes_file(self, tmp_path):
+        fp = tmp_path / "state.json"
+        atomic_write_json(str(fp), {"a": 1})
+        assert json.loads(fp.read_text()) == {"a": 1}
+
+    def test_failure_keeps_original_and_no_temp(self, tmp_path):
+        """직렬화 도중 실패해도 기존 파일이 그대로 남고 임시 파일도 지워진다."""
+        fp = tmp_path / "state.json"
+        fp.write_text('{"ok": true}')
+        with pytest.raises(TypeError):
+            atomic_write_json(str(fp), {"bad": object()})
+        assert json.loads(fp.read_text()) == {"ok": True}
+        assert os.listdir(tmp_path) == ["state.json"]
+
+    def test_fsyncs_before_rename(self, tmp_path):
+        fp = tmp_path / "state.json"
+        calls = []
+        with patch("lh_monitor.os.fsync", side_effect=lambda fd: calls.append("fsync")), \
+                patch("lh_monitor.os.replace", side_effect=lambda a, b: calls.append("replace") or os.rename(a, b)):
+            atomic_write_json(str(fp), {"a": 1})
+        assert calls[:2] == ["fsync", "replace"]
+
+
+class TestJsonStateFile:
+    def test_skips_identical_content(self, tmp_path):
+        st = JsonStateFile(str(tmp_path / "s.json"))
+        assert st.write({"a": 1}) is True
+        assert st.write({"a": 1}) is False
+        assert st.write({"a": 2}) is True
+
+    def test_coalesces_non_urgent_writes(self, tmp_path):
+        """flush_interval 안의 non-urgent 변경은 보류했다가 flush()에서 쓴다."""
+        fp = tmp_path / "s.json"
+        st = JsonStateFile(str(fp), flush_interval=300)
+        with patch("lh_monitor.time.monotonic", return_value=1000.0):
+            st.write({"n": 1}, urgent=False)
+        with patch("lh_monitor.time.monotonic", return_value=1010.0):
+            assert st.write({"n": 2}, urgent=False) is False
+            assert st.write({"n": 3}, urgent=False) is False
+        assert json.loads(fp.read_text()) == {"n": 1}
+        with patch("lh_monitor.time.monotonic", return_value=1020.0):
+            assert st.flush() is True
+        assert json.loads(fp.read_text()) == {"n": 3}
+        assert st.flush() is False
+
+    def test_interval_elapsed_writes(self, tmp_path):
+        fp = tmp_path / "s.json"
+        st = JsonStateFile(str(fp), flush_interval=300)
+        with patch("lh_monitor.time.monotonic", return_value=1000.0):
+            st.write({"n": 1}, urgent=False)
+        with patch("lh_monitor.time.monotonic", return_value=1301.0):
+            assert st.write({"n": 2}, urgent=False) is True
+
+    def test_volatile_only_change_deferred_to_final_flush(self, tmp_path):
+        fp = tmp_path / "s.json"
+        st = JsonStateFile(str(fp), volatile=("t",))
+        assert st.write({"n": 1, "t": 1}) is True
+        assert st.write({"n": 1, "t": 2}) is False
+        assert st.flush(volatile=False) is False
+        assert st.flush() is True
+        assert json.loads(fp.read_text()) == {"n": 1, "t": 2}
+
+    def test_urgent_bypasses_interval(self, tmp_path):
+        st = JsonStateFile(str(tmp_path / "s.json"), flush_interval=300)
+        st.write({"n": 1}, urgent=False)
+        assert st.write({"n": 2}, urgent=True) is True
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""PollSchedule 단위 테스트"""
+
+import random
+from datetime import datetime, timedelta
+
+from lh_monitor import PollSchedule
+
+
+def _weekday_mornings(days=60):
+    """평일 10시대에만 새 공고가 나온 기록."""
+    start = datetime(2026, 6, 1, 10, 15)  # 월요일
+    return [(start + timedelta(days=k)).isoformat() for k in range(days) if (start + timedelta(days=k)).weekday() < 5]
+
+
+class TestPollSchedule:
+    def test_too_few_events_keeps_fixed_interval(self):
+        s = PollSchedule(1800)
+        s.learn(_weekday_mornings(7))
+        assert not s.learned
+        assert set(s.intervals) == {1800}
+
+    def test_dense_in_publishing_window(self):
+        s = PollSchedule(1800, min_interval=300, max_interval=7200)
+        s.learn(_weekday_mornings())
+        monday_10 = s.intervals[10]
+        sunday_3 = s.intervals[6 * 24 + 3]
+        assert 300 <= monday_10 < 1800 < sunday_3 <= 7200
+
+    def test_same_request_budget_lower_latency(self):
+        s = PollSchedule(1800, min_interval=60, max_interval=7200)
+        s.learn(_weekday_mornings())
+        assert abs(s.requests_per_day() - 48) < 0.5
+        assert s.expected_latency() < 1800 / 2
+
+    def test_bulk_records_count_once(self):
+        """첫 실행처럼 같은 시각에 한꺼번에 기록된 ID는 발생 한 번이다."""
+        s = PollSchedule(1800)
+        s.learn(["2026-06-01T10:00:00"] * 500 + ["bad", None])
+        assert s.events == 1
+
+    def test_next_delay_pulled_to_dense_slot_with_jitter(self):
+        s = PollSchedule(1800, min_interval=300, max_interval=7200, jitter=0.1, rng=random.Random(1))
+        s.learn(_weekday_mornings())
+        delay = s.next_delay(datetime(2026, 6, 1, 9, 50))  # 월요일 9:50, 10분 뒤 촘촘한 칸
+        assert delay <= (600 + s.intervals[10]) * 1.1
+
+    def test_tradeoff_report(self):
+        s = PollSchedule(1800)
+        s.learn(_weekday_mornings())
+        rows = s.tradeoff((1, 2))
+        assert rows[0][0] < rows[1][0]
+        assert rows[0][1] > rows[1][1]
+        assert "예상 지연" in s.report()
+
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""MessageTemplate / MessageRenderer 단위 테스트 및 notifier 연동 테스트"""
+
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+import requests
+
+from lh_monitor import (
+    Announcement, DeliveryPool, Destination, DestinationRegistry, DiscordNotifier, MessageRenderer,
+    MessageTemplate, TelegramNotifier,
+)
+
+SAMPLE_ANN = Announcement(
+    id="12345", title="부산강서 국민임대", rental_type="국민임대", status="접수중", reg_date="2026-02-19",
+    rcpt_begin="2026-03-01", rcpt_end="2026-03-15", url="https://apply.lh.or.kr/detail/12345",
+)
+
+
+class TestMessageTemplate:
+    def test_render(self):
+        t = MessageTemplate("{title} 100% [{status}] {title}")
+        assert t.render(SAMPLE_ANN) == "부산강서 국민임대 100% [접수중] 부산강서 국민임대"
+
+    def test_single_and_no_fields(self):
+        assert MessageTemplate("<{id}>").render(SAMPLE_ANN) == "<12345>"
+        assert MessageTemplate("고정 문구").render(SAMPLE_ANN) == "고정 문구"
+
+    def test_unknown_field_rejected_at_compile(self):
+        with pytest.raises(ValueError):
+            MessageTemplate("{region}")
+        with pytest.raises(ValueError):
+            MessageTemplate("{title!r}")
+
+
+class TestMessageRenderer:
+    def test_renders_once_per_format(self):
+        r = MessageRenderer()
+        first = r.embed(SAMPLE_ANN)
+        assert r.embed(SAMPLE_ANN.to_dict()) is first
+        assert r.embed_json(SAMPLE_ANN) is r.embed_json(SAMPLE_ANN)
+        assert r.telegram(SAMPLE_ANN) is r.telegram(SAMPLE_ANN)
+        assert json.loads(r.embed_json(SAMPLE_ANN)) == first
+        assert json.loads(r.telegram_json(SAMPLE_ANN)) == r.telegram(SAMPLE_ANN)
+
+    def test_stable_timestamp(self):
+        r = MessageRenderer()
+        stamp = r.embed(SAMPLE_ANN)["timestamp"]
+        with patch("lh_monitor.datetime") as dt:
+            dt.now.return_value.isoformat.return_value = "2099-01-01T00:00:00"
+            assert r.embed(SAMPLE_ANN)["timestamp"] == stamp
+
+    def test_changed_content_rerendered(self):
+        r = MessageRenderer()
+        r.telegram(SAMPLE_ANN)
+        closed = Announcement.of({**SAMPLE_ANN.to_dict(), "status": "접수마감"})
+        assert "접수마감" in r.telegram(closed)
+
+    def test_custom_templates_change_version(self, tmp_path):
+        path = tmp_path / "templates.json"
+        path.write_text(json.dumps({"telegram": "새 공고: {title}", "discord_title": "[{rental_type}] {title}"}),
+                        encoding="utf-8")
+        custom = MessageRenderer.load(str(path))
+        assert custom.version != MessageRenderer().version
+        assert custom.telegram(SAMPLE_ANN) == "새 공고: 부산강서 국민임대"
+        assert custom.embed(SAMPLE_ANN)["title"] == "[국민임대] 부산강서 국민임대"
+        assert custom.embed(SAMPLE_ANN)["footer"]["text"] == MessageRenderer.DISCORD_FOOTER
+
+    def test_bounded_cache(self):
+        r = MessageRenderer(max_entries=3)
+        for i in range(10):
+            r.telegram(Announcement(id=str(i), title=f"공고{i}"))
+        assert len(r._cache) == 3
+
+
+class TestSharedRendering:
+    @patch("lh_monitor.time.sleep")
+    @patch.object(requests.Session, "post")
+    def test_destinations_reuse_rendered_bodies(self, mock_post, _sleep):
+        """수신처가 여럿이어도 공고당 형식별로 한 번만 렌더링한다."""
+        mock_post.return_value = MagicMock(status_code=200)
+        dests = [Destination(f"tg{i}", "telegram", str(i)) for i in range(5)]
+        dests += [Destination(f"dc{i}", "discord", f"https://hook/{i}") for i in range(5)]
+        reg = DestinationRegistry(dests, telegram_token="tok")
+        with patch.object(MessageRenderer, "_build_embed", wraps=reg.renderer._build_embed) as build:
+            DeliveryPool(reg, workers=4).deliver({"default": [SAMPLE_ANN]})
+        assert build.call_count == 1
+        assert reg.renderer.misses == 4  # 텔레그램 HTML과 JSON 조각, Embed와 JSON 조각
+        bodies = [json.loads(c[1]["data"]) for c in mock_post.call_args_list]
+        assert len(bodies) == 10
+        assert sorted(b["chat_id"] for b in bodies if "chat_id" in b) == [str(i) for i in range(5)]
+        assert len({json.dumps(b["embeds"]) for b in bodies if "embeds" in b}) == 1
+
+    def test_notifier_default_renderer_output(self):
+        assert TelegramNotifier("tok", "1").renderer.telegram(SAMPLE_ANN).startswith("🏠 <b>LH 임대주택 새 공고</b>")
+        assert DiscordNotifier("https://hook")._build_embed(SAMPLE_ANN)["title"] == "🏠 부산강서 국민임대"
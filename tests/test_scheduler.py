@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Scheduler 단위 테스트 (가짜 monotonic/벽시계)"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lh_monitor import LHMonitor, Scheduler
+
+
+class FakeClock:
+    """monotonic과 벽시계를 따로 움직일 수 있는 시계. sleep은 두 시계를 함께 진행한다."""
+
+    def __init__(self):
+        self.mono = 1000.0
+        self.wall = 1_780_000_000.0
+
+    def monotonic(self):
+        return self.mono
+
+    def time(self):
+        return self.wall
+
+    def advance(self, seconds):
+        self.mono += seconds
+        self.wall += seconds
+
+    def suspend(self, seconds):
+        """절전: 벽시계만 흐르고 monotonic은 멈춘다."""
+        self.wall += seconds
+
+
+class FakeDatetime(datetime):
+    """datetime.now()가 FakeClock의 벽시계를 따른다."""
+
+    clock = None
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fromtimestamp(cls.clock.wall, tz)
+
+
+@pytest.fixture
+def clock():
+    c = FakeClock()
+    with patch("lh_monitor.time.monotonic", c.monotonic), patch("lh_monitor.time.time", c.time):
+        yield c
+
+
+def _drive(scheduler, clock, until):
+    """run()처럼 run_pending과 sleep을 반복하되 until(monotonic)에서 멈춘다."""
+    while clock.mono < until:
+        wait = min(scheduler.run_pending(), Scheduler.MAX_SLEEP)
+        clock.advance(min(max(wait, 0.001), until - clock.mono))
+
+
+class TestScheduler:
+    def test_fixed_rate_does_not_drift(self, clock):
+        """작업 시간이 걸려도 다음 실행은 직전 예정 시각 + 간격이다."""
+        starts = []
+
+        def job():
+            starts.append(clock.mono)
+            clock.advance(10)
+
+        s = Scheduler()
+        s.every("poll", job, 60)
+        _drive(s, clock, 1000 + 60 * 4 + 1)
+        assert starts == [1060, 1120, 1180, 1240]
+
+    def test_callable_interval_and_first(self, clock):
+        starts = []
+        s = Scheduler()
+        s.every("poll", lambda: starts.append(clock.mono), lambda: 100, first=0)
+        _drive(s, clock, 1250)
+        assert starts == [1000, 1100, 1200]
+
+    def test_missed_runs_coalesced(self, clock):
+        """간격보다 오래 걸린 작업 뒤에는 놓친 회차를 몰아서 실행하지 않고 원래 주기에 맞춘다."""
+        starts = []
+
+        def job():
+            starts.append(clock.mono)
+            if len(starts) == 1:
+                clock.advance(250)
+
+        s = Scheduler()
+        s.every("poll", job, 60)
+        _drive(s, clock, 1421)
+        assert starts == [1060, 1360, 1420]
+
+    def test_jobs_run_independently(self, clock):
+        calls = []
+        s = Scheduler()
+        s.every("poll", lambda: calls.append("poll"), 100)
+        s.every("flush", lambda: calls.append("flush"), 30)
+        _drive(s, clock, 1101)
+        assert calls.count("flush") == 3
+        assert calls.count("poll") == 1
+
+    def test_failure_retries_after_delay(self, clock):
+        starts = []
+
+        def job():
+            starts.append(clock.mono)
+            if len(starts) == 1:
+                raise RuntimeError("boom")
+
+        s = Scheduler()
+        s.every("poll", job, 600, first=0, retry=60)
+        _drive(s, clock, 1100)
+        assert starts == [1000, 1060]
+
+    def test_catch_up_after_suspend(self, clock):
+        """절전으로 벽시계만 흐르면 놓친 작업을 복귀 직후 한 번 실행한다."""
+        starts = []
+        s = Scheduler()
+        s.every("poll", lambda: starts.append(clock.mono), 1800)
+        clock.advance(100)
+        s.run_pending()
+        clock.suspend(7200)
+        s.run_pending()
+        assert starts == [1100]
+
+    def test_wall_clock_job_caught_up_after_suspend(self, clock):
+        """21시를 절전 중에 지나쳤으면 복귀 직후 실행한다."""
+        ran = []
+        now = datetime.now()
+        target = now + timedelta(minutes=10)
+
+        def next_time(after):
+            return target if after < target else target + timedelta(days=1)
+
+        s = Scheduler()
+        s.at("summary", lambda: ran.append(True), next_time)
+        clock.suspend(3600)
+        with patch("lh_monitor.datetime") as dt:
+            dt.now.return_value = now + timedelta(hours=1)
+            s.run_pending()
+        assert ran == [True]
+
+
+class TestDailySummarySchedule:
+    def test_catch_up_across_midnight_keeps_next_summary(self, clock, tmp_path):
+        """20:50에 잠들어 다음 날 08:00에 깨면 전날 요약을 보내고, 그날 21시 요약도 그대로 보낸다."""
+        env = {"TELEGRAM_BOT_TOKEN": "tok", "TELEGRAM_CHAT_ID": "123", "DATA_DIR": str(tmp_path)}
+        with patch("lh_monitor.os.getenv", side_effect=lambda key, default="": env.get(key, default)):
+            mon = LHMonitor()
+        mon.check_once = MagicMock()
+        mon.flush_state = MagicMock()
+        mon._notify = MagicMock()
+        clock.wall = datetime(2026, 6, 1, 20, 50).timestamp()
+        FakeDatetime.clock = clock
+        with patch("lh_monitor.datetime", FakeDatetime):
+            s = mon.build_scheduler()
+            s.run_pending()
+            clock.suspend((datetime(2026, 6, 2, 8, 0) - datetime(2026, 6, 1, 20, 50)).total_seconds())
+            s.run_pending()
+            assert mon._notify.call_count == 1
+            assert mon.daily_sent_date == "2026-06-01"
+            _drive(s, clock, clock.mono + 13 * 3600 + 1)
+        assert mon._notify.call_count == 2
+        assert mon.daily_sent_date == "2026-06-02"
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""SourceHealth 단위 테스트 및 LHCrawler 서킷 브레이커 연동 테스트"""
+
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from lh_monitor import SourceHealth, LHCrawler
+
+
+class TestRecord:
+    def test_success_rate_and_percentiles(self):
+        h = SourceHealth()
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            h.record("json", True, latency)
+        h.record("json", False, 5.0)
+        assert h.success_rate("json") == 0.8
+        assert h.percentile("json", 0.5) == 0.3
+        assert h.percentile("json", 0.95) == 5.0
+
+    def test_unknown_source_defaults(self):
+        """기록이 없는 소스는 성공률 100%, 지연시간 0으로 본다."""
+        h = SourceHealth()
+        assert h.success_rate("api") == 1.0
+        assert h.percentile("api", 0.95) == 0.0
+
+    def test_window_is_bounded(self):
+        h = SourceHealth()
+        for _ in range(SourceHealth.WINDOW + 10):
+            h.record("html", True, 0.1)
+        assert len(h.data["html"]["outcomes"]) == SourceHealth.WINDOW
+
+
+class TestCircuit:
+    def test_opens_after_threshold(self):
+        h = SourceHealth(failure_threshold=3, cooldown=600)
+        h.record("api", False, 1.0)
+        h.record("api", False, 1.0)
+        assert h.is_open("api") is False
+        h.record("api", False, 1.0)
+        assert h.is_open("api") is True
+
+    def test_closes_after_cooldown(self):
+        h = SourceHealth(failure_threshold=1, cooldown=600)
+        with patch("lh_monitor.time.time", return_value=1000.0):
+            h.record("api", False, 1.0)
+        with patch("lh_monitor.time.time", return_value=1599.0):
+            assert h.is_open("api") is True
+        with patch("lh_monitor.time.time", return_value=1601.0):
+            assert h.is_open("api") is False
+
+    def test_success_resets(self):
+        h = SourceHealth(failure_threshold=1)
+        h.record("api", False, 1.0)
+        h.record("api", True, 0.2)
+        assert h.is_open("api") is False
+        assert h.data["api"]["consecutive_failures"] == 0
+
+
+class TestOrder:
+    def test_default_priority(self):
+        assert SourceHealth().order(["api", "json", "html"]) == ["api", "json", "html"]
+
+    def test_open_circuit_last(self):
+        h = SourceHealth(failure_threshold=1)
+        h.record("api", False, 30.0)
+        assert h.order(["api", "json", "html"]) == ["json", "html", "api"]
+
+    def test_lower_success_rate_later(self):
+        h = SourceHealth(failure_threshold=99)
+        h.record("json", True, 0.1)
+        h.record("json", False, 0.1)
+        assert h.order(["json", "html"]) == ["html", "json"]
+
+    def test_available_falls_back_to_all_when_all_open(self):
+        h = SourceHealth(failure_threshold=1)
+        h.record("json", False, 1.0)
+        h.record("html", False, 1.0)
+        assert h.available(["json", "html"]) == ["json", "html"]
+
+
+class TestPersistence:
+    def test_save_and_reload(self, tmp_path):
+        fp = str(tmp_path / "health.json")
+        h = SourceHealth(fp, failure_threshold=1)
+        h.record("api", False, 2.0)
+        h.save()
+        h2 = SourceHealth(fp)
+        assert h2.is_open("api") is True
+        assert h2.data["api"]["latencies"] == [2.0]
+
+    def test_corrupted_file_falls_back(self, tmp_path):
+        fp = tmp_path / "health.json"
+        fp.write_text("{broken")
+        h = SourceHealth(str(fp))
+        assert h.success_rate("api") == 1.0
+
+
+class TestCrawlerIntegration:
+    @patch.object(requests.Session, "get")
+    def test_open_api_circuit_skips_request(self, mock_get):
+        """API 서킷이 열려 있으면 HTTP 요청을 하지 않는다."""
+        h = SourceHealth(failure_threshold=1)
+        h.record("api", False, 30.0)
+        assert LHCrawler(health=h).fetch_api("key") == []
+        mock_get.assert_not_called()
+
+    @patch.object(requests.Session, "get")
+    def test_api_failure_recorded(self, mock_get):
+        mock_get.side_effect = requests.RequestException("timeout")
+        c = LHCrawler()
+        c.fetch_api("key")
+        assert c.health.data["api"]["consecutive_failures"] == 1
+
+    def test_fetch_web_tries_healthier_source_first(self):
+        """JSON 서킷이 열려 있으면 HTML부터 시도하고 JSON은 호출하지 않는다."""
+        h = SourceHealth(failure_threshold=1)
+        h.record("json", False, 30.0)
+        c = LHCrawler(health=h)
+        c._fetch_json_api = MagicMock(return_value=[{"id": "json"}])
+        c._fetch_html = MagicMock(return_value=[{"id": "html"}])
+        assert c.fetch_web() == [{"id": "html"}]
+        c._fetch_json_api.assert_not_called()
+        assert h.data["html"]["outcomes"] == [1]
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""SQLiteState / SQLiteStore / SQLiteSummary / import_json_state 단위 테스트"""
+
+import json
+from datetime import date
+
+from lh_monitor import SQLiteState, SQLiteStore, SQLiteSummary, import_json_state
+
+SAMPLE_ANN = {
+    "id": "12345",
+    "title": "부산강서 국민임대",
+    "rental_type": "국민임대",
+    "status": "접수중",
+    "reg_date": "2026-02-19",
+    "rcpt_begin": "2026-03-01",
+    "rcpt_end": "2026-03-15",
+    "url": "https://apply.lh.or.kr/detail/12345",
+}
+
+
+def _db(tmp_path):
+    return SQLiteState(str(tmp_path / "lh_monitor.db"))
+
+
+class TestSQLiteState:
+    def test_wal_mode(self, tmp_path):
+        db = _db(tmp_path)
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_tables_created(self, tmp_path):
+        db = _db(tmp_path)
+        names = {r[0] for r in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"seen", "summary", "checks", "meta"} <= names
+
+
+class TestSQLiteStore:
+    def test_initial_state(self, tmp_path):
+        store = SQLiteStore(_db(tmp_path))
+        assert store.data["last_check"] is None
+        assert store.is_new("a") is True
+
+    def test_mark_seen_not_written_until_commit(self, tmp_path):
+        """mark_seen은 메모리에만 쌓이고 update_check_time에서 한 번에 기록된다."""
+        db = _db(tmp_path)
+        store = SQLiteStore(db)
+        store.mark_seen("a")
+        store.mark_seen("b")
+        assert store.is_new("a") is False
+        assert db.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 0
+        store.update_check_time()
+        assert db.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 2
+
+    def test_reload(self, tmp_path):
+        path = str(tmp_path / "lh_monitor.db")
+        store = SQLiteStore(SQLiteState(path))
+        store.mark_seen("a")
+        store.update_frontier(["x"])
+        store.update_check_time()
+        store2 = SQLiteStore(SQLiteState(path))
+        assert store2.is_new("a") is False
+        assert store2.is_known("x") is True
+        assert store2.data["last_check"] == store.data["last_check"]
+
+    def test_check_history_recorded(self, tmp_path):
+        db = _db(tmp_path)
+        store = SQLiteStore(db)
+        store.mark_seen("a")
+        store.update_check_time()
+        store.update_check_time()
+        assert [n for _, n in db.check_history()] == [1, 0]
+
+    def test_retention_deletes_old_rows(self, tmp_path):
+        db = _db(tmp_path)
+        with db.conn:
+            db.conn.execute("INSERT INTO seen VALUES ('old', '2000-01-01T00:00:00')")
+        store = SQLiteStore(db, retention_days=30)
+        store.update_check_time()
+        assert store.is_new("old") is True
+        assert db.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 0
+
+
+class TestSQLiteSummary:
+    def test_add_buffers_until_flush(self, tmp_path):
+        db = _db(tmp_path)
+        summary = SQLiteSummary(db)
+        summary.add(SAMPLE_ANN)
+        assert db.conn.execute("SELECT COUNT(*) FROM summary").fetchone()[0] == 0
+        summary.flush()
+        assert db.conn.execute("SELECT COUNT(*) FROM summary").fetchone()[0] == 1
+
+    def test_reload_today(self, tmp_path):
+        path = str(tmp_path / "lh_monitor.db")
+        summary = SQLiteSummary(SQLiteState(path))
+        summary.add(SAMPLE_ANN)
+        summary.add({**SAMPLE_ANN, "id": "2"})
+        summary.flush()
+        reloaded = SQLiteSummary(SQLiteState(path))
+        assert reloaded.data["date"] == date.today().isoformat()
+        assert [a["id"] for a in reloaded.data["announcements"]] == ["12345", "2"]
+        assert reloaded.get_tg_msg() == summary.get_tg_msg()
+
+    def test_date_change_resets(self, tmp_path):
+        summary = SQLiteSummary(_db(tmp_path))
+        summary.data = {"date": "2020-01-01", "announcements": [{"id": "old"}]}
+        summary.add(SAMPLE_ANN)
+        assert [a["id"] for a in summary.data["announcements"]] == ["12345"]
+
+
+class TestImportJsonState:
+    def test_imports_once(self, tmp_path):
+        seen = tmp_path / "seen.json"
+        seen.write_text(json.dumps({"seen_ids": ["a", "b"], "last_check": "2026-01-01T00:00:00"}))
+        daily = tmp_path / "daily_summary.json"
+        daily.write_text(json.dumps({"date": "2026-01-01", "announcements": [SAMPLE_ANN]}))
+        db = _db(tmp_path)
+        assert import_json_state(db, str(seen), str(daily)) == (2, 1)
+        assert import_json_state(db, str(seen), str(daily)) == (0, 0)
+        store = SQLiteStore(db)
+        assert store.is_new("a") is False
+        assert store.data["last_check"] == "2026-01-01T00:00:00"
+        assert SQLiteSummary(db).data["announcements"][0]["id"] == "12345"
+
+    def test_missing_files(self, tmp_path):
+        db = _db(tmp_path)
+        assert import_json_state(db, str(tmp_path / "none.json"), str(tmp_path / "none2.json")) == (0, 0)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""구독 필터(KeywordAutomaton, SubscriptionMatcher) 단위 테스트"""
+
+import json
+import random
+from unittest.mock import patch, MagicMock
+
+from lh_monitor import (
+    Announcement, KeywordAutomaton, LHMonitor, Subscription, SubscriptionMatcher, load_subscriptions,
+)
+
+
+def _ann(id, title, rental_type="국민임대", status="접수중"):
+    return Announcement(id=id, title=title, rental_type=rental_type, status=status)
+
+
+class TestKeywordAutomaton:
+    def test_overlapping_and_suffix_patterns(self):
+        ac = KeywordAutomaton(["he", "she", "his", "hers"])
+        found = {ac.patterns[i] for i in ac.search("ushers")}
+        assert found == {"he", "she", "hers"}
+
+    def test_case_insensitive_and_duplicates(self):
+        ac = KeywordAutomaton(["LH", "lh", "", "부산"])
+        assert len(ac.patterns) == 2
+        assert {ac.patterns[i] for i in ac.search("Lh 부산강서")} == {"lh", "부산"}
+
+    def test_matches_naive_search(self):
+        rng = random.Random(7)
+        alphabet = "부산강서행복주택ab"
+        patterns = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)]
+        ac = KeywordAutomaton(patterns)
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            assert {ac.patterns[i] for i in ac.search(text)} == {p for p in ac.patterns if p in text}
+
+
+class TestSubscriptionMatcher:
+    def test_rules_combine(self):
+        subs = [
+            Subscription("busan", regions=["부산"]),
+            Subscription("busan-happy", keywords=["행복주택"], regions=["부산", "김해"]),
+            Subscription("open-national", rental_types=["국민임대"], statuses=["접수중"]),
+            Subscription("seoul", regions=["서울"]),
+        ]
+        m = SubscriptionMatcher(subs)
+        names = lambda a: [s.name for s in m.match(a)]  # noqa: E731
+        assert names(_ann("1", "부산 행복주택", rental_type="행복주택")) == ["busan", "busan-happy"]
+        assert names(_ann("2", "김해 행복주택", rental_type="행복주택")) == ["busan-happy"]
+        assert names(_ann("3", "부산 국민임대")) == ["busan", "open-national"]
+        assert names(_ann("4", "대구 국민임대", status="접수마감")) == []
+
+    def test_empty_subscription_matches_everything(self):
+        m = SubscriptionMatcher([Subscription("all")])
+        assert len(m.select([_ann("1", "아무 공고"), _ann("2", "")])) == 2
+
+    def test_fan_out_by_subscriber(self):
+        m = SubscriptionMatcher([Subscription(f"user{i}", regions=[r]) for i, r in enumerate(["부산", "서울", "부산"])])
+        anns = [_ann("1", "부산 A"), _ann("2", "서울 B"), _ann("3", "대전 C")]
+        routed = m.fan_out(anns)
+        assert {k: [a.id for a in v] for k, v in routed.items()} == {"user0": ["1"], "user1": ["2"], "user2": ["1"]}
+
+    def test_load_subscriptions(self, tmp_path):
+        path = tmp_path / "subscriptions.json"
+        path.write_text(json.dumps([{"name": "a", "regions": ["부산"], "statuses": ["접수중"]}]), encoding="utf-8")
+        (sub,) = load_subscriptions(str(path))
+        assert sub.name == "a"
+        assert sub.regions == ("부산",)
+        assert sub.statuses == frozenset({"접수중"})
+
+
+class TestMonitorSubscriptions:
+    def _build(self, tmp_path, **env):
+        env = {"DATA_DIR": str(tmp_path), "TELEGRAM_BOT_TOKEN": "tok", "TELEGRAM_CHAT_ID": "1", **env}
+        with patch("lh_monitor.os.getenv") as mg:
+            mg.side_effect = lambda key, default="": env.get(key, default)
+            return LHMonitor()
+
+    def test_region_filter_env(self, tmp_path):
+        mon = self._build(tmp_path, REGION_FILTER="서울, 경기")
+        mon.crawler.fetch_web = MagicMock(return_value=[
+            {"id": "1", "title": "서울 행복주택"}, {"id": "2", "title": "부산 국민임대"},
+            {"id": "3", "title": "경기 영구임대"},
+        ])
+        mon.tg.send = MagicMock()
+        assert [a.id for a in mon.check_once()] == ["1", "3"]
+        assert mon.store.is_new("2")
+
+    def test_subscriptions_file_routes_matches(self, tmp_path):
+        path = tmp_path / "subscriptions.json"
+        path.write_text(json.dumps([
+            {"name": "busan", "regions": ["부산"]},
+            {"name": "happy", "keywords": ["행복주택"]},
+        ]), encoding="utf-8")
+        mon = self._build(tmp_path, SUBSCRIPTIONS_FILE=str(path))
+        mon.crawler.fetch_web = MagicMock(return_value=[
+            {"id": "1", "title": "서울 행복주택"}, {"id": "2", "title": "부산 국민임대"},
+            {"id": "3", "title": "대전 영구임대"},
+        ])
+        mon.tg.send = MagicMock()
+        assert [a.id for a in mon.check_once()] == ["1", "2"]
+        assert {k: [a.id for a in v] for k, v in mon.last_matches.items()} == {"happy": ["1"], "busan": ["2"]}
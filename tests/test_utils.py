@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-"""normalize_date() 및 RENTAL_TYPES 단위 테스트"""
+"""normalize_date(), FieldMap 및 RENTAL_TYPES 단위 테스트"""
 
-from lh_monitor import normalize_date, RENTAL_TYPES
+from lh_monitor import normalize_date, FieldMap, RENTAL_TYPES
 
 
 class TestNormalizeDate:
@@ -27,6 +27,31 @@ class TestNormalizeDate:
         """점 구분 → YYYY-MM-DD"""
         assert normalize_date("2025.02.19") == "2025-02-19"
 
+    def test_cached(self):
+        """같은 입력은 캐시에서 반환"""
+        normalize_date("2025.03.01")
+        hits = normalize_date.cache_info().hits
+        assert normalize_date("2025.03.01") == "2025-03-01"
+        assert normalize_date.cache_info().hits == hits + 1
+
+
+class TestFieldMap:
+    """FieldMap 표기법 판별과 getter 검증"""
+
+    FIELDS = FieldMap(("id", "ccr"), ("panId", "ccrCd"), ("PAN_ID", "CCR_CD"), defaults={"ccr": "03"})
+
+    def test_resolves_upper_snake(self):
+        get = self.FIELDS.resolve({"PAN_ID": "A", "CCR_CD": "01"})
+        assert get({"PAN_ID": "B", "CCR_CD": "02"}) == ["B", "02"]
+
+    def test_resolves_camel(self):
+        get = self.FIELDS.resolve({"panId": "A"})
+        assert get({"panId": "B", "PAN_ID": "X"}) == ["B", "03"]
+
+    def test_empty_value_uses_default(self):
+        get = self.FIELDS.resolve({"panId": "A"})
+        assert get({"panId": None, "ccrCd": ""}) == ["", "03"]
+
 
 class TestRentalTypes:
     """RENTAL_TYPES 상수 검증"""